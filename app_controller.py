@@ -1,16 +1,51 @@
 import json
 import os
-import re
 from functools import reduce
 import operator
-from PySide6.QtCore import QObject, Signal, QTimer
+import numpy as np
+from PySide6.QtCore import QObject, Signal
 
 from models.LogTableModel import LogTableModel
+from utils.column_projection import take_columns
 from utils.event_matcher import EventMatcher
+from utils.export_writer import EXPORT_BATCH_ROWS
+from utils.filter_cache import FilterResultCache
+from utils.regex_cache import regex_match_mask, regex_search_group
+from utils.render_scheduler import MAX_INTERVAL_MS, MIN_INTERVAL_MS, RenderScheduler
+from utils.ring_buffer import ColumnarRingBuffer
+from utils.query_language import ANY_COLUMN, check_columns, resolve_column
+from utils.search_text import SearchTextColumn, build_search_text, contains_mask
+from utils.sql_backend import (
+    ORACLE_DIALECT,
+    ROW_ID_COLUMN,
+    create_sql_backend,
+    has_regex_syntax,
+)
+from utils.query_operators import (
+    COMPARISON_OPERATORS,
+    LIST_OPERATOR,
+    RANGE_OPERATOR,
+    build_between_mask,
+    build_comparison_mask,
+    build_in_list_mask,
+    split_list_value,
+    split_range_value,
+    to_sql_param,
+)
+from utils.time_index import (
+    TimeIndex,
+    extract_timestamps,
+    from_epoch_ms,
+    is_time_rule,
+    time_rule_bounds,
+    to_epoch_ms,
+)
 
 FILTERS_FILE = "filters.json"
 SCENARIOS_DIR = "scenarios"
 QUERY_TEMPLATES_FILE = "query_templates.json"
+# Carrier 이동 시나리오에서 장비(from/to) 정보가 나타나는 컬럼
+CARRIER_MOVE_SEARCH_COLUMNS = ("DeviceID", "AsciiData", "TrackingID")
 
 
 class AppController(QObject):
@@ -27,7 +62,13 @@ class AppController(QObject):
         self.mode = app_mode
         self.connection_name = connection_name
         self.connection_info = connection_info
+        # 실시간 tailing 중에는 original_data를 원형 버퍼에 담고, DataFrame은 필요할 때 만듭니다.
+        self._realtime_buffer = None
         self.original_data = pd.DataFrame()
+        # original_data와 같은 행 순서의 NumericalTimeStamp 인덱스 (시간 구간 slicing용)
+        self.time_index = TimeIndex()
+        # 전체 컬럼 검색용 행별 텍스트 (처음 검색할 때 만들어지고 append/trim을 따라갑니다.)
+        self.search_text = SearchTextColumn()
         self.source_model = LogTableModel(max_rows=20000)
         self.fetch_thread = None
 
@@ -37,14 +78,37 @@ class AppController(QObject):
 
         self.last_query_conditions = None
         self.dashboard_dialog = None
+        # 현재 적용 중인 고급 필터. 실시간으로 들어오는 청크에도 증분 적용됩니다.
+        self.active_filter = None
+        # 필터된 뷰 스택. 각 항목은 original_data의 행 위치 배열이며, 맨 아래(빈 스택)는 전체 데이터입니다.
+        self.view_stack = []
 
         self.config = {}
         self._load_config()
 
+        # 데이터 버전: 로드/append 때마다 증가합니다. row_offset은 앞에서 잘려 나간 누적 행 수입니다.
+        self.data_version = 0
+        self._row_offset = 0
+        # 로그 행 고유 번호: 로드/append되는 행마다 단조 증가하는 번호를 붙이며, 다시 로드해도 재사용하지 않습니다.
+        # original_data의 위치 p에 있는 행의 번호는 _row_id_start + _row_offset + p 입니다.
+        self._row_id_start = 0
+        self._next_row_id = 0
+        self.filter_cache = FilterResultCache(
+            max_bytes=int(self.config.get("filter_cache_mb", 64)) * 1024 * 1024
+        )
+        # 선택적 내장 SQL 엔진 백엔드 (config의 query_backend: pandas/auto/duckdb/sqlite)
+        self.sql_backend = None
+        self._sql_backend_version = None
+
+        # 조회 스레드가 보낸 청크는 큐에 모아 두었다가, 화면 갱신 주기에 맞춰 한 번에 모델에 반영합니다.
+        # 반영에 걸리는 시간이 길어지면(수천 행/초 유입 등) 스케줄러가 갱신 간격을 늘립니다.
         self._update_queue = []
-        self._update_timer = QTimer(self)
-        self._update_timer.setInterval(200)
-        self._update_timer.timeout.connect(self._process_update_queue)
+        self.render_scheduler = RenderScheduler(
+            self._process_update_queue,
+            min_interval_ms=int(self.config.get("ui_min_interval_ms", MIN_INTERVAL_MS)),
+            max_interval_ms=int(self.config.get("ui_max_interval_ms", MAX_INTERVAL_MS)),
+            parent=self,
+        )
 
         self.highlighting_rules = self._load_highlighting_rules()
 
@@ -52,6 +116,9 @@ class AppController(QObject):
 
         self.MAX_INITIAL_CACHE_ROWS = 5000  # 초기 로딩 시 캐시에서 가져올 최대 행 수
 
+        # 접속 프로필별 Oracle 세션 풀 (실시간 모드에서 처음 조회할 때 만듭니다)
+        self.oracle_pools = None
+
         if self.mode == "realtime":
             if self.connection_name:
                 self.db_manager = DatabaseManager(self.connection_name)
@@ -81,6 +148,8 @@ class AppController(QObject):
 
         self.source_model.update_data(pd.DataFrame())
         self.original_data = pd.DataFrame()
+        self.time_index = TimeIndex()
+        self._on_data_replaced()
 
         # --- 모든 조회 조건을 OracleFetcherThread에 전달 ---
         templates = self.load_query_templates()
@@ -89,6 +158,7 @@ class AppController(QObject):
             query_conditions,
             templates,  # 템플릿 전체 내용 전달
             parent=self,
+            pools=self.get_oracle_pools(),
         )
 
         self.fetch_thread.data_fetched.connect(self.append_data_chunk)
@@ -99,7 +169,6 @@ class AppController(QObject):
         if self.dashboard_dialog and self.dashboard_dialog.isVisible():
             self.dashboard_dialog.start_updates()
 
-        self._update_timer.start()
         self.fetch_thread.start()
 
     def on_fetch_finished(self):
@@ -108,10 +177,9 @@ class AppController(QObject):
         self._is_paused = False
 
         if self._update_queue:
-            self._process_update_queue()
-
-        if self._update_timer.isActive():
-            self._update_timer.stop()
+            self.render_scheduler.flush_now()
+        else:
+            self.render_scheduler.cancel()
 
         if self.dashboard_dialog and self.dashboard_dialog.isVisible():
             self.dashboard_dialog.stop_updates()
@@ -132,6 +200,26 @@ class AppController(QObject):
             }
             self.db_manager.add_fetch_history(start_time, end_time, filters)
 
+    def get_oracle_pools(self):
+        """
+        조회, 재조회, 실시간 추적이 함께 쓰는 Oracle 세션 풀 관리자를 반환합니다.
+        연결 테스트와 같은 공유 관리자를 사용하며, config의 oracle_pool 설정(min/max/increment 등)을 적용합니다.
+        """
+        if self.oracle_pools is None:
+            from utils.oracle_pool import shared_pool_manager
+
+            self.oracle_pools = shared_pool_manager()
+            self.oracle_pools.configure(self.config.get("oracle_pool"))
+        return self.oracle_pools
+
+    def close_oracle_pools(self):
+        """열려 있는 Oracle 세션을 모두 닫습니다. (프로그램 종료 시)"""
+        if self.fetch_thread and self.fetch_thread.isRunning():
+            self.fetch_thread.stop()
+            self.fetch_thread.wait(3000)
+        if self.oracle_pools is not None:
+            self.oracle_pools.close_all()
+
     def cancel_db_fetch(self):
         if self.fetch_thread and self.fetch_thread.isRunning():
             self.fetch_thread.stop()
@@ -221,6 +309,7 @@ class AppController(QObject):
             limit=self.MAX_INITIAL_CACHE_ROWS
         )
 
+        self.active_filter = None
         if not cached_data.empty:
             self.original_data = cached_data
             if (
@@ -232,8 +321,11 @@ class AppController(QObject):
                     format="%d-%b-%Y %H:%M:%S:%f",
                     errors="coerce",
                 )
+            self._sort_by_time()
         else:
             self.original_data = pd.DataFrame()
+            self.time_index = TimeIndex()
+        self._on_data_replaced()
 
         self.update_model_data(self.original_data)
 
@@ -246,6 +338,7 @@ class AppController(QObject):
             if not parsed_data:
                 return False
             self.original_data = pd.DataFrame(parsed_data)
+            self.active_filter = None
 
             if "SystemDate" in self.original_data.columns:
                 self.original_data["SystemDate_dt"] = pd.to_datetime(
@@ -253,15 +346,102 @@ class AppController(QObject):
                     format="%d-%b-%Y %H:%M:%S:%f",
                     errors="coerce",
                 )
+            self._sort_by_time()
+            self._on_data_replaced()
 
             self.update_model_data(self.original_data)
             return not self.original_data.empty
         except Exception as e:
             print(f"Error loading or parsing file: {e}")
             self.original_data = pd.DataFrame()
+            self.time_index = TimeIndex()
+            self._on_data_replaced()
             self.update_model_data(self.original_data)
             return False
 
+    @property
+    def original_data(self):
+        """
+        전체 원본 DataFrame. 실시간 tailing 중에는 원형 버퍼의 내용을 처음 요청될 때 DataFrame으로 만들고,
+        다음 append까지 재사용합니다.
+        """
+        if self._original_frame is None and self._realtime_buffer is not None:
+            self._original_frame = self._realtime_buffer.to_frame()
+        return self._original_frame
+
+    @original_data.setter
+    def original_data(self, dataframe):
+        self._realtime_buffer = None
+        self._original_frame = dataframe
+
+    def _original_row_count(self):
+        if self._realtime_buffer is not None:
+            return len(self._realtime_buffer)
+        return len(self._original_frame)
+
+    def _original_tail(self, start):
+        """original_data의 start 위치부터 끝까지의 행들. 원형 버퍼에서는 해당 행만 꺼냅니다."""
+        if self._realtime_buffer is not None:
+            return self._realtime_buffer.to_frame(
+                np.arange(start, len(self._realtime_buffer), dtype=np.int64)
+            )
+        return self._original_frame.iloc[start:]
+
+    def _on_data_replaced(self):
+        """original_data가 통째로 바뀌었을 때 데이터 버전을 올리고 필터 결과 캐시를 비웁니다."""
+        self.data_version += 1
+        self._row_offset = 0
+        self._row_id_start = self._next_row_id
+        self._next_row_id += self._original_row_count()
+        self.filter_cache.clear()
+        self.search_text.invalidate()
+        self.view_stack.clear()
+        if self.sql_backend is not None:
+            self.sql_backend.reset()
+        self._sql_backend_version = None
+
+    def row_ids(self, labels=None):
+        """
+        original_data 행 라벨(= 행 위치, None이면 전체 행)의 고유 번호 배열을 반환합니다.
+        고유 번호는 필터/정렬/실시간 버퍼의 밀려남과 관계없이 그 로그를 가리킵니다.
+        """
+        if labels is None:
+            labels = np.arange(self._original_row_count(), dtype=np.uint64)
+        return np.uint64(self._row_id_start + self._row_offset) + np.asarray(
+            labels, dtype=np.uint64
+        )
+
+    def _sort_by_time(self):
+        """original_data를 NumericalTimeStamp 순으로 (안정) 정렬하고 시간 인덱스를 다시 만듭니다."""
+        timestamps = extract_timestamps(self.original_data)
+        order = np.argsort(timestamps, kind="stable")
+        if not np.array_equal(order, np.arange(len(order))):
+            self.original_data = self.original_data.iloc[order].reset_index(drop=True)
+            timestamps = timestamps[order]
+        self.time_index = TimeIndex(timestamps)
+
+    def slice_time_range(self, start=None, end=None, df=None):
+        """
+        [start, end] 구간의 로그를 반환합니다. start/end는 epoch ms 또는 날짜/시간 문자열입니다.
+        original_data에 대해서는 시간 인덱스의 searchsorted로 구간을 찾아 slice를 돌려줍니다.
+        """
+        if df is None:
+            df = self.original_data
+        index = (
+            self.time_index
+            if df is self.original_data and len(self.time_index) == len(df)
+            else TimeIndex.from_dataframe(df)
+        )
+        return df.iloc[index.positions(to_epoch_ms(start), to_epoch_ms(end))]
+
+    def get_time_bounds(self):
+        """로드된 로그의 (최초, 최종) 시간을 벽시계 시간(Timestamp)으로 반환합니다. 없으면 None."""
+        positions = self.time_index.positions()
+        valid = self.time_index.timestamps[positions]
+        if len(valid) == 0:
+            return None
+        return from_epoch_ms(valid.min()), from_epoch_ms(valid.max())
+
     def _get_profile(self):
         return {
             "column_mapping": {
@@ -276,13 +456,17 @@ class AppController(QObject):
         }
 
     def update_model_data(self, dataframe):
-        self.source_model.update_data(dataframe)
+        if dataframe is self.original_data:
+            self.source_model.set_view(dataframe, row_ids=self.row_ids())
+        else:
+            self.source_model.update_data(dataframe)
         self.source_model.set_highlighting_rules(self.highlighting_rules)
         self.model_updated.emit(self.source_model)
 
     def append_data_chunk(self, df_chunk):
         if not df_chunk.empty:
             self._update_queue.append(df_chunk)
+            self.render_scheduler.request()
 
     def run_analysis_script(self, script_code, dataframe):
         import pandas as pd
@@ -297,8 +481,16 @@ class AppController(QObject):
             print(f"Script execution error: {e}")
         return result_obj
 
+    def _show_view(self, rows=None):
+        """original_data를 복사하지 않고, 주어진 행 위치들(None이면 전체)만 모델에 표시합니다."""
+        self.source_model.set_view(self.original_data, rows, row_ids=self.row_ids())
+        self.source_model.set_highlighting_rules(self.highlighting_rules)
+        self.model_updated.emit(self.source_model)
+
     def clear_advanced_filter(self):
-        self.update_model_data(self.original_data)
+        self.active_filter = None
+        self.view_stack.clear()
+        self._show_view()
 
     def apply_advanced_filter(self, query_data):
         if not query_data or not query_data.get("rules"):
@@ -308,12 +500,294 @@ class AppController(QObject):
         if self.original_data.empty:
             return
 
+        # 없는 컬럼을 가리키는 필터는 뷰를 바꾸기 전에 QuerySyntaxError로 알립니다.
+        check_columns(query_data, self.original_data.columns)
         try:
-            final_mask = self._build_mask_recursive(query_data, self.original_data)
-            self.update_model_data(self.original_data[final_mask])
+            positions = self._get_filter_positions(query_data)
+            self.active_filter = query_data
+            self.view_stack.append(
+                {
+                    "filter": query_data,
+                    "rows": positions,
+                    "data_version": self.data_version,
+                }
+            )
+            self._show_view(positions)
         except Exception as e:
             print(f"Error applying filter: {e}")
-            self.update_model_data(self.original_data)
+            self.active_filter = None
+            self.view_stack.clear()
+            self._show_view()
+
+    def can_go_back(self):
+        return bool(self.view_stack)
+
+    def go_back_view(self):
+        """
+        직전 뷰로 돌아갑니다. 스택에 보관된 행 위치 배열을 그대로 다시 표시하므로 복사가 없습니다.
+        실시간 append로 데이터가 바뀐 경우에만 필터 결과 캐시를 통해 위치를 갱신합니다.
+        """
+        if not self.view_stack:
+            return False
+        self.view_stack.pop()
+        if not self.view_stack:
+            self.active_filter = None
+            self._show_view()
+            return True
+
+        view = self.view_stack[-1]
+        if view["data_version"] != self.data_version:
+            view["rows"] = self._get_filter_positions(view["filter"])
+            view["data_version"] = self.data_version
+        self.active_filter = view["filter"]
+        self._show_view(view["rows"])
+        return True
+
+    def _trim_view_stack(self, evicted):
+        """원본 앞쪽에서 evicted개 행이 밀려났을 때, 뷰 스택의 행 위치에서 그 행들을 빼고 나머지를 앞으로 당깁니다."""
+        for view in self.view_stack:
+            rows = view["rows"]
+            view["rows"] = rows[rows >= evicted] - evicted
+
+    def _get_filter_positions(self, query_data):
+        """
+        필터와 일치하는 original_data의 행 위치 배열을 반환합니다.
+        같은 쿼리를 다시 적용하면 캐시된 결과를 쓰고, 그 사이 추가된 행만 새로 평가합니다.
+        """
+        key = self.filter_cache.make_key(query_data)
+        row_end = self._row_offset + self._original_row_count()
+
+        def evaluate_tail(start):
+            tail = self._original_tail(start)
+            mask = self._build_mask_recursive(query_data, tail)
+            return np.flatnonzero(mask.to_numpy()) + start
+
+        positions = self.filter_cache.get(
+            key, self._row_offset, row_end, self.data_version, evaluate_tail
+        )
+        if positions is None:
+            positions = self._sql_filter_positions(query_data)
+            if positions is None:
+                df, narrowed_query = self._narrow_by_time_rules(query_data)
+                final_mask = self._build_mask_recursive(narrowed_query, df)
+                positions = self.original_data.index.get_indexer(df.index[final_mask])
+            # 내장 엔진의 결과도 같은 데이터 버전 키로 캐시하여, 같은 필터를 다시 조회하지 않습니다.
+            self.filter_cache.put(
+                key, positions, self._row_offset, row_end, self.data_version
+            )
+        return positions
+
+    def _get_sql_backend(self):
+        """
+        설정(query_backend)에 따라 original_data가 등록된 내장 SQL 엔진 백엔드를 반환합니다.
+        'pandas'(기본값)이면 None, 'auto'이면 행 수가 sql_backend_min_rows 이상일 때만 사용합니다.
+        """
+        choice = self.config.get("query_backend", "pandas")
+        if choice == "pandas" or self.original_data.empty:
+            return None
+        min_rows = int(self.config.get("sql_backend_min_rows", 2_000_000))
+        if choice == "auto" and len(self.original_data) < min_rows:
+            return None
+
+        if self.sql_backend is None:
+            self.sql_backend = create_sql_backend(choice)
+            if self.sql_backend is None:
+                return None
+        if self._sql_backend_version != self.data_version:
+            self.sql_backend.sync(
+                self.original_data, self._row_offset, self.time_index.timestamps
+            )
+            self._sql_backend_version = self.data_version
+        return self.sql_backend
+
+    def _sql_filter_positions(self, query_data):
+        """
+        내장 SQL 엔진으로 필터와 일치하는 original_data의 행 위치 배열을 구합니다.
+        백엔드를 쓰지 않거나 SQL로 평가할 수 없으면 None을 반환하며, 호출한 쪽은 pandas로 평가합니다.
+        """
+        backend = self._get_sql_backend()
+        if backend is None or not self._is_sql_translatable(query_data, backend.dialect):
+            return None
+        # 없는 컬럼은 엔진 오류로 pandas에 넘기지 않고, pandas 경로와 같은 QuerySyntaxError로 알립니다.
+        check_columns(query_data, self.original_data.columns)
+        where, params = self._parse_filter_group(query_data, dialect=backend.dialect)
+        if not where:
+            return None
+        try:
+            return backend.fetch_positions(where, params)
+        except Exception as e:
+            print(f"SQL backend ({backend.name}) query failed, using pandas: {e}")
+            return None
+
+    def _is_sql_translatable(self, query_data, dialect):
+        """_parse_filter_group이 pandas 마스크와 같은 의미로 변환할 수 있는 규칙만 있는지 확인합니다."""
+        for rule in query_data.get("rules", []):
+            if "logic" in rule:
+                if not self._is_sql_translatable(rule, dialect):
+                    return False
+                continue
+            op, value = rule.get("operator"), rule.get("value")
+            if rule.get("column") == ANY_COLUMN:
+                return False
+            # 빈 값('')은 pandas에서는 평가되지만 SQL 변환에서는 건너뛰므로 pandas로 처리합니다.
+            if value is not None and not value:
+                return False
+            if is_time_rule(rule):
+                continue
+            # 정규식으로 찾아야 하는 포함 검색을 INSTR(리터럴)로만 옮길 수 있는 방언이면 pandas로 처리합니다.
+            if (
+                op in ("Contains", "Does Not Contain")
+                and not rule.get("literal")
+                and has_regex_syntax(value)
+                and op not in dialect.get("pattern_ops", {})
+            ):
+                return False
+            if op not in dialect["ops"] and op not in COMPARISON_OPERATORS and op not in (
+                RANGE_OPERATOR,
+                LIST_OPERATOR,
+            ):
+                return False
+        return True
+
+    def iter_filtered_batches(self, query_data=None, columns=None, batch_size=EXPORT_BATCH_ROWS):
+        """
+        필터와 일치하는 original_data 행들을 batch_size 행씩 DataFrame으로 돌려주는 이터레이터를 만듭니다.
+        원본과 결과는 호출할 때 붙잡아 두므로 백그라운드 스레드(내보내기)에서 꺼내도 됩니다.
+        내장 엔진을 쓰면 문자열 컬럼은 엔진이 배치로 스트리밍하고, 나머지 컬럼(숫자/날짜/객체)은
+        엔진이 돌려준 행 번호로 원본에서 붙여 pandas로 만든 결과와 같은 값과 dtype을 유지합니다.
+        """
+        frame = self.original_data
+        columns = [c for c in (columns or frame.columns) if c in frame.columns]
+        row_offset = self._row_offset
+        has_rules = bool(query_data and query_data.get("rules"))
+
+        backend = self._get_sql_backend()
+        if backend is not None and (
+            not has_rules or self._is_sql_translatable(query_data, backend.dialect)
+        ):
+            streamed = [
+                c
+                for c in columns
+                if c in backend.columns and frame[c].dtype.kind == "O"
+            ]
+            where, params = self._parse_filter_group(query_data, dialect=backend.dialect)
+            try:
+                stream = backend.iter_batches(where, params, streamed, batch_size)
+            except Exception as e:
+                print(f"SQL backend ({backend.name}) stream failed, using pandas: {e}")
+            else:
+
+                def engine_batches():
+                    for batch in stream:
+                        positions = batch[ROW_ID_COLUMN].to_numpy(dtype=np.int64) - row_offset
+                        rest = take_columns(
+                            frame, positions, [c for c in columns if c not in streamed]
+                        )
+                        for col in streamed:
+                            rest[col] = batch[col].astype(frame[col].dtype).array
+                        yield rest[columns]
+
+                return engine_batches()
+
+        positions = (
+            self._get_filter_positions(query_data)
+            if has_rules
+            else np.arange(len(frame), dtype=np.int64)
+        )
+
+        def frame_batches():
+            for start in range(0, len(positions), batch_size):
+                yield take_columns(frame, positions[start : start + batch_size], columns)
+
+        return frame_batches()
+
+    def main_view_batches(self, columns=None):
+        """
+        메인 뷰(원본에 active_filter를 적용한 결과)를 내장 엔진에서 배치로 내보낼 이터레이터를 반환합니다.
+        엔진을 쓰지 않거나, 뷰가 실시간 원형 버퍼 위에 있어 원본과 행이 다를 수 있으면 None을 반환합니다.
+        """
+        if self._realtime_buffer is not None or self._get_sql_backend() is None:
+            return None
+        return self.iter_filtered_batches(self.active_filter, columns)
+
+    def count_by(self, column, query_data=None, limit=None):
+        """
+        column 값별 행 수를 많은 순으로 [column, 'count'] DataFrame으로 반환합니다. (필터 적용 가능, 결측 제외)
+        내장 엔진을 쓰면 GROUP BY로 세고, 아니면 pandas value_counts로 셉니다.
+        """
+        has_rules = bool(query_data and query_data.get("rules"))
+        if column not in self.original_data.columns:
+            import pandas as pd
+
+            return pd.DataFrame(columns=[column, "count"])
+
+        backend = self._get_sql_backend()
+        if (
+            backend is not None
+            and column in backend.columns
+            and (not has_rules or self._is_sql_translatable(query_data, backend.dialect))
+        ):
+            where, params = self._parse_filter_group(query_data, dialect=backend.dialect)
+            try:
+                return backend.count_by(column, where, params, limit)
+            except Exception as e:
+                print(f"SQL backend ({backend.name}) group-by failed, using pandas: {e}")
+
+        df = self.original_data
+        if has_rules:
+            df = df.iloc[self._get_filter_positions(query_data)]
+        counts = df[column].value_counts().reset_index()
+        return counts.head(limit) if limit else counts
+
+    def _filter_chunk(self, df_chunk):
+        """활성 필터를 새로 들어온 청크에만 적용하여, 필터된 뷰에 붙일 행들을 반환합니다."""
+        if not self.active_filter or df_chunk.empty:
+            return df_chunk
+        try:
+            return df_chunk[self._build_mask_recursive(self.active_filter, df_chunk)]
+        except Exception as e:
+            print(f"Error applying filter to new chunk: {e}")
+            return df_chunk
+
+    def _narrow_by_time_rules(self, query_data):
+        """
+        최상위 AND 그룹의 시간 규칙(Between/Before/After)을 시간 인덱스로 먼저 처리하여
+        (구간 slice, 남은 규칙) 을 반환합니다. 나머지 규칙은 좁혀진 구간에서만 평가됩니다.
+        """
+        df = self.original_data
+        if query_data.get("logic", "AND") != "AND":
+            return df, query_data
+
+        rules = query_data.get("rules", [])
+        time_rules = [
+            r
+            for r in rules
+            if "logic" not in r and r.get("value") is not None and is_time_rule(r)
+        ]
+        if not time_rules:
+            return df, query_data
+
+        start, end = None, None
+        for rule in time_rules:
+            rule_start, rule_end = time_rule_bounds(rule["operator"], rule["value"], rule.get("column"))
+            if rule_start is not None:
+                start = rule_start if start is None else max(start, rule_start)
+            if rule_end is not None:
+                end = rule_end if end is None else min(end, rule_end)
+
+        remaining = [r for r in rules if not any(r is t for t in time_rules)]
+        return self.slice_time_range(start, end), {**query_data, "rules": remaining}
+
+    def _build_time_mask(self, df, op, value, column=None):
+        import pandas as pd
+
+        index = (
+            self.time_index
+            if df is self.original_data and len(self.time_index) == len(df)
+            else TimeIndex.from_dataframe(df)
+        )
+        start, end = time_rule_bounds(op, value, column)
+        return pd.Series(index.mask(start, end), index=df.index)
 
     def _build_mask_recursive(self, query_group, df):
         import pandas as pd
@@ -327,20 +801,41 @@ class AppController(QObject):
                 if not all([column, op, value is not None]):
                     continue
 
-                if column not in df.columns:
+                if is_time_rule(rule):
+                    masks.append(self._build_time_mask(df, op, value, column))
                     continue
+                # 텍스트 쿼리의 필드 없는 검색어는 모든 컬럼에서 포함 여부를 봅니다.
+                if column == ANY_COLUMN:
+                    masks.append(self._build_any_column_mask(df, op, value))
+                    continue
+
+                # 컬럼 이름은 텍스트 쿼리와 같은 규칙으로 찾습니다. (없는 컬럼이면 QuerySyntaxError)
+                column = resolve_column(df.columns, column)
+                # 비교/범위/목록 연산자는 컬럼의 원래 dtype 위에서 벡터 연산으로 평가합니다.
+                if op in COMPARISON_OPERATORS:
+                    masks.append(build_comparison_mask(df[column], op, value))
+                    continue
+                if op == RANGE_OPERATOR:
+                    masks.append(build_between_mask(df[column], value))
+                    continue
+                if op == LIST_OPERATOR:
+                    masks.append(build_in_list_mask(df[column], value))
+                    continue
+
                 series = df[column].astype(str)
 
+                # literal 규칙(텍스트 쿼리의 *text*)은 값을 정규식이 아닌 글자 그대로 찾습니다.
+                regex = not rule.get("literal")
                 if op == "Contains":
-                    mask = series.str.contains(value, case=False, na=False)
+                    mask = series.str.contains(value, case=False, regex=regex, na=False)
                 elif op == "Does Not Contain":
-                    mask = ~series.str.contains(value, case=False, na=False)
+                    mask = ~series.str.contains(value, case=False, regex=regex, na=False)
                 elif op == "Equals":
                     mask = series.str.lower() == value.lower()
                 elif op == "Not Equals":
                     mask = series.str.lower() != value.lower()
                 elif op == "Matches Regex":
-                    mask = series.str.match(value, na=False)
+                    mask = regex_match_mask(df[column], value)
                 else:
                     mask = pd.Series(True, index=df.index)
                 masks.append(mask)
@@ -351,6 +846,17 @@ class AppController(QObject):
         logic_op = operator.and_ if query_group["logic"] == "AND" else operator.or_
         return reduce(logic_op, masks)
 
+    def _build_any_column_mask(self, df, op, value):
+        import pandas as pd
+
+        if df is self.original_data:
+            matched = self.search_text.contains(df, str(value))
+        else:
+            matched = contains_mask(build_search_text(df), str(value))
+        if op == "Does Not Contain":
+            matched = ~matched
+        return pd.Series(matched, index=df.index)
+
     def load_filters(self):
         try:
             if not os.path.exists(FILTERS_FILE):
@@ -370,11 +876,54 @@ class AppController(QObject):
         except Exception as e:
             print(f"Error saving filter '{name}': {e}")
 
-    def get_trace_data(self, trace_id, additional_filter=None):
+    def make_row_fetcher(self):
+        """
+        지금의 original_data 행 라벨로 나중에 (뷰에 싣지 않은) 다른 컬럼을 가져오는 함수와,
+        그렇게 가져올 수 있는 전체 컬럼 목록을 (fetcher, columns)로 반환합니다.
+        fetcher(labels, columns)는 라벨마다 한 행씩 담은 DataFrame을 반환하며,
+        실시간 버퍼에서 그 사이 밀려난 행은 None으로 채웁니다.
+        """
         import pandas as pd
 
+        buffer = self._realtime_buffer
+        if buffer is None:
+            frame = self._original_frame
+
+            def fetch(labels, columns):
+                columns = [c for c in columns if c in frame.columns]
+                return frame.loc[np.asarray(labels), columns]
+
+            return fetch, list(frame.columns)
+
+        dropped_at = buffer.dropped
+
+        def fetch(labels, columns):
+            labels = np.asarray(labels, dtype=np.int64)
+            columns = [c for c in columns if c in buffer.columns]
+            logical = labels + dropped_at - buffer.dropped
+            alive = (logical >= 0) & (logical < len(buffer))
+            values = {name: np.full(len(labels), None, dtype=object) for name in columns}
+            if alive.any():
+                rows = buffer.to_frame(logical[alive])
+                for name in columns:
+                    values[name][alive] = rows[name].to_numpy(dtype=object)
+            return pd.DataFrame(values, index=labels, columns=columns)
+
+        return fetch, list(buffer.columns)
+
+    def get_trace_data(self, trace_id, additional_filter=None, time_window=None, columns=None):
+        """
+        trace_id가 들어 있는 행들을 반환합니다. ID는 정규식이 아닌 글자 그대로 (대소문자 무시) 찾으며,
+        get_batch_trace_rows()와 같은 행을 고릅니다. ('CNV12305.104'의 '.'은 아무 글자가 아닙니다)
+        columns가 주어지면 그 컬럼만 복사합니다. (무거운 컬럼은 make_row_fetcher()로 필요할 때 가져옵니다)
+        """
+        import pandas as pd
+
+        trace_id = trace_id.strip()
         df = self.original_data
-        if df.empty:
+        if time_window:
+            df = self.slice_time_range(*time_window)
+        if df.empty or not trace_id:
             return pd.DataFrame()
 
         search_columns = [
@@ -386,30 +935,145 @@ class AppController(QObject):
         ]
         valid_search_columns = [col for col in search_columns if col in df.columns]
 
-        final_mask = reduce(
-            operator.or_,
-            (
-                df[col].astype(str).str.contains(trace_id, case=False, na=False)
+        trace_query = {
+            "logic": "OR",
+            "rules": [
+                {"column": col, "operator": "Contains", "value": trace_id, "literal": True}
                 for col in valid_search_columns
-            ),
-        )
+            ],
+        }
+        if time_window:
+            trace_query = {
+                "logic": "AND",
+                "rules": [
+                    {
+                        "column": "NumericalTimeStamp",
+                        "operator": RANGE_OPERATOR,
+                        "value": list(time_window),
+                    },
+                    trace_query,
+                ],
+            }
+        positions = self._sql_filter_positions(trace_query)
 
-        trace_df = df[final_mask]
+        if positions is not None:
+            trace_df = take_columns(self.original_data, positions, columns)
+        else:
+            final_mask = reduce(
+                operator.or_,
+                (
+                    df[col].astype(str).str.contains(trace_id, case=False, regex=False, na=False)
+                    for col in valid_search_columns
+                ),
+            )
+            trace_df = take_columns(df, final_mask.to_numpy(dtype=bool), columns)
 
         # 추가 필터가 제공된 경우 적용합니다.
         if additional_filter and not trace_df.empty:
             # 모든 컬럼에 대해 additional_filter가 포함된 행을 찾습니다.
-            filter_mask = (
-                trace_df.astype(str)
-                .apply(
-                    lambda x: x.str.contains(additional_filter, case=False, na=False)
-                )
-                .any(axis=1)
+            # (original_data는 RangeIndex이므로 trace_df의 인덱스가 곧 행 위치입니다.)
+            filter_mask = self.search_text.contains(
+                self.original_data,
+                additional_filter,
+                positions=trace_df.index.to_numpy(),
             )
             trace_df = trace_df[filter_mask]
 
         return trace_df
 
+    def get_batch_trace_rows(self, trace_ids, additional_filter=None):
+        """
+        여러 ID를 하나의 Aho-Corasick 오토마톤으로 묶어 검색 컬럼을 한 번만 스캔하고,
+        ID별로 original_data의 행 위치(정수 배열)를 반환합니다. ID는 get_trace_data()와 같이 글자 그대로 (대소문자 무시) 찾습니다.
+        """
+        import numpy as np
+        import pandas as pd
+        from utils.aho_corasick import AhoCorasickMatcher
+
+        trace_ids = list(dict.fromkeys(tid.strip() for tid in trace_ids if tid.strip()))
+        df = self.original_data
+        if df.empty or not trace_ids:
+            return {tid: np.array([], dtype=np.int64) for tid in trace_ids}
+
+        matcher = AhoCorasickMatcher(trace_ids)
+        hits = {tid: [] for tid in trace_ids}
+
+        search_columns = [
+            "TrackingID",
+            "AsciiData",
+            "DeviceID",
+            "MethodID",
+            "MessageName",
+        ]
+        for col in [c for c in search_columns if c in df.columns]:
+            # 동일한 값은 한 번만 검사하도록 컬럼을 고유값 단위로 분해합니다.
+            codes, uniques = pd.factorize(df[col].astype(str), sort=False)
+            unique_hits = {}
+            for u_idx, text in enumerate(uniques):
+                found = matcher.find_all(text)
+                if found:
+                    unique_hits[u_idx] = found
+            if not unique_hits:
+                continue
+
+            candidate_rows = np.flatnonzero(
+                np.isin(codes, np.fromiter(unique_hits.keys(), dtype=np.int64))
+            )
+            candidate_codes = codes[candidate_rows]
+            order = np.argsort(candidate_codes, kind="stable")
+            sorted_rows = candidate_rows[order]
+            sorted_codes = candidate_codes[order]
+
+            for u_idx, found in unique_hits.items():
+                start = np.searchsorted(sorted_codes, u_idx, side="left")
+                end = np.searchsorted(sorted_codes, u_idx, side="right")
+                for tid in found:
+                    hits[tid].append(sorted_rows[start:end])
+
+        filter_mask = None
+        if additional_filter:
+            matched_rows = [rows for parts in hits.values() for rows in parts]
+            if matched_rows:
+                union_rows = np.unique(np.concatenate(matched_rows))
+                filter_mask = np.zeros(len(df), dtype=bool)
+                filter_mask[union_rows] = self.search_text.contains(
+                    df, additional_filter, positions=union_rows
+                )
+
+        result = {}
+        for tid, parts in hits.items():
+            rows = (
+                np.unique(np.concatenate(parts))
+                if parts
+                else np.array([], dtype=np.int64)
+            )
+            if filter_mask is not None and rows.size:
+                rows = rows[filter_mask[rows]]
+            result[tid] = rows
+        return result
+
+    def get_batch_trace_data(self, trace_ids, additional_filter=None, columns=None):
+        """
+        배치 추적 결과를 'TraceID' 컬럼이 추가된 하나의 DataFrame으로 합쳐 반환합니다.
+        (그룹별 보기 및 일괄 내보내기에 사용) columns가 주어지면 그 컬럼만 복사합니다.
+        """
+        import pandas as pd
+
+        rows_by_id = self.get_batch_trace_rows(trace_ids, additional_filter)
+        frames = []
+        for tid, rows in rows_by_id.items():
+            if len(rows) == 0:
+                continue
+            frame = take_columns(self.original_data, rows, columns)
+            frames.append(frame.assign(TraceID=tid))
+
+        if not frames:
+            return pd.DataFrame()
+
+        combined = pd.concat(frames)
+        columns = ["TraceID"] + [c for c in combined.columns if c != "TraceID"]
+        return combined[columns]
+
     def get_scenario_data(self, trace_id, additional_filter=None):
         scenario_df = self.get_trace_data(trace_id, additional_filter)
         # Com(SECS)와 Info(MES/Internal) 카테고리의 로그를 모두 포함합니다.
@@ -437,6 +1101,8 @@ class AppController(QObject):
 
         all_completed_scenarios = []
         df = self.original_data.sort_values(by="SystemDate_dt").reset_index()
+        # 결과에는 로그 행의 고유 번호를 남깁니다. (필터나 실시간 버퍼의 밀려남 뒤에도 같은 행을 찾을 수 있도록)
+        log_ids = self.row_ids(df["index"].to_numpy())
 
         for name, scenario in scenarios.items():
             if (scenario_to_run and name != scenario_to_run) or (
@@ -447,12 +1113,13 @@ class AppController(QObject):
             active_scenarios = {}
             completed_scenarios = []
             context_keys = list(scenario.get("context_extractors", {}).keys())
+            row_contexts = self._extract_contexts(
+                df, scenario.get("context_extractors", {})
+            )
 
-            for index, row in df.iterrows():
+            for position, (index, row) in enumerate(df.iterrows()):
                 current_time = row["SystemDate_dt"]
-                current_row_context = self._extract_context(
-                    row, scenario.get("context_extractors", {})
-                )
+                current_row_context = row_contexts[position]
 
                 finished_keys = []
                 for key, state in active_scenarios.items():
@@ -483,7 +1150,7 @@ class AppController(QObject):
                                 "step_name": step_definition.get(
                                     "name", f"Step {state['current_step'] + 1}"
                                 ),
-                                "log_index": int(row["index"]),
+                                "log_index": int(log_ids[position]),
                                 "timestamp": row["SystemDate_dt"],
                             }
                         )
@@ -499,9 +1166,7 @@ class AppController(QObject):
                     del active_scenarios[key]
 
                 if self._match_event(row, scenario.get("trigger_event", {})):
-                    trigger_context = self._extract_context(
-                        row, scenario.get("context_extractors", {})
-                    )
+                    trigger_context = dict(current_row_context)
                     key = (
                         tuple(trigger_context[k] for k in context_keys)
                         if context_keys
@@ -521,7 +1186,7 @@ class AppController(QObject):
                             "involved_logs": [
                                 {
                                     "step_name": "Trigger",
-                                    "log_index": int(row["index"]),
+                                    "log_index": int(log_ids[position]),
                                     "timestamp": row["SystemDate_dt"],
                                 }
                             ],
@@ -593,16 +1258,36 @@ class AppController(QObject):
                 errors="coerce",
             )
 
-        self.original_data = pd.concat(
-            [self.original_data, combined_chunk], ignore_index=True
-        )
-        self.source_model.append_data(combined_chunk)
+        first_chunk_id = self._next_row_id
+        self._next_row_id += len(combined_chunk)
 
-        current_model_rows = self.source_model.rowCount()
-        if len(self.original_data) > current_model_rows:
-            self.original_data = self.original_data.tail(
-                current_model_rows
-            ).reset_index(drop=True)
+        # 필터된 뷰는 원본보다 행이 적으므로, 원본 버퍼는 모델의 최대 행 수 기준으로 유지합니다.
+        # 원형 버퍼에 제자리로 추가하므로 매 틱의 비용은 청크 크기에 비례합니다.
+        if self._realtime_buffer is None:
+            buffer = ColumnarRingBuffer(self.source_model.max_rows)
+            buffer.append(self._original_frame)
+            evicted = self._original_row_count() - len(buffer)
+            self._realtime_buffer = buffer
+        else:
+            evicted = 0
+        evicted += self._realtime_buffer.append(combined_chunk)
+        self._original_frame = None
+        self.time_index.append(extract_timestamps(combined_chunk))
+        self.search_text.append(combined_chunk)
+        if evicted > 0:
+            self._row_offset += evicted
+            self.time_index.trim_head(evicted)
+            self.search_text.trim_head(evicted)
+        self.data_version += 1
+        # 고급 필터가 적용 중이면 새 청크만 평가하여 일치하는 행만 뷰에 추가합니다.
+        view_chunk = self._filter_chunk(combined_chunk)
+        self.source_model.append_data(
+            view_chunk, row_ids=np.uint64(first_chunk_id) + view_chunk.index.to_numpy(dtype=np.uint64)
+        )
+        if evicted > 0:
+            # 원본에서 밀려난 행은 필터된 뷰와 뷰 스택에서도 빼서, 살아 있는 행만 가리키게 합니다.
+            self.source_model.drop_rows_before(self._row_id_start + self._row_offset)
+            self._trim_view_stack(evicted)
 
         if self.db_manager:
             self.db_manager.upsert_logs_to_local_cache(combined_chunk)
@@ -610,23 +1295,13 @@ class AppController(QObject):
         self.row_count_updated.emit(self.source_model.rowCount())
 
         if self.dashboard_dialog and self.dashboard_dialog.isVisible():
-            self.dashboard_dialog.update_dashboard(self.original_data)
+            self.dashboard_dialog.update_dashboard()
 
     def _handle_fetch_error(self, error_message):
         self.fetch_error.emit(error_message)
         if self.dashboard_dialog and self.dashboard_dialog.isVisible():
             self.dashboard_dialog.stop_updates()
-        if self._update_timer.isActive():
-            self._update_timer.stop()
-
-    def save_log_to_csv(self, dataframe, file_path):
-        import pandas as pd
-
-        try:
-            dataframe.to_csv(file_path, index=False, encoding="utf-8-sig")
-            return True, f"Successfully saved to {os.path.basename(file_path)}"
-        except Exception as e:
-            return False, f"Could not save file: {e}"
+        self.render_scheduler.cancel()
 
     def load_query_templates(self):
         """query_templates.json 파일에서 템플릿들을 불러옵니다."""
@@ -674,18 +1349,26 @@ class AppController(QObject):
 
         return " AND ".join(clauses), params
 
-    def _parse_filter_group(self, group, param_index=0):
+    def _parse_filter_group(self, group, param_index=0, dialect=None):
+        """
+        규칙 트리를 SQL WHERE 절과 바인드 변수로 변환합니다.
+        dialect를 주지 않으면 Oracle용 SQL을, 내장 엔진 백엔드의 dialect를 주면 해당 엔진용 SQL을 만듭니다.
+        """
         # ✅ [수정] group이 None이거나 비어있는 경우를 처리하는 방어 코드
         if not group or not group.get("rules"):
             return "", {}
 
+        dialect = dialect or ORACLE_DIALECT
+        time_column = dialect["time_column"]
         clauses = []
         params = {}
         logic = f" {group.get('logic', 'AND')} "
 
         for rule in group.get("rules", []):
             if "logic" in rule:
-                sub_clause, sub_params = self._parse_filter_group(rule, param_index)
+                sub_clause, sub_params = self._parse_filter_group(
+                    rule, param_index, dialect
+                )
                 if sub_clause:
                     clauses.append(f"({sub_clause})")
                     params.update(sub_params)
@@ -696,45 +1379,126 @@ class AppController(QObject):
                     rule.get("operator"),
                     rule.get("value"),
                 )
-                if not all([col, op, val]):
+                # 모든 컬럼 검색(ANY_COLUMN)은 SQL로 옮길 수 없으므로 건너뜁니다.
+                if not all([col, op, val]) or col == ANY_COLUMN:
                     continue
                 param_name = f"p{param_index}"
 
-                op_map = {
-                    "Contains": "INSTR({col}, :{p}) > 0",
-                    "Does Not Contain": "INSTR({col}, :{p}) = 0",
-                    "Equals": "{col} = :{p}",
-                    "Not Equals": "{col} != :{p}",
-                    "Matches Regex": "REGEXP_LIKE({col}, :{p})",
-                }
+                # 시간 연산자는 A.SYSTEMDATE(epoch ms, NUMBER)에 대한 범위 조건으로 변환합니다.
+                if is_time_rule(rule):
+                    start, end = time_rule_bounds(op, val, col)
+                    bounds = []
+                    if start is not None:
+                        bounds.append(f"{time_column} >= :{param_name}")
+                        params[param_name] = start
+                        param_index += 1
+                        param_name = f"p{param_index}"
+                    if end is not None:
+                        bounds.append(f"{time_column} <= :{param_name}")
+                        params[param_name] = end
+                        param_index += 1
+                    if bounds:
+                        clauses.append(" AND ".join(bounds))
+                    continue
+
+                op_map = dialect["ops"]
+                # 정규식 문자가 든 포함 검색은 pandas와 같은 정규식 검색으로 변환합니다. (방언이 지원하는 경우)
+                if (
+                    op in dialect.get("pattern_ops", {})
+                    and not rule.get("literal")
+                    and has_regex_syntax(val)
+                ):
+                    op_map = dialect["pattern_ops"]
                 if op in op_map:
                     clauses.append(op_map[op].format(col=col, p=param_name))
                     params[param_name] = val
                     param_index += 1
+                # 비교/범위/목록 연산자는 컬럼에 함수를 씌우지 않아 인덱스를 탈 수 있는(sargable) 조건으로 만듭니다.
+                elif op in COMPARISON_OPERATORS:
+                    param = to_sql_param(val)
+                    target = self._sql_compare_target(col, dialect, param)
+                    clauses.append(f"{target} {op} :{param_name}")
+                    params[param_name] = param
+                    param_index += 1
+                elif op == RANGE_OPERATOR:
+                    start, end = split_range_value(val)
+                    start, end = to_sql_param(start), to_sql_param(end)
+                    end_param = f"p{param_index + 1}"
+                    target = self._sql_compare_target(col, dialect, start, end)
+                    clauses.append(
+                        f"{target} BETWEEN :{param_name} AND :{end_param}"
+                    )
+                    params[param_name] = start
+                    params[end_param] = end
+                    param_index += 2
+                elif op == LIST_OPERATOR:
+                    items = split_list_value(val)
+                    if not items:
+                        continue
+                    list_params = [f"p{param_index + i}" for i in range(len(items))]
+                    target = dialect["list_column"].format(col=col)
+                    clauses.append(
+                        f"{target} IN ({', '.join(':' + p for p in list_params)})"
+                    )
+                    for p, item in zip(list_params, items):
+                        params[p] = (
+                            item.lower() if dialect["lower_list"] else to_sql_param(item)
+                        )
+                    param_index += len(items)
 
         return logic.join(clauses), params
 
-    def _extract_context(self, row, extractors):
+    @staticmethod
+    def _sql_compare_target(col, dialect, *params):
+        """숫자 값과 비교할 때는 방언의 숫자 변환식으로, 문자열과 비교할 때는 컬럼 그대로 비교합니다."""
+        if all(isinstance(p, (int, float)) for p in params):
+            return dialect["number"].format(col=col)
+        return col
+
+    def _extract_contexts(self, df, extractors):
+        """
+        시나리오 컨텍스트 추출기를 모든 행에 대해 한 번에(컬럼 단위로) 평가하여,
+        행 순서대로 {컨텍스트 이름: 값} 딕셔너리 리스트를 반환합니다.
+        추출기 목록은 순서대로 시도하며, 먼저 값을 찾은 추출기가 우선합니다.
+        """
         import pandas as pd
 
-        context_data = {}
+        contexts = [{} for _ in range(len(df))]
         for context_name, rules in extractors.items():
+            resolved = np.zeros(len(df), dtype=bool)
             for rule in rules:
+                pending = ~resolved
+                if not pending.any():
+                    break
                 if "from_column" in rule:
-                    val = row.get(rule["from_column"])
-                    if pd.notna(val) and str(val).strip():
-                        context_data[context_name] = str(val)
-                        break
+                    column = rule["from_column"]
+                    if column not in df.columns:
+                        continue
+                    values = df[column]
+                    found = (
+                        values.notna() & (values.astype(str).str.strip() != "")
+                    ).to_numpy(dtype=bool) & pending
+                    values = values.astype(str).to_numpy(dtype=object)
                 elif "from_regex" in rule:
                     source_col, pattern = (
                         rule["from_regex"].get("column"),
                         rule["from_regex"].get("pattern"),
                     )
-                    match = re.search(pattern, str(row.get(source_col, "")))
-                    if match:
-                        context_data[context_name] = match.group(1)
-                        break
-        return context_data
+                    source = (
+                        df[source_col]
+                        if source_col in df.columns
+                        else pd.Series("", index=df.index)
+                    )
+                    matched, values = regex_search_group(source, pattern, group=1)
+                    found = matched.to_numpy(dtype=bool) & pending
+                    values = values.to_numpy(dtype=object)
+                else:
+                    continue
+
+                for position in np.flatnonzero(found):
+                    contexts[position][context_name] = values[position]
+                resolved |= found
+        return contexts
 
     def get_history_summary(self):
         import pandas as pd
@@ -745,6 +1509,28 @@ class AppController(QObject):
             else pd.DataFrame()
         )
 
+    def create_cache_browser_model(self, columns=None):
+        """
+        로컬 캐시 전체를 페이지 단위로 읽어 보여주는 모델을 만듭니다. (DB 모드가 아니면 None)
+        columns가 주어지면 그 컬럼만, 아니면 무거운 컬럼을 뺀 컬럼만 읽습니다.
+        """
+        if not self.db_manager:
+            return None
+        from models.PagedLogTableModel import PagedLogTableModel
+        from utils.column_projection import light_columns
+
+        if not columns:
+            columns = light_columns(self.db_manager.get_cached_log_columns())
+
+        model = PagedLogTableModel(
+            self.db_manager,
+            columns=columns,
+            page_rows=int(self.config.get("cache_page_rows", 2000)),
+            max_pages=int(self.config.get("cache_max_pages", 32)),
+        )
+        model.set_highlighting_rules(self.highlighting_rules)
+        return model
+
     def get_history_detail(self, run_id):
         return (
             self.db_manager.get_validation_history_detail(run_id)
@@ -756,26 +1542,55 @@ class AppController(QObject):
         """현재 설정의 복사본을 반환합니다."""
         return self.config.copy()
 
-    def get_carrier_move_scenario(self, carrier_id, from_device, to_device):
+    def get_carrier_move_scenario(self, carrier_id, from_device, to_device, columns=None):
+        """
+        특정 Carrier의 장비 간 이동과 관련된 모든 로그를 추출합니다.
+        columns가 주어지면 그 컬럼만 복사하며, 장비 검색과 시간 정렬은 원본의 해당 컬럼으로 합니다.
+        """
         import pandas as pd
 
-        """특정 Carrier의 장비 간 이동과 관련된 모든 로그를 추출합니다."""
-
-        base_df = self.get_trace_data(carrier_id)
+        base_df = self.get_trace_data(carrier_id, columns=columns)
         if base_df.empty:
             return pd.DataFrame()
+        # original_data는 RangeIndex이므로 추적 결과의 인덱스가 곧 행 위치입니다.
+        positions = base_df.index.to_numpy()
 
         if from_device and to_device:
-            device_mask = (
-                base_df.astype(str)
-                .stack()
-                .str.contains(f"{from_device}|{to_device}", case=False, na=False)
-                .unstack()
-                .any(axis=1)
-            )
-            return base_df[device_mask].sort_values(by="SystemDate_dt")
+            # 전체 컬럼을 문자열로 펼치지 않고, 장비 정보가 나타나는 컬럼만 검사합니다.
+            device_mask = self._search_columns_mask(
+                take_columns(self.original_data, positions, CARRIER_MOVE_SEARCH_COLUMNS),
+                CARRIER_MOVE_SEARCH_COLUMNS,
+                (from_device, to_device),
+            ).to_numpy(dtype=bool)
+            base_df = base_df[device_mask]
+            positions = positions[device_mask]
+
+        sort_key = pd.Series(
+            self.original_data["SystemDate_dt"].to_numpy()[positions], index=base_df.index
+        )
+        return base_df.loc[sort_key.sort_values().index]
+
+    def _search_columns_mask(self, df, columns, terms):
+        """
+        지정한 컬럼들 중 하나라도 검색어(대소문자 무시, 부분 문자열)를 포함하는 행을 True로 표시합니다.
+        컬럼을 고유값 단위로 분해해 같은 값은 한 번만 검사합니다.
+        """
+        import pandas as pd
 
-        return base_df.sort_values(by="SystemDate_dt")
+        terms = [str(term).lower() for term in terms if str(term)]
+        mask = np.zeros(len(df), dtype=bool)
+        for col in [c for c in columns if c in df.columns]:
+            codes, uniques = pd.factorize(df[col], sort=False)
+            if len(uniques) == 0:
+                continue
+            lowered = pd.Series(uniques).astype(str).str.lower()
+            unique_hits = reduce(
+                operator.or_,
+                (lowered.str.contains(term, regex=False) for term in terms),
+            ).to_numpy(dtype=bool)
+            # 결측값(code -1)은 일치하지 않는 것으로 처리합니다.
+            mask |= (codes >= 0) & unique_hits[codes]
+        return pd.Series(mask, index=df.index)
 
     def get_default_column_names(self):
         """고급 필터 등에서 사용할 기본 컬럼 이름 목록을 반환합니다."""
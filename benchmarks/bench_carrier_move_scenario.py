@@ -0,0 +1,105 @@
+"""
+get_carrier_move_scenario 를 기존 구현(전체 컬럼 stack/unstack)과
+컬럼 지정 검색 구현으로 비교하는 벤치마크입니다.
+
+사용법:
+    python benchmarks/bench_carrier_move_scenario.py [행 수]   (기본 1,000,000행)
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app_controller import AppController  # noqa: E402
+
+CARRIER_ID = "LHAE000336"
+FROM_DEVICE = "STK01"
+TO_DEVICE = "EQP07"
+
+
+def build_trace(rows, seed=0):
+    """한 Carrier에 대한 긴 추적 결과를 흉내 낸 DataFrame을 만듭니다."""
+    rng = np.random.default_rng(seed)
+    devices = np.array([f"STK{i:02d}" for i in range(20)] + [f"EQP{i:02d}" for i in range(40)])
+    messages = np.array(["S6F11", "S2F41", "S1F3", "S5F1", "S6F12"])
+    start = pd.Timestamp("2024-01-01 00:00:00")
+    system_dt = start + pd.to_timedelta(np.arange(rows) * 37, unit="ms")
+    device_ids = devices[rng.integers(0, len(devices), rows)]
+    port_ids = devices[rng.integers(0, len(devices), rows)]
+
+    return pd.DataFrame(
+        {
+            "Category": np.where(rng.random(rows) < 0.6, "Com", "Info"),
+            "DeviceID": device_ids,
+            "MethodID": messages[rng.integers(0, len(messages), rows)],
+            "TrackingID": np.char.add(f"{CARRIER_ID}-", (np.arange(rows) % 5000).astype(str)),
+            "AsciiData": np.char.add(
+                np.char.add(f"CarrierID={CARRIER_ID} PortID=", port_ids),
+                np.char.add(" Seq=", np.arange(rows).astype(str)),
+            ),
+            "MessageName": messages[rng.integers(0, len(messages), rows)],
+            "SystemDate": system_dt.strftime("%d-%b-%Y %H:%M:%S:%f").str[:-3],
+            "SystemDate_dt": system_dt,
+            "NumericalTimeStamp": (system_dt.asi8 // 1_000_000).astype(str),
+        }
+    )
+
+
+def legacy_carrier_move_scenario(controller, carrier_id, from_device, to_device):
+    """변경 전 get_carrier_move_scenario 구현입니다."""
+    base_df = controller.get_trace_data(carrier_id)
+    device_mask = (
+        base_df.astype(str)
+        .stack()
+        .str.contains(f"{from_device}|{to_device}", case=False, na=False)
+        .unstack()
+        .any(axis=1)
+    )
+    return base_df[device_mask].sort_values(by="SystemDate_dt")
+
+
+def measure(label, func):
+    # 시간은 tracemalloc 없이 재고, 최대 메모리는 별도 실행으로 잽니다.
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {elapsed:8.2f} s   peak {peak / 2**20:9.1f} MiB   rows {len(result):,}")
+    return result
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"Building {rows:,}-row carrier trace...")
+    base_df = build_trace(rows)
+
+    controller = AppController("file")
+    controller.original_data = base_df
+
+    legacy = measure(
+        "legacy (stack/unstack)",
+        lambda: legacy_carrier_move_scenario(
+            controller, CARRIER_ID, FROM_DEVICE, TO_DEVICE
+        ),
+    )
+    current = measure(
+        "column-targeted",
+        lambda: controller.get_carrier_move_scenario(CARRIER_ID, FROM_DEVICE, TO_DEVICE),
+    )
+
+    # 기존 구현은 모든 컬럼을 검사하므로, 검색 대상 컬럼에만 장비가 나타나는 이 데이터에서는 결과가 같아야 합니다.
+    assert legacy.index.equals(current.index), "results differ"
+    print("Results match.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+OracleFetcherThread 가 조회 결과를 DataFrame 배치로 바꾸는 비용(초당 행 수)을 재는 벤치마크입니다.
+
+Oracle 서버 대신 로컬 DuckDB 를 같은 10개 컬럼의 결과를 내는 대역으로 써서,
+- 이전 방식: fetchmany(1000) 행 튜플 -> 대문자 컬럼 DataFrame -> 이름 변경
+- 커서 방식: AdaptiveBatchSize 로 배치 크기를 조절하며 LOG_COLUMNS 로 바로 DataFrame 생성
+- Arrow 방식: ARROW_BATCH_ROWS 크기의 Arrow 레코드 배치 -> arrow_frame (행 튜플 없음)
+을 비교합니다. 네트워크 왕복 횟수(arraysize/prefetchrows 효과)는 포함되지 않으며,
+클라이언트 쪽 전달과 변환 비용만 잽니다.
+
+사용법:
+    python benchmarks/bench_oracle_fetch.py [행 수]
+    (기본 500,000행)
+"""
+import os
+import sys
+import time
+
+import duckdb
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.oracle_fetch import (  # noqa: E402
+    ARROW_BATCH_ROWS,
+    LOG_COLUMNS,
+    AdaptiveBatchSize,
+    arrow_frame,
+)
+
+QUERY = "SELECT * FROM logdata ORDER BY NumericalTimeStamp"
+
+
+def make_source(rows):
+    """CLASS.LOGDATA 조회 결과와 같은 모양의 행을 가진 DuckDB 테이블을 만듭니다."""
+    con = duckdb.connect()
+    con.execute(
+        f"""
+        CREATE TABLE logdata AS
+        SELECT
+            strftime(TIMESTAMP '2025-01-01' + to_milliseconds(i * 7), '%Y-%m-%d %H:%M:%S.%g') AS SystemDate,
+            1735689600000 + i * 7 AS NumericalTimeStamp,
+            (i % 5) + 1 AS LevelID,
+            ['Info', 'Debug', 'Com', 'Error'][(i % 4) + 1] AS Category,
+            'Send' AS MethodID,
+            'J1FCNV' || lpad(CAST(i % 40 AS VARCHAR), 2, '0') AS DeviceID,
+            'T' || CAST(i AS VARCHAR) AS TrackingID,
+            'S6F11' AS MessageName,
+            'S6F11 CEID=1001 RPTID=' || CAST(i % 97 AS VARCHAR) AS AsciiData,
+            CAST('\\x00\\x01\\x02\\x03' AS BLOB) AS BinaryData
+        FROM range({rows}) t(i)
+        """
+    )
+    return con
+
+
+def old_path(con):
+    cursor = con.cursor()
+    cursor.execute(QUERY)
+    total = 0
+    while True:
+        rows = cursor.fetchmany(1000)
+        if not rows:
+            break
+        columns = [desc[0].upper() for desc in cursor.description]
+        df_chunk = pd.DataFrame(rows, columns=columns)
+        df_chunk.columns = LOG_COLUMNS
+        total += len(df_chunk)
+    return total
+
+
+def cursor_path(con):
+    cursor = con.cursor()
+    cursor.execute(QUERY)
+    batch = AdaptiveBatchSize()
+    total = 0
+    while True:
+        started = time.perf_counter()
+        rows = cursor.fetchmany(batch.size)
+        if not rows:
+            break
+        batch.update(len(rows), time.perf_counter() - started)
+        total += len(pd.DataFrame(rows, columns=LOG_COLUMNS))
+    return total
+
+
+def arrow_path(con):
+    reader = con.cursor().execute(QUERY).to_arrow_reader(ARROW_BATCH_ROWS)
+    return sum(len(arrow_frame(batch)) for batch in reader)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    con = make_source(rows)
+    print(f"{rows:,} rows")
+    for name, run in [("old (fetchmany 1000)", old_path), ("cursor (adaptive)", cursor_path), ("arrow batches", arrow_path)]:
+        started = time.perf_counter()
+        fetched = run(con)
+        elapsed = time.perf_counter() - started
+        assert fetched == rows, (name, fetched)
+        print(f"  {name:<22} {elapsed:6.2f}s  {rows / elapsed:>12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
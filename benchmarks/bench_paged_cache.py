@@ -0,0 +1,101 @@
+"""
+PagedLogTableModel 로 로컬 캐시(SQLite)를 탐색할 때의 비용을 재는 벤치마크입니다.
+
+임시 캐시 파일에 로그 행을 채운 뒤, 처음부터 순서대로 스크롤(keyset 조회)하는 경우와
+스크롤바를 끌어 임의 위치로 이동(OFFSET 조회)하는 경우의 화면당 시간과,
+메모리에 남아 있는 페이지 수(= LRU 상한)를 출력합니다.
+
+사용법:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_paged_cache.py [행 수]
+    (기본 2,000,000행)
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database_manager import DatabaseManager, LOGS_TABLE_NAME  # noqa: E402
+from models.PagedLogTableModel import PagedLogTableModel  # noqa: E402
+
+VISIBLE_ROWS = 40
+STEPS = 300
+CHUNK_ROWS = 200_000
+
+
+def fill_cache(manager, rows, seed=0):
+    """logs 테이블에 시간 순 로그 행을 채웁니다. (중복 검사 없이 바로 INSERT)"""
+    rng = np.random.default_rng(seed)
+    devices = np.array([f"J1FCNV{i:02d}" for i in range(40)])
+    start = 1_700_000_000_000
+    with manager.local_engine.begin() as connection:
+        for offset in range(0, rows, CHUNK_ROWS):
+            count = min(CHUNK_ROWS, rows - offset)
+            stamps = start + np.arange(offset, offset + count) * 7
+            df = pd.DataFrame(
+                {
+                    "Category": rng.choice(["Info", "Debug", "Com", "Error"], count),
+                    "LevelID": rng.integers(1, 6, count),
+                    "SystemDate": pd.to_datetime(stamps, unit="ms").strftime("%d-%b-%Y %H:%M:%S:%f"),
+                    "DeviceID": devices[rng.integers(0, len(devices), count)],
+                    "MethodID": "Send",
+                    "TrackingID": [f"T{i}" for i in range(offset, offset + count)],
+                    "AsciiData": "S6F11 CEID=1001",
+                    "NumericalTimeStamp": stamps,
+                }
+            )
+            df.to_sql(LOGS_TABLE_NAME, connection, if_exists="append", index=False)
+
+
+def show_screen(model, top):
+    for row in range(top, min(top + VISIBLE_ROWS, model.rowCount())):
+        for col in range(model.columnCount()):
+            model.data(model.index(row, col), Qt.ItemDataRole.DisplayRole)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    workdir = tempfile.mkdtemp()
+    os.chdir(workdir)
+    manager = DatabaseManager("bench")
+    print(f"Filling {rows:,} rows into {workdir}...")
+    started = time.perf_counter()
+    fill_cache(manager, rows)
+    print(f"  filled in {time.perf_counter() - started:.1f} s")
+
+    started = time.perf_counter()
+    model = PagedLogTableModel(manager)
+    print(f"open (count rows)        {(time.perf_counter() - started) * 1000:8.1f} ms")
+
+    started = time.perf_counter()
+    for step in range(STEPS):
+        show_screen(model, step * VISIBLE_ROWS)
+        app.processEvents()  # 미리 읽기 실행
+    elapsed = time.perf_counter() - started
+    print(f"sequential scroll        {elapsed / STEPS * 1000:8.2f} ms/screen")
+
+    tops = np.random.default_rng(1).integers(0, rows - VISIBLE_ROWS, 50)
+    started = time.perf_counter()
+    for top in tops:
+        show_screen(model, int(top))
+    elapsed = time.perf_counter() - started
+    print(f"random jump              {elapsed / len(tops) * 1000:8.2f} ms/screen")
+    print(f"pages in memory          {model.cached_page_count()} / {model.max_pages}")
+
+    expected = int(manager.read_cached_logs_page(1, offset=int(tops[-1]))[0]["NumericalTimeStamp"].iloc[0])
+    shown = int(model.data(model.index(int(tops[-1]), model.column_names().index("NumericalTimeStamp"))))
+    assert shown == expected, "page content differs"
+    print("Page content matches.")
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
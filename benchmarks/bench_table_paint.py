@@ -0,0 +1,117 @@
+"""
+LogTableModel 의 셀 표시(DisplayRole) 비용을 기존 구현(셀마다 DataFrame.iloc)과
+컬럼 배열 기반 구현으로 비교하는 벤치마크입니다.
+
+화면 한 장(보이는 행 x 전체 컬럼)을 임의 위치로 스크롤하며 data()를 호출하는 시간과,
+QTableView 를 실제로 그리는(grab) 시간을 잽니다.
+
+사용법:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_table_paint.py [행 수] [컬럼 수]
+    (기본 1,000,000행 x 50컬럼)
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QTableView
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.LogTableModel import LogTableModel  # noqa: E402
+
+VISIBLE_ROWS = 40
+SCROLL_STEPS = 200
+
+
+def build_table(rows, columns, seed=0):
+    """문자열/정수/실수/날짜 컬럼이 섞인 넓은 DataFrame을 만듭니다."""
+    rng = np.random.default_rng(seed)
+    words = np.array([f"DEV{i:03d}" for i in range(500)])
+    start = pd.Timestamp("2024-01-01 00:00:00")
+    data = {}
+    for i in range(columns):
+        kind = i % 4
+        if kind == 0:
+            data[f"Text{i}"] = pd.array(words[rng.integers(0, len(words), rows)], dtype="str")
+        elif kind == 1:
+            data[f"Int{i}"] = rng.integers(0, 1_000_000, rows)
+        elif kind == 2:
+            data[f"Float{i}"] = rng.random(rows)
+        else:
+            data[f"Date{i}"] = start + pd.to_timedelta(np.arange(rows) * 37, unit="ms")
+    return pd.DataFrame(data)
+
+
+class LegacyLogTableModel(LogTableModel):
+    """변경 전 DisplayRole 구현(셀마다 iloc 후 str)입니다."""
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return str(self._base.iloc[self._base_row(index.row()), index.column()])
+        return super().data(index, role)
+
+
+def measure_data_calls(model, starts):
+    columns = model.columnCount()
+    started = time.perf_counter()
+    for start in starts:
+        for row in range(start, start + VISIBLE_ROWS):
+            for col in range(columns):
+                model.data(model.index(row, col), Qt.ItemDataRole.DisplayRole)
+    return time.perf_counter() - started
+
+
+def measure_paint(model, starts):
+    view = QTableView()
+    view.resize(1600, 900)
+    view.setModel(model)
+    view.show()
+    started = time.perf_counter()
+    for start in starts:
+        view.scrollTo(model.index(start, 0), QTableView.ScrollHint.PositionAtTop)
+        view.viewport().grab()
+    elapsed = time.perf_counter() - started
+    view.close()
+    return elapsed
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    columns = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    print(f"Building {rows:,} x {columns} table...")
+    df = build_table(rows, columns)
+    starts = np.random.default_rng(1).integers(0, rows - VISIBLE_ROWS, SCROLL_STEPS)
+    cells = SCROLL_STEPS * VISIBLE_ROWS * columns
+
+    results = {}
+    for label, model_class in (
+        ("legacy (iloc per cell)", LegacyLogTableModel),
+        ("column arrays", LogTableModel),
+    ):
+        model = model_class(max_rows=rows)
+        model.update_data(df)
+        # 첫 화면: 컬럼 배열을 처음 만드는 비용까지 포함
+        first = measure_data_calls(model, starts[:1])
+        elapsed = measure_data_calls(model, starts)
+        paint = measure_paint(model, starts[:50])
+        results[label] = [
+            model.data(model.index(int(r), c)) for r in starts[:5] for c in range(columns)
+        ]
+        print(
+            f"{label:<24} first screen {first * 1000:8.1f} ms   "
+            f"data() {elapsed / cells * 1e6:6.2f} us/cell   "
+            f"paint {paint / 50 * 1000:7.1f} ms/frame"
+        )
+
+    assert results["legacy (iloc per cell)"] == results["column arrays"], "display text differs"
+    print("Display text matches.")
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,8 @@ from sqlalchemy import create_engine, text
 import json
 
 LOGS_TABLE_NAME = "logs"
+# logs 테이블의 기본 키 순서. 페이지 단위 조회는 이 순서(= 시간 순)로 정렬해 인덱스를 그대로 탑니다.
+LOG_KEY_COLUMNS = ["NumericalTimeStamp", "DeviceID", "TrackingID"]
 
 class DatabaseManager:
     # ... (__init__, _create_local_tables, clear_logs_from_cache 메소드는 동일)
@@ -154,6 +156,67 @@ class DatabaseManager:
             print(f"Error reading from local cache: {e}")
             return pd.DataFrame()
         
+    def count_cached_logs(self):
+        """로컬 캐시의 전체 로그 행 수를 반환합니다."""
+        try:
+            with self.local_engine.connect() as connection:
+                return int(connection.execute(text(f"SELECT COUNT(*) FROM {LOGS_TABLE_NAME}")).scalar() or 0)
+        except Exception as e:
+            print(f"Error counting cached logs: {e}")
+            return 0
+
+    def get_cached_log_columns(self):
+        """로컬 캐시 logs 테이블의 컬럼 이름 목록을 반환합니다."""
+        try:
+            with self.local_engine.connect() as connection:
+                rows = connection.execute(text(f"PRAGMA table_info({LOGS_TABLE_NAME})")).fetchall()
+            return [row[1] for row in rows]
+        except Exception as e:
+            print(f"Error reading cached log columns: {e}")
+            return []
+
+    def read_cached_logs_page(self, limit, offset=0, after_key=None, columns=None):
+        """
+        로컬 캐시의 로그를 기본 키(시간) 순서로 limit개 읽어 (DataFrame, 다음 페이지의 시작 키)를 반환합니다.
+
+        after_key(이전에 읽은 페이지가 돌려준 키)가 있으면 그 키 다음부터 인덱스로 바로 찾아가(keyset) offset만큼,
+        없으면 처음부터 offset만큼 건너뜁니다. 수천만 행에서 OFFSET은 건너뛴 행 수만큼 느리므로
+        가능한 한 가까운 키에서 시작하는 것이 좋습니다.
+        columns가 주어지면 해당 컬럼만 읽습니다. (기본 키 컬럼은 항상 포함)
+        """
+        if columns is None:
+            select_list = "*"
+        else:
+            wanted = list(columns) + [c for c in LOG_KEY_COLUMNS if c not in columns]
+            select_list = ", ".join(f'"{c}"' for c in wanted)
+        order_by = ", ".join(LOG_KEY_COLUMNS)
+        params = {"limit": int(limit)}
+        if after_key is not None:
+            query = (
+                f"SELECT {select_list} FROM {LOGS_TABLE_NAME} "
+                f"WHERE ({order_by}) > (:k0, :k1, :k2) ORDER BY {order_by} LIMIT :limit OFFSET :offset"
+            )
+            params.update({f"k{i}": value for i, value in enumerate(after_key)})
+        else:
+            query = f"SELECT {select_list} FROM {LOGS_TABLE_NAME} ORDER BY {order_by} LIMIT :limit OFFSET :offset"
+        params["offset"] = int(offset)
+        try:
+            with self.local_engine.connect() as connection:
+                df = pd.read_sql(text(query), connection, params=params)
+        except Exception as e:
+            print(f"Error reading cached log page: {e}")
+            return pd.DataFrame(), None
+        if df.empty:
+            return df, None
+        last = df.iloc[-1]
+        next_key = tuple(
+            value.item() if hasattr(value, "item") else value
+            for value in (last[c] for c in LOG_KEY_COLUMNS)
+        )
+        if columns is not None:
+            df = df[list(columns)]
+        return df, next_key
+
     def add_validation_history(self, scenario_name, status, message, involved_log_indices):
         """시나리오 분석 결과를 validation_history 테이블에 저장합니다."""
         try:
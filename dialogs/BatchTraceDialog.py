@@ -0,0 +1,67 @@
+import re
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPlainTextEdit,
+    QPushButton, QDialogButtonBox, QFileDialog, QMessageBox
+)
+from .ui_components import create_section_label
+
+class BatchTraceDialog(QDialog):
+    """
+    여러 개의 Carrier/Tracking ID를 한 번에 입력받는 배치 추적 다이얼로그입니다.
+    ID는 줄바꿈, 쉼표, 공백 등으로 구분할 수 있습니다.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Batch Trace Parameters")
+        self.setMinimumSize(420, 420)
+
+        main_layout = QVBoxLayout(self)
+        main_layout.addWidget(create_section_label("Enter IDs to Trace (one per line)"))
+
+        self.ids_input = QPlainTextEdit()
+        self.ids_input.setPlaceholderText("LHAE000336\nLHAE000337\n...")
+        self.ids_input.textChanged.connect(self._update_count_label)
+        main_layout.addWidget(self.ids_input)
+
+        info_layout = QHBoxLayout()
+        self.count_label = QLabel("0 IDs")
+        load_button = QPushButton("Load from File...")
+        load_button.clicked.connect(self.load_ids_from_file)
+        info_layout.addWidget(self.count_label)
+        info_layout.addStretch()
+        info_layout.addWidget(load_button)
+        main_layout.addLayout(info_layout)
+
+        main_layout.addWidget(QLabel("Additional Filter (선택):"))
+        self.filter_input = QLineEdit()
+        main_layout.addWidget(self.filter_input)
+
+        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        self.button_box.accepted.connect(self.accept)
+        self.button_box.rejected.connect(self.reject)
+        main_layout.addWidget(self.button_box)
+
+    def _parse_ids(self):
+        tokens = re.split(r"[\s,;]+", self.ids_input.toPlainText())
+        return list(dict.fromkeys(t.strip('"\'') for t in tokens if t.strip('"\'')))
+
+    def _update_count_label(self):
+        self.count_label.setText(f"{len(self._parse_ids()):,} IDs")
+
+    def load_ids_from_file(self):
+        filepath, _ = QFileDialog.getOpenFileName(self, "Load ID List", "", "Text Files (*.txt *.csv);;All Files (*)")
+        if not filepath:
+            return
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                self.ids_input.setPlainText(f.read())
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Could not read file: {e}")
+
+    def get_trace_parameters(self):
+        """사용자가 입력한 파라미터를 딕셔너리 형태로 반환합니다."""
+        additional_filter = self.filter_input.text().strip()
+        return {
+            "trace_ids": self._parse_ids(),
+            "additional_filter": additional_filter or None
+        }
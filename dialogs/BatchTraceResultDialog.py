@@ -0,0 +1,112 @@
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
+                               QListWidget, QListWidgetItem, QSplitter, QLineEdit,
+                               QMessageBox)
+from PySide6.QtCore import Qt
+from dialogs.ExportProgressDialog import ExportProgressDialog
+from models.LogTableModel import LogTableModel
+from utils.column_projection import attach_columns
+from utils.export_writer import EXPORT_BATCH_ROWS
+from widgets.base_log_viewer import BaseLogViewerWidget
+
+ALL_IDS_KEY = None
+
+class BatchTraceResultDialog(QDialog):
+    """
+    배치 추적 결과를 ID별 그룹으로 보여주는 다이얼로그입니다.
+    왼쪽 목록에서 ID를 선택하면 해당 ID의 추적 로그만, 'All IDs'를 선택하면
+    TraceID 컬럼으로 묶인 전체 결과를 보여줍니다.
+    """
+    def __init__(self, combined_data, highlighting_rules, controller, parent=None, row_fetcher=None):
+        super().__init__(parent)
+        self.controller = controller
+        self.combined_data = combined_data
+        self.setWindowTitle(f"Batch Trace Result ({combined_data['TraceID'].nunique():,} IDs)")
+        self.setGeometry(200, 200, 1200, 700)
+        self.setWindowFlags(self.windowFlags() | Qt.WindowMinimizeButtonHint | Qt.WindowMaximizeButtonHint)
+
+        main_layout = QVBoxLayout(self)
+
+        top_layout = QHBoxLayout()
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("Filter traced logs...")
+        save_group_button = QPushButton("Save Selected...")
+        save_group_button.clicked.connect(self.save_selected_csv)
+        save_all_button = QPushButton("Export All...")
+        save_all_button.clicked.connect(self.save_all_csv)
+        top_layout.addWidget(self.filter_input)
+        top_layout.addWidget(save_group_button)
+        top_layout.addWidget(save_all_button)
+        main_layout.addLayout(top_layout)
+
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        self.id_list = QListWidget()
+        self.id_list.currentItemChanged.connect(self.on_id_selected)
+        splitter.addWidget(self.id_list)
+
+        self.model = LogTableModel()
+        self.model.set_highlighting_rules(highlighting_rules)
+        # 추적 결과에 싣지 않은 컬럼(BinaryData 등)은 상세 보기/저장 시 원본에서 행 번호로 가져옵니다.
+        self._fetch_rows = None
+        if row_fetcher is not None:
+            self.model.set_row_fetcher(*row_fetcher)
+            self._fetch_rows = row_fetcher[0]
+        self.log_viewer = BaseLogViewerWidget(self.controller, model=self.model, parent=self)
+        self.filter_input.textChanged.connect(self.log_viewer.set_filter_fixed_string)
+        splitter.addWidget(self.log_viewer)
+        splitter.setSizes([220, 980])
+        main_layout.addWidget(splitter)
+
+        # ID별 그룹은 combined_data의 행 위치 배열로만 보관합니다. (선택 시 복사 없이 뷰만 전환)
+        indices = combined_data.groupby("TraceID", sort=False).indices
+        self._row_ids = controller.row_ids(combined_data.index)
+        self._groups = {tid: indices[tid] for tid in combined_data["TraceID"].unique()}
+        self.populate_id_list()
+
+    def populate_id_list(self):
+        all_item = QListWidgetItem(f"All IDs ({len(self.combined_data):,})")
+        all_item.setData(Qt.ItemDataRole.UserRole, ALL_IDS_KEY)
+        self.id_list.addItem(all_item)
+        for tid, rows in self._groups.items():
+            item = QListWidgetItem(f"{tid} ({len(rows):,})")
+            item.setData(Qt.ItemDataRole.UserRole, tid)
+            self.id_list.addItem(item)
+        self.id_list.setCurrentRow(0)
+
+    def on_id_selected(self, current, previous=None):
+        if current is None:
+            return
+        tid = current.data(Qt.ItemDataRole.UserRole)
+        rows = None if tid is ALL_IDS_KEY else self._groups.get(tid)
+        self.model.set_view(self.combined_data, rows, row_ids=self._row_ids)
+
+    def save_selected_csv(self):
+        """현재 선택된 그룹에서 필터링된 뷰의 데이터를 파일로 저장합니다."""
+        proxy = self.log_viewer.proxy_model
+        if proxy.rowCount() == 0:
+            QMessageBox.information(self, "Info", "There is no data to save.")
+            return
+        filepath, fmt = ExportProgressDialog.get_export_path(self, "Save Trace Group", "batch_trace_group.csv")
+        if filepath:
+            rows = proxy.source_rows()
+            batches = self.model.row_batches(rows, columns=self.model.all_column_names())
+            self._start_export(filepath, fmt, batches, len(rows))
+
+    def save_all_csv(self):
+        """모든 ID의 추적 결과를 TraceID 컬럼과 함께 하나의 파일로 저장합니다."""
+        filepath, fmt = ExportProgressDialog.get_export_path(self, "Export Batch Trace", "batch_trace_export.csv")
+        if filepath:
+            data, fetch_rows, columns = self.combined_data, self._fetch_rows, self.model.all_column_names()
+            # 무거운 컬럼은 배치마다 해당 행만 가져와 붙입니다. (전체 결과를 한 번에 복사하지 않음)
+            batches = (
+                attach_columns(data.iloc[start : start + EXPORT_BATCH_ROWS], fetch_rows, columns)
+                for start in range(0, len(data), EXPORT_BATCH_ROWS)
+            )
+            self._start_export(filepath, fmt, batches, len(data))
+
+    def _start_export(self, filepath, fmt, batches, total_rows):
+        progress = ExportProgressDialog(filepath, fmt, batches, total_rows, self)
+        progress.export_finished.connect(self._on_export_finished)
+
+    def _on_export_finished(self, success, message):
+        if not success:
+            QMessageBox.critical(self, "Save Error", message)
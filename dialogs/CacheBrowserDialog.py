@@ -0,0 +1,49 @@
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QTableView, QLabel
+
+from dialogs.ui_components import create_section_label, create_action_button
+
+
+class CacheBrowserDialog(QDialog):
+    """로컬 캐시 전체 이력을 페이지 단위로 탐색하는 창 (PagedLogTableModel 사용)"""
+
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.setWindowTitle("Local Cache Browser")
+        self.setMinimumSize(1000, 600)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(create_section_label("Cached Logs"))
+
+        self.table_view = QTableView()
+        self.table_view.setAlternatingRowColors(True)
+        self.table_view.setModel(self.model)
+        # 수천만 행에서도 행 높이를 일정하게 유지해야 스크롤 계산이 가볍습니다.
+        self.table_view.verticalHeader().setDefaultSectionSize(22)
+        layout.addWidget(self.table_view)
+
+        bottom_layout = QHBoxLayout()
+        self.status_label = QLabel()
+        bottom_layout.addWidget(self.status_label)
+        bottom_layout.addStretch()
+        refresh_button = create_action_button("Refresh")
+        refresh_button.clicked.connect(self.refresh)
+        bottom_layout.addWidget(refresh_button)
+        close_button = create_action_button("Close", is_default=True)
+        close_button.clicked.connect(self.accept)
+        bottom_layout.addWidget(close_button)
+        layout.addLayout(bottom_layout)
+
+        self.table_view.verticalScrollBar().valueChanged.connect(self._update_status)
+        self._update_status()
+
+    def refresh(self):
+        self.model.refresh()
+        self._update_status()
+
+    def _update_status(self, *_):
+        self.status_label.setText(
+            f"{self.model.rowCount():,} rows in cache  |  "
+            f"{self.model.cached_page_count()}/{self.model.max_pages} pages in memory "
+            f"({self.model.page_rows:,} rows per page)"
+        )
@@ -76,7 +76,8 @@ class ConditionWidget(QWidget):
             operators = ["is after", "is before", "is between"]
             self.operator_combo.addItems(operators)
         else:
-            operators = ["Contains", "Does Not Contain", "Equals", "Not Equals", "Matches Regex"]
+            operators = ["Contains", "Does Not Contain", "Equals", "Not Equals", "Matches Regex",
+                         "<", "<=", ">", ">=", "Between", "In List"]
             self.operator_combo.addItems(operators)
             
     def _on_operator_changed(self, operator):
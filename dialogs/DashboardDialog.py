@@ -1,6 +1,5 @@
 # shinguhan/mylogmaster/myLogMaster-main/dialogs/DashboardDialog.py
 
-import pandas as pd
 from PySide6.QtWidgets import QDialog, QGridLayout
 from PySide6.QtCore import QTimer
 # ✅ QWebEngineView는 PySide6에 기본 포함되어 있습니다.
@@ -9,7 +8,8 @@ import plotly.express as px
 from plotly.graph_objects import FigureWidget
 
 class DashboardDialog(QDialog):
-    def __init__(self, initial_data, parent=None):
+    def __init__(self, count_by, parent=None):
+        """count_by(column, limit=None)는 컬럼 값별 행 수를 [column, 'count'] DataFrame으로 반환합니다."""
         super().__init__(parent)
         self.setWindowTitle("Real-time Dashboard")
         self.setGeometry(150, 150, 1000, 700)
@@ -17,15 +17,13 @@ class DashboardDialog(QDialog):
 
         # 이 변수는 이제 QWebEngineView 위젯들을 저장합니다.
         self.web_views = {}
-        
-        # ✅ 1. 마지막으로 차트를 그렸던 데이터를 저장할 변수 추가
-        self.last_rendered_data = None
-        self.data_to_update = initial_data
-        
+
+        self.count_by = count_by
+        # 마지막으로 차트를 그렸던 집계 결과 (전체 데이터 대신 작은 집계표만 비교합니다)
+        self.last_rendered_counts = {}
+        self._dirty = True
+
         self._create_chart_views()
-        
-        # 업데이트가 필요한 데이터를 저장할 변수
-        self.data_to_update = initial_data
 
         # 성능을 위한 업데이트 타이머
         self.update_timer = QTimer(self)
@@ -44,34 +42,35 @@ class DashboardDialog(QDialog):
         # 대화상자가 열리자마자 차트를 한번 그려줍니다.
         self._perform_update()
 
-    def update_dashboard(self, new_data):
-        """컨트롤러에서 새로운 데이터를 받아 저장하는 공개 메소드입니다."""
-        self.data_to_update = new_data
+    def update_dashboard(self):
+        """데이터가 바뀌었음을 알립니다. 다음 타이머 주기에 집계를 다시 받아 옵니다."""
+        self._dirty = True
 
-    def _perform_update(self):
-        """타이머가 호출하여 차트를 업데이트합니다. 데이터가 변경됐을 때만 다시 그립니다."""
-        if self.data_to_update is None or self.data_to_update.empty:
-            return
+    def _changed(self, key, counts):
+        # 집계 결과가 마지막으로 그린 것과 같으면 다시 그리지 않습니다. (깜빡임 방지)
+        last = self.last_rendered_counts.get(key)
+        if last is not None and counts.equals(last):
+            return False
+        self.last_rendered_counts[key] = counts
+        return True
 
-        # ✅ 2. 현재 데이터와 마지막으로 그렸던 데이터가 동일하면, 아무것도 하지 않고 반환 (깜빡임 방지)
-        if self.data_to_update.equals(self.last_rendered_data):
+    def _perform_update(self):
+        """타이머가 호출하여 차트를 업데이트합니다. 집계가 바뀌었을 때만 다시 그립니다."""
+        if not self._dirty:
             return
-        
-        df = self.data_to_update
-        # 마지막으로 그린 데이터를 현재 데이터로 업데이트
-        self.last_rendered_data = df.copy()
-        
-        print(f"Dashboard updating with {len(df)} rows...")
+        self._dirty = False
 
         # --- Category 파이 차트 ---
-        category_counts = df['Category'].value_counts().reset_index()
-        fig_cat = px.pie(category_counts, names='Category', values='count', title="Log Counts by Category")
-        self.web_views['by_category'].setHtml(fig_cat.to_html(include_plotlyjs='cdn'))
+        category_counts = self.count_by('Category')
+        if not category_counts.empty and self._changed('by_category', category_counts):
+            fig_cat = px.pie(category_counts, names='Category', values='count', title="Log Counts by Category")
+            self.web_views['by_category'].setHtml(fig_cat.to_html(include_plotlyjs='cdn'))
 
         # --- DeviceID 바 차트 ---
-        device_counts = df['DeviceID'].value_counts().reset_index().head(10)
-        fig_dev = px.bar(device_counts, x='DeviceID', y='count', title="Log Counts by DeviceID (Top 10)")
-        self.web_views['by_device'].setHtml(fig_dev.to_html(include_plotlyjs='cdn'))
+        device_counts = self.count_by('DeviceID', limit=10)
+        if not device_counts.empty and self._changed('by_device', device_counts):
+            fig_dev = px.bar(device_counts, x='DeviceID', y='count', title="Log Counts by DeviceID (Top 10)")
+            self.web_views['by_device'].setHtml(fig_dev.to_html(include_plotlyjs='cdn'))
 
     # ✅ 3. 타이머를 제어하는 새로운 메소드들 추가
     def start_updates(self):
@@ -0,0 +1,76 @@
+import os
+
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import QFileDialog, QProgressDialog
+
+from utils.export_worker import ExportWorker
+from utils.export_writer import export_format_for, file_dialog_filter
+
+
+class ExportProgressDialog(QProgressDialog):
+    """
+    보이는 행들을 백그라운드(ExportWorker)에서 파일로 내보내며 진행률을 보여 주는 창입니다.
+    모달이 아니므로 내보내는 동안에도 로그 뷰를 계속 사용할 수 있습니다.
+    """
+    export_finished = Signal(bool, str)  # (성공 여부, 메시지). 취소하면 보내지 않습니다.
+
+    def __init__(self, path, fmt, batches, total_rows, parent=None):
+        super().__init__(
+            f"Exporting {total_rows:,} rows to {os.path.basename(path)}...",
+            "Cancel",
+            0,
+            max(total_rows, 1),
+            parent,
+        )
+        self.setWindowTitle("Export")
+        self.setWindowModality(Qt.WindowModality.NonModal)
+        self.setMinimumDuration(300)
+        self.setAutoClose(False)
+        self.setAutoReset(False)
+        self._done = False
+
+        self.worker = ExportWorker(path, fmt, batches, total_rows)
+        self.worker.progress.connect(self._on_progress)
+        self.worker.result_ready.connect(self._on_result)
+        self.worker.error.connect(self._on_error)
+        self.canceled.connect(self._on_canceled)
+        self.worker.start()
+
+    @staticmethod
+    def get_export_path(parent, caption, default_name):
+        """저장 대화상자로 내보낼 (경로, 형식)을 묻습니다. 취소하면 (None, None)을 반환합니다."""
+        filepath, selected_filter = QFileDialog.getSaveFileName(
+            parent, caption, default_name, file_dialog_filter()
+        )
+        if not filepath:
+            return None, None
+        fmt, filepath = export_format_for(filepath, selected_filter)
+        return filepath, fmt
+
+    def _on_progress(self, written, total):
+        if not self._done:
+            self.setValue(min(written, self.maximum()))
+
+    def _finish(self, success, message):
+        self._done = True
+        self.export_finished.emit(success, message)
+        self.close()
+        self.deleteLater()
+
+    def _on_result(self, path, rows, elapsed):
+        self._finish(
+            True,
+            f"Successfully saved {rows:,} rows to {os.path.basename(path)} ({elapsed:.1f}s)",
+        )
+
+    def _on_error(self, message):
+        self._finish(False, f"Could not save file: {message}")
+
+    def _on_canceled(self):
+        # 창을 닫을 때도 canceled가 오므로, 이미 끝난 내보내기는 무시합니다.
+        # 취소된 내보내기는 워커가 쓰다 만 파일을 지우며, 결과를 알리지 않습니다.
+        if self._done:
+            return
+        self._done = True
+        self.worker.cancel()
+        self.deleteLater()
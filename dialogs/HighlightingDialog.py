@@ -89,7 +89,12 @@ class HighlightingDialog(QDialog):
         add_condition_button = create_action_button("+ Add Condition")
         add_condition_button.setStyleSheet("padding: 5px 10px;")
         add_condition_button.clicked.connect(self.add_condition_widget_action)
-        right_layout.addWidget(add_condition_button, 0, Qt.AlignmentFlag.AlignLeft); right_layout.addSpacing(20)
+        right_layout.addWidget(add_condition_button, 0, Qt.AlignmentFlag.AlignLeft); right_layout.addSpacing(10)
+
+        right_layout.addWidget(create_section_label("Query (optional, overrides conditions)"))
+        self.query_edit = QLineEdit()
+        self.query_edit.setPlaceholderText('e.g. cat:Com AND dev:J1FCNV* AND ascii~"CARRIER.*"')
+        right_layout.addWidget(self.query_edit); right_layout.addSpacing(20)
         
         right_layout.addWidget(create_section_label("Formatting"))
         format_frame = QFrame(); format_frame.setFrameShape(QFrame.Shape.StyledPanel)
@@ -133,6 +138,7 @@ class HighlightingDialog(QDialog):
         self.enabled_check.setChecked(rule.get("enabled", True))
         self.fg_button.set_color(rule.get("foreground"))
         self.bg_button.set_color(rule.get("background"))
+        self.query_edit.setText(rule.get("query", ""))
         self.rebuild_condition_widgets(rule)
         self._loading_rule = False
 
@@ -148,6 +154,7 @@ class HighlightingDialog(QDialog):
     def connect_editors(self):
         self.name_edit.textChanged.connect(self.update_rule_data)
         self.enabled_check.stateChanged.connect(self.update_rule_data)
+        self.query_edit.textChanged.connect(self.update_rule_data)
 
     def rebuild_condition_widgets(self, rule):
         while self.conditions_layout.count():
@@ -178,6 +185,7 @@ class HighlightingDialog(QDialog):
         rule = self.rules[row]
         rule['name'] = self.name_edit.text()
         rule['enabled'] = self.enabled_check.isChecked()
+        rule['query'] = self.query_edit.text().strip()
         self.current_item.setText(rule['name'])
         
         # 💥 변경점: for 루프를 리스트 컴프리헨션으로 변경
@@ -4,12 +4,15 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
                                QListWidget, QFrame, QLabel,
                                QDateTimeEdit, QMessageBox, QWidget, QLineEdit,
                                QTreeView, QMenu, QInputDialog, QRadioButton,
-                               QButtonGroup, QComboBox)
+                               QButtonGroup, QComboBox, QCheckBox)
 from PySide6.QtGui import QStandardItemModel, QStandardItem
 from PySide6.QtCore import QDateTime, Qt
 from .ui_components import create_section_label, create_separator, create_toggle_button, create_action_button
+from utils.query_language import QuerySyntaxError, check_time_values, parse_query
 
 QUERY_PRESETS_FILE = 'query_presets.json'
+RULE_OPERATORS = ["Contains", "Does Not Contain", "Equals", "Not Equals", "Matches Regex",
+                  "<", "<=", ">", ">=", "Between", "In List", "Before", "After"]
 
 class QueryConditionsDialog(QDialog):
     def __init__(self, column_names, query_templates, parent=None):
@@ -49,6 +52,10 @@ class QueryConditionsDialog(QDialog):
         time_layout.setContentsMargins(0, 0, 0, 0)
         time_layout.setSpacing(15)
         
+        # 체크 시 From/To 구간이 'Between' 시간 규칙으로 필터에 추가됩니다.
+        self.time_filter_checkbox = QCheckBox("Apply")
+        time_layout.addWidget(self.time_filter_checkbox)
+        
         # 시작 시간
         time_layout.addWidget(QLabel("From:"))
         self.start_time_edit = QDateTimeEdit(QDateTime.currentDateTime().addDays(-1))
@@ -78,6 +85,11 @@ class QueryConditionsDialog(QDialog):
         cond_label = create_section_label("🔍 Filter Conditions (Optional)")
         cond_label.setStyleSheet("font-weight: bold; font-size: 12pt;")
         condition_section.addWidget(cond_label)
+
+        # 텍스트 쿼리 (입력하면 아래 트리 조건 대신 사용)
+        self.query_edit = QLineEdit()
+        self.query_edit.setPlaceholderText('Text query, e.g. cat:Com AND dev:J1FCNV* AND ascii~"CARRIER.*"  (overrides rules below)')
+        condition_section.addWidget(self.query_edit)
         
         # 트리 뷰
         self.tree_model = QStandardItemModel()
@@ -171,8 +183,7 @@ class QueryConditionsDialog(QDialog):
             parent_item = self.tree_model.invisibleRootItem().child(0)
         
         new_rule_data = {"type": "rule", "column": self.column_names[0], "operator": "Contains", "value": ""}
-        rule_text = f"{new_rule_data['column']} {new_rule_data['operator']} '{new_rule_data['value']}'"
-        item = QStandardItem(rule_text)
+        item = QStandardItem(self._format_rule_text(new_rule_data))
         item.setData(new_rule_data, Qt.ItemDataRole.UserRole)
         parent_item.appendRow(item)
         self.tree_view.expandAll()
@@ -192,8 +203,9 @@ class QueryConditionsDialog(QDialog):
         layout = QVBoxLayout(editor_dialog)
         
         col_combo = QComboBox(); col_combo.addItems(self.column_names); col_combo.setCurrentText(item_data.get("column"))
-        op_combo = QComboBox(); op_combo.addItems(["Contains", "Does Not Contain", "Equals", "Not Equals", "Matches Regex"]); op_combo.setCurrentText(item_data.get("operator"))
-        val_edit = QLineEdit(item_data.get("value"))
+        op_combo = QComboBox(); op_combo.addItems(RULE_OPERATORS); op_combo.setCurrentText(item_data.get("operator"))
+        val_edit = QLineEdit(self._format_rule_value(item_data.get("value")))
+        val_edit.setPlaceholderText("Between: 1 ~ 3 (or date ~ date), In List: a, b, c")
         
         button_box = QHBoxLayout()
         ok_btn = create_action_button("OK", is_default=True)
@@ -209,10 +221,22 @@ class QueryConditionsDialog(QDialog):
         
         if editor_dialog.exec():
             new_data = {"type": "rule", "column": col_combo.currentText(), "operator": op_combo.currentText(), "value": val_edit.text()}
-            new_text = f"{new_data['column']} {new_data['operator']} '{new_data['value']}'"
-            item.setText(new_text)
+            item.setText(self._format_rule_text(new_data))
             item.setData(new_data, Qt.ItemDataRole.UserRole)
 
+    def _format_rule_value(self, value):
+        if isinstance(value, (list, tuple)):
+            return " ~ ".join(str(v) for v in value)
+        return value or ""
+
+    def _format_rule_text(self, rule):
+        return f"{rule.get('column','')} {rule.get('operator','')} '{self._format_rule_value(rule.get('value'))}'"
+
+    def set_time_range(self, start, end):
+        """From/To 편집기를 주어진 시간(datetime)으로 설정합니다. (로드된 로그의 범위 등)"""
+        self.start_time_edit.setDateTime(QDateTime(start))
+        self.end_time_edit.setDateTime(QDateTime(end))
+
     def build_data_from_tree(self, item):
         item_data = item.data(Qt.ItemDataRole.UserRole)
         if not item_data: return None
@@ -226,12 +250,30 @@ class QueryConditionsDialog(QDialog):
             return item_data if item_data.get('value') else None
 
     def get_conditions(self):
-        """파일 모드 전용 조건 반환 - apply_advanced_filter 형식"""
-        root_item = self.tree_model.invisibleRootItem().child(0)
-        filter_data = self.build_data_from_tree(root_item) if root_item else None
+        """파일 모드 전용 조건 반환 - apply_advanced_filter 형식 (텍스트 쿼리 문법 오류나 잘못된 시간 값이면 QuerySyntaxError)"""
+        query_text = self.query_edit.text().strip()
+        if query_text:
+            filter_data = parse_query(query_text)
+        else:
+            root_item = self.tree_model.invisibleRootItem().child(0)
+            filter_data = self.build_data_from_tree(root_item) if root_item else None
+        
+        if self.time_filter_checkbox.isChecked():
+            time_rule = {
+                "type": "rule", "column": "SystemDate", "operator": "Between",
+                "value": [self.start_time_edit.dateTime().toString(Qt.DateFormat.ISODate),
+                          self.end_time_edit.dateTime().toString(Qt.DateFormat.ISODate)]
+            }
+            # 시간 규칙을 최상위 AND 그룹에 두어 컨트롤러가 시간 인덱스로 먼저 구간을 자를 수 있게 합니다.
+            if filter_data and filter_data.get("logic") == "AND":
+                filter_data = {**filter_data, "rules": [time_rule] + filter_data["rules"]}
+            else:
+                filter_data = {"logic": "AND", "rules": [time_rule] + ([filter_data] if filter_data else [])}
         
         # apply_advanced_filter()가 기대하는 형식: rules 키 필요
         if filter_data:
+            # 조건 트리로 만든 시간 규칙도 텍스트 쿼리와 같이 여기서 값을 확인합니다.
+            check_time_values(filter_data)
             return filter_data
         else:
             # 빈 필터 = 모든 데이터 표시
@@ -264,13 +306,16 @@ class QueryConditionsDialog(QDialog):
             if "logic" in rule:
                 self.build_tree_from_data(item, rule)
             else:
-                rule_text = f"{rule.get('column','')} {rule.get('operator','')} '{rule.get('value','')}'"
-                rule_item = QStandardItem(rule_text)
+                rule_item = QStandardItem(self._format_rule_text(rule))
                 rule_item.setData({"type": "rule", **rule}, Qt.ItemDataRole.UserRole)
                 item.appendRow(rule_item)
 
     def save_current_preset(self):
-        conditions = self.get_conditions()
+        try:
+            conditions = self.get_conditions()
+        except QuerySyntaxError as e:
+            QMessageBox.warning(self, "Query Syntax Error", str(e))
+            return
         preset_name, ok = QInputDialog.getText(self, "Save Preset", "Enter a name for this preset:", text=self.current_preset_name or "")
         if ok and preset_name:
             self.presets[preset_name] = conditions
@@ -304,7 +349,11 @@ class QueryConditionsDialog(QDialog):
             QMessageBox.critical(self, "Error", f"Could not save presets: {e}")
 
     def accept(self):
-        self.get_conditions()
+        try:
+            self.get_conditions()
+        except QuerySyntaxError as e:
+            QMessageBox.warning(self, "Query Syntax Error", str(e))
+            return
         super().accept()
 
     def populate_preset_list(self):
@@ -10,7 +10,7 @@ from models.LogTableModel import LogTableModel
 from widgets.base_log_viewer import BaseLogViewerWidget
 
 class TraceDialog(QDialog):
-    def __init__(self, data, trace_id, highlighting_rules, controller, parent=None):
+    def __init__(self, data, trace_id, highlighting_rules, controller, parent=None, row_fetcher=None):
         super().__init__(parent)
         self.setWindowTitle(f"Event Trace for ID: {trace_id}")
         self.setGeometry(200, 200, 1100, 700)
@@ -24,7 +24,7 @@ class TraceDialog(QDialog):
         top_layout = QHBoxLayout()
         self.filter_input = QLineEdit()
         self.filter_input.setPlaceholderText("Filter traced logs...")
-        save_button = QPushButton("Save View to CSV")
+        save_button = QPushButton("Save View...")
         save_button.clicked.connect(self.save_filtered_csv)
         top_layout.addWidget(self.filter_input)
         top_layout.addWidget(save_button)
@@ -33,8 +33,12 @@ class TraceDialog(QDialog):
         # 💥💥💥 수정된 부분 💥💥💥
         # 1. 이 다이얼로그 전용 LogTableModel을 생성합니다.
         self.model = LogTableModel()
-        self.model.update_data(data)
+        # 추적 결과의 행에도 원본 로그의 고유 번호를 붙여, 메인 뷰의 같은 행으로 바로 이동할 수 있게 합니다.
+        self.model.set_view(data, row_ids=controller.row_ids(data.index))
         self.model.set_highlighting_rules(highlighting_rules)
+        # 추적 결과에 싣지 않은 컬럼(BinaryData 등)은 상세 보기/저장 시 원본에서 행 번호로 가져옵니다.
+        if row_fetcher is not None:
+            self.model.set_row_fetcher(*row_fetcher)
 
         # 2. BaseLogViewerWidget을 생성할 때, 위에서 만든 전용 모델을 `model=` 인자로 전달합니다.
         #    이렇게 하면 BaseLogViewerWidget이 MainWindow의 데이터가 아닌, 
@@ -42,31 +46,28 @@ class TraceDialog(QDialog):
         self.log_viewer = BaseLogViewerWidget(self.controller, model=self.model, parent=self)
         
         # 3. BaseLogViewerWidget의 필터 기능에 연결합니다.
-        self.filter_input.textChanged.connect(self.log_viewer.proxy_model.setFilterFixedString)
+        self.filter_input.textChanged.connect(self.log_viewer.set_filter_fixed_string)
         
         main_layout.addWidget(self.log_viewer)
         self.setLayout(main_layout)
 
     def save_filtered_csv(self):
-        """현재 필터링된 뷰의 데이터를 CSV 파일로 저장합니다."""
-        from PySide6.QtWidgets import QFileDialog
-        
+        """현재 필터링된 뷰의 데이터를 파일(CSV/Parquet/Feather/Arrow)로 저장합니다."""
+        from dialogs.ExportProgressDialog import ExportProgressDialog
+
         # 프록시 모델을 통해 현재 보이는 행의 개수를 확인합니다.
         if self.log_viewer.proxy_model.rowCount() == 0:
             QMessageBox.information(self, "Info", "There is no data to save.")
             return
-            
-        filepath, _ = QFileDialog.getSaveFileName(self, "Save Filtered Log", "trace_export.csv", "CSV Files (*.csv)")
-        if filepath:
-            # 현재 proxy model에 보이는 데이터만 DataFrame으로 재구성
-            visible_rows_indices = [self.log_viewer.proxy_model.mapToSource(self.log_viewer.proxy_model.index(r, 0)).row() 
-                                    for r in range(self.log_viewer.proxy_model.rowCount())]
-            
-            # 원본 데이터(self.model)에서 보이는 행들만 선택
-            df_to_save = self.model._data.iloc[visible_rows_indices]
 
-            # 컨트롤러에 저장 요청
-            success, message = self.controller.save_log_to_csv(df_to_save, filepath)
-            if not success:
-                QMessageBox.critical(self, "Save Error", message)
+        filepath, fmt = ExportProgressDialog.get_export_path(self, "Save Filtered Log", "trace_export.csv")
+        if filepath:
+            # 프록시에 보이는 행 배열만 넘기고, 원본에서 배치 단위로 꺼내 백그라운드에서 씁니다.
+            rows = self.log_viewer.proxy_model.source_rows()
+            batches = self.model.row_batches(rows, columns=self.model.all_column_names())
+            progress = ExportProgressDialog(filepath, fmt, batches, len(rows), self)
+            progress.export_finished.connect(self._on_export_finished)
 
+    def _on_export_finished(self, success, message):
+        if not success:
+            QMessageBox.critical(self, "Save Error", message)
@@ -75,6 +75,9 @@ class MainWindow(QMainWindow):
 
         self.setStatusBar(QStatusBar())
         self.statusBar().showMessage("Ready.")
+        # 실시간 수신 중 실제 화면 갱신 빈도 (RenderScheduler가 부하에 따라 조절)
+        self.ui_rate_label = QLabel()
+        self.statusBar().addPermanentWidget(self.ui_rate_label)
 
     def start_db_connection(self):
         if self._is_fetching:
@@ -173,12 +176,23 @@ class MainWindow(QMainWindow):
         self.controller.fetch_progress.connect(self.on_fetch_progress)
         self.controller.fetch_completed.connect(self.on_fetch_complete)
         self.controller.row_count_updated.connect(self._update_row_count_status)
+        self.controller.render_scheduler.stats_updated.connect(self._update_ui_rate)
         self.controller.fetch_error.connect(self.on_fetch_error)
 
         self.db_connect_button.clicked.connect(self.start_db_connection)
         self.filter_input.textChanged.connect(self.log_viewer.set_filter_fixed_string)
+        self.log_viewer.filter_finished.connect(self._show_filter_status)
         self.log_viewer.trace_requested.connect(self.start_event_trace)
 
+    def _show_filter_status(self, pattern, match_count, elapsed):
+        if not pattern:
+            self.statusBar().showMessage(f"Filter cleared. {match_count:,} rows.")
+            return
+        total = self.controller.source_model.rowCount()
+        self.statusBar().showMessage(
+            f"Filter '{pattern}': {match_count:,} of {total:,} rows matched in {elapsed * 1000:,.0f} ms."
+        )
+
     def _create_menu(self):
         menu_bar = self.menuBar()
         file_menu = menu_bar.addMenu("&File")
@@ -222,6 +236,9 @@ class MainWindow(QMainWindow):
         detailed_trace_action = QAction("Detailed Carrier Trace...", self)
         detailed_trace_action.triggered.connect(self.open_detailed_trace_dialog)
         self.tools_menu.addAction(detailed_trace_action)
+        batch_trace_action = QAction("Batch Trace (Multiple IDs)...", self)
+        batch_trace_action.triggered.connect(self.open_batch_trace_dialog)
+        self.tools_menu.addAction(batch_trace_action)
         self.tools_menu.addSeparator()
 
         query_builder_action = QAction("Advanced Filter...", self)
@@ -230,6 +247,13 @@ class MainWindow(QMainWindow):
         clear_filter_action = QAction("Clear Advanced Filter", self)
         clear_filter_action.triggered.connect(self.clear_advanced_filter)
         self.tools_menu.addAction(clear_filter_action)
+        self.back_view_action = QAction("Back to Previous Filter", self)
+        self.back_view_action.setShortcut("Alt+Left")
+        self.back_view_action.triggered.connect(self.go_back_view)
+        self.tools_menu.addAction(self.back_view_action)
+        self.tools_menu.aboutToShow.connect(
+            lambda: self.back_view_action.setEnabled(self.controller.can_go_back())
+        )
         self.tools_menu.addSeparator()
 
         self.scenario_menu = self.tools_menu.addMenu("Run Scenario Validation")
@@ -254,6 +278,9 @@ class MainWindow(QMainWindow):
         history_action = QAction("Validation History...", self)
         history_action.triggered.connect(self.open_history_browser)
         self.tools_menu.addAction(history_action)
+        cache_browser_action = QAction("Browse Local Cache...", self)
+        cache_browser_action.triggered.connect(self.open_cache_browser)
+        self.tools_menu.addAction(cache_browser_action)
 
         help_menu = menu_bar.addMenu("&Help")
         about_action = QAction("&About...", self)
@@ -290,7 +317,7 @@ class MainWindow(QMainWindow):
         self.log_viewer.proxy_model.setSourceModel(source_model)
         self.log_viewer.log_table_model = source_model
 
-        is_data_loaded = source_model is not None and not source_model._data.empty
+        is_data_loaded = source_model is not None and not source_model.is_empty()
         self.save_action.setEnabled(is_data_loaded)
 
         if self.auto_scroll_checkbox.isChecked():
@@ -322,10 +349,24 @@ class MainWindow(QMainWindow):
             finally:
                 QApplication.restoreOverrideCursor()
 
+    def _projected_columns(self):
+        """추적 결과 등 새로 만드는 뷰에 실을 컬럼: 메인 뷰에 보이는 컬럼에서 무거운 컬럼을 뺀 목록"""
+        from utils.column_projection import light_columns
+
+        all_columns = self.controller.source_model.column_names()
+        visible_columns = [
+            col
+            for i, col in enumerate(all_columns)
+            if not self.log_viewer.tableView.isColumnHidden(i)
+        ]
+        return light_columns(all_columns, visible_columns)
+
     def start_event_trace(self, trace_id, additional_filter=None):
         from dialogs.TraceDialog import TraceDialog  # Deferred import
 
-        trace_data = self.controller.get_trace_data(trace_id, additional_filter)
+        trace_data = self.controller.get_trace_data(
+            trace_id, additional_filter, columns=self._projected_columns()
+        )
         if trace_data.empty:
             msg = f"No logs found containing ID: '{trace_id}'"
             if additional_filter:
@@ -338,8 +379,16 @@ class MainWindow(QMainWindow):
         if additional_filter:
             title = f"{trace_id} (Filter: {additional_filter})"
 
-        trace_dialog = TraceDialog(trace_data, title, rules, self.controller, self)
+        trace_dialog = TraceDialog(
+            trace_data,
+            title,
+            rules,
+            self.controller,
+            self,
+            row_fetcher=self.controller.make_row_fetcher(),
+        )
 
+        trace_dialog.log_viewer.locate_requested.connect(self.highlight_log_row)
         trace_dialog.finished.connect(
             lambda: self.open_trace_dialogs.remove(trace_dialog)
         )
@@ -347,7 +396,7 @@ class MainWindow(QMainWindow):
         trace_dialog.show()
 
     def run_scenario_validation(self, scenario_name=None):
-        if self.controller.source_model._data.empty:
+        if self.controller.source_model.is_empty():
             QMessageBox.information(self, "Info", "Please load a log file first.")
             return
 
@@ -386,17 +435,21 @@ class MainWindow(QMainWindow):
         dialog.exec()
 
     def open_query_builder(self):
-        if self.controller.source_model._data.empty:
+        if self.controller.source_model.is_empty():
             QMessageBox.information(self, "Info", "Please load a log file first.")
             return
 
-        column_names = self.controller.source_model._data.columns.tolist()
+        column_names = self.controller.source_model.column_names()
         query_templates = self.controller.load_query_templates()
         from dialogs.QueryConditionsDialog import (
             QueryConditionsDialog,
         )  # Deferred import
+        from utils.query_language import QuerySyntaxError
 
         dialog = QueryConditionsDialog(column_names, query_templates, self)
+        time_bounds = self.controller.get_time_bounds()
+        if time_bounds:
+            dialog.set_time_range(*time_bounds)
 
         if dialog.exec():
             query_data = dialog.get_conditions()
@@ -407,6 +460,8 @@ class MainWindow(QMainWindow):
                 self.statusBar().showMessage(
                     f"Filter applied. Showing {self.log_viewer.proxy_model.rowCount():,} of {self.controller.source_model.rowCount():,} rows."
                 )
+            except QuerySyntaxError as e:
+                QMessageBox.warning(self, "Query Syntax Error", str(e))
             finally:
                 QApplication.restoreOverrideCursor()
 
@@ -418,20 +473,33 @@ class MainWindow(QMainWindow):
             )
         is_data_loaded = (
             self.controller.source_model is not None
-            and not self.controller.source_model._data.empty
+            and not self.controller.source_model.is_empty()
         )
         self.save_action.setEnabled(is_data_loaded)
 
+    def go_back_view(self):
+        if not self.controller.go_back_view():
+            return
+        suffix = " (advanced filter active)" if self.controller.active_filter else ""
+        self.statusBar().showMessage(
+            f"Showing {self.controller.source_model.rowCount():,} rows{suffix}."
+        )
+
     def show_dashboard(self):
-        if self.controller.source_model._data.empty:
+        if self.controller.source_model.is_empty():
             QMessageBox.information(self, "Info", "Please load a log file first.")
             return
 
         from dialogs.DashboardDialog import DashboardDialog  # Deferred import
 
         if self.controller.dashboard_dialog is None:
+            controller = self.controller
+            # 대시보드는 현재 고급 필터가 적용된 행의 값별 개수를 컨트롤러(내장 엔진이면 GROUP BY)에서 받습니다.
             self.controller.dashboard_dialog = DashboardDialog(
-                self.controller.source_model._data, self
+                lambda column, limit=None: controller.count_by(
+                    column, controller.active_filter, limit
+                ),
+                self,
             )
             self.controller.dashboard_dialog.finished.connect(self._on_dashboard_closed)
 
@@ -440,11 +508,11 @@ class MainWindow(QMainWindow):
 
     def open_column_selection_dialog(self):
         source_model = self.controller.source_model
-        if source_model._data.empty:
+        if source_model.is_empty():
             QMessageBox.information(self, "Info", "Please load a log file first.")
             return
 
-        all_columns = source_model._data.columns.tolist()
+        all_columns = source_model.column_names()
         from dialogs.ColumnSelectionDialog import (
             ColumnSelectionDialog,
         )  # Deferred import
@@ -470,24 +538,24 @@ class MainWindow(QMainWindow):
         config = self.controller.get_config()
         visible_columns = config.get("visible_columns", [])
 
-        if visible_columns and not source_model._data.empty:
-            all_columns = source_model._data.columns.tolist()
+        if visible_columns and not source_model.is_empty():
+            all_columns = source_model.column_names()
             for i, col_name in enumerate(all_columns):
                 self.log_viewer.tableView.setColumnHidden(
                     i, col_name not in visible_columns
                 )
 
-        if not source_model._data.empty:
+        if not source_model.is_empty():
             for i in range(source_model.columnCount()):
                 self.log_viewer.tableView.setColumnWidth(i, 80)
 
     def save_settings(self):
         source_model = self.controller.source_model
-        if source_model is None or source_model._data.empty:
+        if source_model is None or source_model.is_empty():
             self.controller.save_config()
             return
 
-        all_columns = source_model._data.columns.tolist()
+        all_columns = source_model.column_names()
         visible_columns = [
             col
             for i, col in enumerate(all_columns)
@@ -498,22 +566,18 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         self.save_settings()
+        self.controller.close_oracle_pools()
         event.accept()
 
     def open_script_editor(self):
         source_model = self.controller.source_model
-        if source_model._data.empty:
+        if source_model.is_empty():
             QMessageBox.information(self, "Info", "Please load a log file first.")
             return
 
-        current_view_df = source_model._data.iloc[
-            [
-                self.log_viewer.proxy_model.mapToSource(
-                    self.log_viewer.proxy_model.index(r, 0)
-                ).row()
-                for r in range(self.log_viewer.proxy_model.rowCount())
-            ]
-        ]
+        current_view_df = source_model.get_rows_frame(
+            self.log_viewer.proxy_model.source_rows()
+        )
         from dialogs.ScriptEditorDialog import ScriptEditorDialog  # Deferred import
 
         dialog = ScriptEditorDialog(self)
@@ -549,14 +613,22 @@ class MainWindow(QMainWindow):
             self.db_connect_button.setVisible(False)
             self.filter_input.setVisible(True)
             self.auto_scroll_checkbox.setVisible(False)
+            self.ui_rate_label.setVisible(False)
             self.setWindowTitle("Log Analyzer - [File Mode]")
             self.statusBar().showMessage("Ready. Please open a log file.")
 
     def _update_row_count_status(self, row_count):
-        self.statusBar().showMessage(f"Receiving... {row_count:,} rows")
+        suffix = " (advanced filter active)" if self.controller.active_filter else ""
+        self.statusBar().showMessage(f"Receiving... {row_count:,} rows{suffix}")
         if self.auto_scroll_checkbox.isChecked():
             self.log_viewer.tableView.scrollToBottom()
 
+    def _update_ui_rate(self, rate, interval_ms, cost_ms):
+        self.ui_rate_label.setText(f"UI {rate:.1f} updates/s")
+        self.ui_rate_label.setToolTip(
+            f"Batch interval {interval_ms} ms, last update took {cost_ms:.1f} ms"
+        )
+
     def _on_dashboard_closed(self):
         self.controller.dashboard_dialog = None
 
@@ -571,7 +643,7 @@ class MainWindow(QMainWindow):
             )
 
     def open_highlighting_dialog(self):
-        if self.controller.source_model._data.empty:
+        if self.controller.source_model.is_empty():
             QMessageBox.information(self, "Info", "Please load data first.")
             return
 
@@ -582,7 +654,7 @@ class MainWindow(QMainWindow):
             self.highlighting_dialog.activateWindow()
             return
 
-        column_names = self.controller.source_model._data.columns.tolist()
+        column_names = self.controller.source_model.column_names()
         rules_data = self.controller.get_highlighting_rules()
         from dialogs.HighlightingDialog import HighlightingDialog  # Deferred import
 
@@ -594,56 +666,63 @@ class MainWindow(QMainWindow):
         self.highlighting_dialog.show()
 
     def save_log_file(self):
+        from dialogs.ExportProgressDialog import ExportProgressDialog  # Deferred import
+
         source_model = self.controller.source_model
         if source_model is None or self.log_viewer.proxy_model.rowCount() == 0:
             QMessageBox.information(self, "Info", "There is no data to save.")
             return
 
-        default_filename = "log_export.csv"
-        filepath, _ = QFileDialog.getSaveFileName(
-            self, "Save Log File", default_filename, "CSV Files (*.csv);;All Files (*)"
+        filepath, fmt = ExportProgressDialog.get_export_path(
+            self, "Save Log File", "log_export.csv"
         )
-
         if filepath:
-            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+            # 프록시의 행 배열을 그대로 넘기고, 파일 쓰기는 백그라운드에서 배치 단위로 합니다.
+            proxy_model = self.log_viewer.proxy_model
+            rows = proxy_model.source_rows()
+            batches = None
+            if proxy_model.is_identity():
+                # 검색/정렬 없이 고급 필터 결과를 그대로 보고 있으면 내장 엔진이 결과를 배치로 스트리밍합니다.
+                batches = self.controller.main_view_batches(source_model.column_names())
+            if batches is None:
+                batches = source_model.row_batches(rows)
+            progress = ExportProgressDialog(filepath, fmt, batches, len(rows), self)
+            progress.export_finished.connect(self._on_export_finished)
             self.statusBar().showMessage("Saving file...")
-            try:
-                visible_rows_indices = [
-                    self.log_viewer.proxy_model.mapToSource(
-                        self.log_viewer.proxy_model.index(r, 0)
-                    ).row()
-                    for r in range(self.log_viewer.proxy_model.rowCount())
-                ]
-                df_to_save = source_model._data.iloc[visible_rows_indices]
-                success, message = self.controller.save_log_to_csv(df_to_save, filepath)
-
-                if success:
-                    self.statusBar().showMessage(message)
-                else:
-                    QMessageBox.critical(self, "Save Error", message)
-            finally:
-                QApplication.restoreOverrideCursor()
 
-    def highlight_log_row(self, original_index):
+    def _on_export_finished(self, success, message):
+        if success:
+            self.statusBar().showMessage(message)
+        else:
+            self.statusBar().clearMessage()
+            QMessageBox.critical(self, "Save Error", message)
+
+    def highlight_log_row(self, row_id):
+        """로그 행 고유 번호(검증 결과, 추적 창 등)에 해당하는 행으로 메인 뷰를 이동하고 선택합니다."""
         source_model = self.controller.source_model
-        if not source_model or source_model._data.empty:
+        if not source_model or source_model.is_empty():
             return
 
         try:
-            model_row = source_model._data.index.get_loc(original_index)
-            proxy_index = self.log_viewer.proxy_model.mapFromSource(
-                source_model.index(model_row, 0)
+            model_row = source_model.find_row_by_id(row_id)
+        except KeyError:
+            self.statusBar().showMessage(
+                f"Log #{row_id} is not in the current view (filtered out or no longer loaded)."
             )
+            return
 
-            if proxy_index.isValid():
-                self.log_viewer.tableView.scrollTo(
-                    proxy_index, QTableView.ScrollHint.PositionAtCenter
-                )
-                self.log_viewer.tableView.selectRow(proxy_index.row())
-                self.activateWindow()
-        except KeyError:
-            print(
-                f"Could not find original index {original_index} in the current model."
+        proxy_index = self.log_viewer.proxy_model.mapFromSource(
+            source_model.index(model_row, 0)
+        )
+        if proxy_index.isValid():
+            self.log_viewer.tableView.scrollTo(
+                proxy_index, QTableView.ScrollHint.PositionAtCenter
+            )
+            self.log_viewer.tableView.selectRow(proxy_index.row())
+            self.activateWindow()
+        else:
+            self.statusBar().showMessage(
+                f"Log #{row_id} is hidden by the current search filter."
             )
 
     def open_history_browser(self):
@@ -658,6 +737,24 @@ class MainWindow(QMainWindow):
         history_browser.history_selected.connect(self.show_history_detail)
         history_browser.exec()
 
+    def open_cache_browser(self):
+        from dialogs.CacheBrowserDialog import CacheBrowserDialog  # Deferred import
+
+        model = self.controller.create_cache_browser_model(
+            columns=self._projected_columns() or None
+        )
+        if model is None:
+            QMessageBox.information(
+                self, "Info", "The local cache is only available in database mode."
+            )
+            return
+        if model.is_empty():
+            QMessageBox.information(self, "Info", "The local cache is empty.")
+            return
+
+        dialog = CacheBrowserDialog(model, self)
+        dialog.exec()
+
     def show_history_detail(self, run_id):
         QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
         try:
@@ -701,7 +798,9 @@ class MainWindow(QMainWindow):
 
             QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
             try:
-                trace_data = self.controller.get_carrier_move_scenario(**params)
+                trace_data = self.controller.get_carrier_move_scenario(
+                    **params, columns=self._projected_columns()
+                )
                 if trace_data.empty:
                     QMessageBox.information(
                         self,
@@ -718,9 +817,70 @@ class MainWindow(QMainWindow):
 
                 rules = self.controller.get_highlighting_rules()
                 trace_dialog = TraceDialog(
-                    trace_data, title, rules, self.controller, self
+                    trace_data,
+                    title,
+                    rules,
+                    self.controller,
+                    self,
+                    row_fetcher=self.controller.make_row_fetcher(),
+                )
+
+                trace_dialog.log_viewer.locate_requested.connect(
+                    self.highlight_log_row
+                )
+                trace_dialog.finished.connect(
+                    lambda: self.open_trace_dialogs.remove(trace_dialog)
+                )
+                self.open_trace_dialogs.append(trace_dialog)
+                trace_dialog.show()
+
+            finally:
+                QApplication.restoreOverrideCursor()
+
+    def open_batch_trace_dialog(self):
+        if self.controller.original_data.empty:
+            QMessageBox.information(self, "Info", "Please load a log file first.")
+            return
+
+        from dialogs.BatchTraceDialog import BatchTraceDialog  # Deferred import
+        from dialogs.BatchTraceResultDialog import (
+            BatchTraceResultDialog,
+        )  # Deferred import
+
+        dialog = BatchTraceDialog(self)
+        if dialog.exec():
+            params = dialog.get_trace_parameters()
+            if not params["trace_ids"]:
+                QMessageBox.warning(
+                    self, "Input Required", "Please enter at least one ID."
                 )
+                return
 
+            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+            try:
+                trace_data = self.controller.get_batch_trace_data(
+                    **params, columns=self._projected_columns()
+                )
+                if trace_data.empty:
+                    QMessageBox.information(
+                        self,
+                        "Trace Result",
+                        "No logs found for any of the given IDs.",
+                    )
+                    return
+
+                rules = self.controller.get_highlighting_rules()
+                trace_dialog = BatchTraceResultDialog(
+                    trace_data,
+                    rules,
+                    self.controller,
+                    self,
+                    row_fetcher=self.controller.make_row_fetcher(),
+                )
+
+                trace_dialog.log_viewer.locate_requested.connect(
+                    self.highlight_log_row
+                )
                 trace_dialog.finished.connect(
                     lambda: self.open_trace_dialogs.remove(trace_dialog)
                 )
@@ -1,62 +1,214 @@
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 from PySide6.QtCore import QAbstractTableModel, Qt, QModelIndex
 
 # ✅ 1. QColor를 더 안정적으로 참조하기 위해 QtGui 모듈 전체를 임포트합니다.
 from PySide6 import QtGui
 
+from utils.column_projection import attach_columns, take_columns
+from utils.export_writer import EXPORT_BATCH_ROWS
+from utils.highlight_rules import NO_STYLE, compute_style_indices
+from utils.ring_buffer import ColumnarRingBuffer
+from utils.search_text import SearchTextColumn, build_search_text, contains_mask
+from utils.sort_keys import native_sort_key, sort_permutation
+
+# 백그라운드 필터가 중단 요청을 확인하는 행 블록 크기
+FILTER_BLOCK_ROWS = 200000
+
+# 원형 버퍼에 함께 유지하는 파생 배열 이름
+_STYLE_ARRAY = "styles"
+_SEARCH_TEXT_ARRAY = "search_text"
+
+
+def _is_text_dtype(dtype):
+    return dtype == object or pd.api.types.is_string_dtype(dtype)
+
+
+def _text_of(value):
+    return value if type(value) is str else str(value)
+
+
+def _timestamp_text(value):
+    return str(pd.Timestamp(value))
+
+
+def _timedelta_text(value):
+    return str(pd.Timedelta(value))
+
+
+def _formatter_for(dtype):
+    """컬럼 dtype에 맞는 표시용 문자열 변환 함수 (str(df.iloc[r, c])와 같은 결과)"""
+    if _is_text_dtype(dtype):
+        return _text_of
+    if isinstance(dtype, np.dtype) and dtype.kind == "M":
+        return lru_cache(maxsize=4096)(_timestamp_text)
+    if isinstance(dtype, np.dtype) and dtype.kind == "m":
+        return lru_cache(maxsize=4096)(_timedelta_text)
+    if isinstance(dtype, np.dtype):
+        return lru_cache(maxsize=4096)(str)
+    return str
+
+
+def _search_text_values(df):
+    return build_search_text(df).to_numpy(dtype=object)
+
 
 class LogTableModel(QAbstractTableModel):
     def __init__(self, data=None, max_rows=100000):
         super().__init__()
-        self._data = data if data is not None else pd.DataFrame()
+        # 모델은 원본 DataFrame(_frame)을 복사하지 않고 참조하며,
+        # 필터된 뷰는 원본의 행 위치 배열(_rows)로만 표현합니다. (_rows가 None이면 전체 행)
+        self._frame = data if data is not None else pd.DataFrame()
+        self._rows = None
+        # 실시간 append가 시작되면 원본을 max_rows 크기의 원형 버퍼(_ring)로 옮겨 제자리에 추가합니다.
+        self._ring = None
+        self._ring_frame = None
+        self._ring_layout = None
+        self._view_frame = None
         self._highlighting_rules = []
         self.max_rows = max_rows
+        # 전체 컬럼 검색용 행별 텍스트. 데이터가 바뀔 때마다 data_version이 증가합니다.
+        self._search_text = SearchTextColumn()
+        self.data_version = 0
+        # 행 구성이 통째로 바뀔 때(set_view 등) 증가하는 버전과, 원형 버퍼에서 앞쪽으로 밀려난 누적 행 수.
+        # 백그라운드 필터 결과를 적용할 때 그 사이의 변경을 보정하는 데 사용합니다.
+        self.reset_version = 0
+        self.evicted_total = 0
+        # 정렬 캐시: 원본(DataFrame 또는 원형 버퍼의 data_version)별 컬럼 정렬 키와, data_version별 정렬 키 조합 -> 행 순서 배열
+        self._sort_key_cache = (None, None, {})
+        self._sort_cache = (None, {})
+        # 하이라이트 규칙별 QColor (배경, 글자)와, 원본 행마다 적용할 규칙 번호 배열 [배경, 글자] (없으면 -1).
+        # 스타일 배열은 처음 필요할 때 한 번 계산하고, append 시에는 새 행만 계산합니다.
+        self._rule_colors = []
+        self._styles = None
+        # 컬럼 번호 -> (값 배열, 문자열 변환 함수). DisplayRole은 이 배열을 직접 읽습니다.
+        self._column_cache = {}
+        # 모델에 싣지 않은 컬럼(무거운 컬럼 등)을 원본 행 라벨로 가져오는 함수와, 그렇게 가져올 수 있는 전체 컬럼 목록
+        self._row_fetcher = None
+        self._fetchable_columns = []
+        # 원본 행마다 붙은 고유 번호(uint64, 원형 버퍼 모드에서는 버퍼가 보관)와,
+        # 고유 번호 -> 뷰 행 번호 역매핑 캐시 ((reset_version, data_version), 최소 번호, 역매핑 배열)
+        self._base_ids = None
+        self._id_lookup = (None, 0, None)
+
+    @property
+    def _base(self):
+        """원본 DataFrame. 원형 버퍼 모드에서는 처음 요청될 때 만들어 다음 변경 때까지 재사용합니다."""
+        if self._ring is None:
+            return self._frame
+        if self._ring_frame is None:
+            self._ring_frame = self._ring.to_frame()
+        return self._ring_frame
+
+    @property
+    def _data(self):
+        """현재 뷰를 DataFrame으로 반환합니다. 필터된 뷰는 처음 요청될 때 한 번만 만들어집니다."""
+        if self._rows is None:
+            return self._base
+        if self._view_frame is None:
+            self._view_frame = self._base.iloc[self._rows]
+        return self._view_frame
+
+    def _base_row(self, row):
+        """뷰의 행 번호를 원본(_base)의 행 위치로 변환합니다."""
+        return row if self._rows is None else self._rows[row]
+
+    def _cell_position(self, row):
+        """뷰의 행 번호를 컬럼/스타일 배열의 위치로 변환합니다. (원형 버퍼 모드에서는 물리 위치)"""
+        if self._ring is not None:
+            return self._ring.physical(row)
+        return self._base_row(row)
+
+    def _column_labels(self):
+        return self._ring.columns if self._ring is not None else self._frame.columns
+
+    def is_empty(self):
+        return self.rowCount() == 0 or self.columnCount() == 0
+
+    def column_names(self):
+        return list(self._column_labels())
 
     def rowCount(self, parent=QModelIndex()):
-        return self._data.shape[0]
+        if self._ring is not None:
+            return len(self._ring)
+        if self._rows is not None:
+            return len(self._rows)
+        return self._frame.shape[0]
 
     def columnCount(self, parent=QModelIndex()):
-        return self._data.shape[1]
+        return len(self._column_labels())
 
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
         if not index.isValid():
             return None
 
+        # 가장 자주 요청되는 DisplayRole을 먼저 처리합니다.
+        if role == Qt.ItemDataRole.DisplayRole:
+            try:
+                values, to_text = self._column_values(index.column())
+                return to_text(values[self._cell_position(index.row())])
+            except IndexError:
+                return None
+
         if (
             role == Qt.ItemDataRole.BackgroundRole
             or role == Qt.ItemDataRole.ForegroundRole
         ):
+            if not self._highlighting_rules:
+                return None
             try:
-                row_data = self._data.iloc[index.row()]
-                for rule in self._highlighting_rules:
-                    if rule.get("enabled", False) and self.check_rule(row_data, rule):
-                        if role == Qt.ItemDataRole.BackgroundRole and rule.get(
-                            "background"
-                        ):
-                            # ✅ 2. QtGui.QColor() 형태로 사용하여 참조 오류를 해결합니다.
-                            return QtGui.QColor(rule["background"])
-                        if role == Qt.ItemDataRole.ForegroundRole and rule.get(
-                            "foreground"
-                        ):
-                            return QtGui.QColor(rule["foreground"])
+                number = self._style_array()[
+                    self._cell_position(index.row()),
+                    0 if role == Qt.ItemDataRole.BackgroundRole else 1,
+                ]
             except IndexError:
                 # 데이터가 실시간으로 변경될 때 발생할 수 있는 인덱스 오류를 방지
                 return None
-            return None
-
-        if role == Qt.ItemDataRole.DisplayRole:
-            try:
-                return str(self._data.iloc[index.row(), index.column()])
-            except IndexError:
+            if number == NO_STYLE:
                 return None
+            background, foreground = self._rule_colors[number]
+            return background if role == Qt.ItemDataRole.BackgroundRole else foreground
+
         return None
 
+    def _column_values(self, column):
+        """
+        원본 컬럼의 값 배열과 표시용 문자열 변환 함수를 반환합니다. (컬럼별로 처음 요청될 때 한 번 만듭니다)
+        문자열/객체 컬럼은 NumPy object 배열로 바꿔 두고, 숫자/날짜 컬럼은 NumPy 배열을 그대로 참조하되
+        iloc와 같은 문자열(Timestamp 표기 등)이 되도록 변환 결과를 메모이즈합니다.
+        원형 버퍼 모드에서는 버퍼의 컬럼 배열을 그대로 사용합니다.
+        """
+        if self._ring is not None and self._ring_layout != self._ring.layout_version:
+            # 버퍼의 컬럼이 추가되거나 배열 타입이 넓혀졌으면 참조를 다시 얻습니다.
+            self._column_cache = {}
+            self._ring_layout = self._ring.layout_version
+        cached = self._column_cache.get(column)
+        if cached is None:
+            if self._ring is not None:
+                values = self._ring.column_array(self._ring.columns[column])
+                cached = (values, _formatter_for(values.dtype))
+            else:
+                series = self._frame.iloc[:, column]
+                dtype = series.dtype
+                if _is_text_dtype(dtype):
+                    values = series.to_numpy(dtype=object)
+                elif isinstance(dtype, np.dtype):
+                    values = series.to_numpy()
+                else:
+                    # 확장 타입(Int64, category 등)은 pandas 배열에서 직접 꺼냅니다.
+                    values = series.array
+                cached = (values, _formatter_for(dtype))
+            self._column_cache[column] = cached
+        return cached
+
     def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
         if (
             role == Qt.ItemDataRole.DisplayRole
             and orientation == Qt.Orientation.Horizontal
         ):
-            return str(self._data.columns[section])
+            return str(self._column_labels()[section])
         return None
 
     # shinguhan/mylogmaster/myLogMaster-main/models/LogTableModel.py
@@ -123,34 +275,377 @@ class LogTableModel(QAbstractTableModel):
     def set_highlighting_rules(self, rules):
         self.beginResetModel()
         self._highlighting_rules = [r for r in rules if r.get("enabled")]
+        # ✅ QtGui.QColor() 형태로 사용하여 참조 오류를 해결합니다. (규칙마다 한 번만 생성)
+        self._rule_colors = [
+            (
+                QtGui.QColor(r["background"]) if r.get("background") else None,
+                QtGui.QColor(r["foreground"]) if r.get("foreground") else None,
+            )
+            for r in self._highlighting_rules
+        ]
+        self._invalidate_styles()
         self.endResetModel()
 
+    def _invalidate_styles(self):
+        self._styles = None
+        if self._ring is not None:
+            self._ring.drop_derived(_STYLE_ARRAY)
+
+    def _compute_styles(self, df):
+        return np.column_stack(compute_style_indices(df, self._highlighting_rules))
+
+    def _style_array(self):
+        """원본 행마다 [배경, 글자] 규칙 번호를 담은 배열을 (아직 없으면 계산해) 반환합니다."""
+        if self._ring is not None:
+            return self._ring.derived(_STYLE_ARRAY, self._compute_styles)
+        if self._styles is None:
+            self._styles = self._compute_styles(self._frame)
+        return self._styles
+
     def update_data(self, data):
+        self.set_view(data if data is not None else pd.DataFrame())
+
+    def set_view(self, base, rows=None, row_ids=None):
+        """
+        base DataFrame을 복사하지 않고 표시합니다. rows가 주어지면 해당 행 위치들만 표시합니다.
+        같은 base에 대해 뷰만 바꾸는 경우 검색 텍스트 등 base 기준 캐시를 그대로 재사용합니다.
+        row_ids는 base의 행마다 붙은 고유 번호입니다. (None이면 base의 행 위치)
+        """
         self.beginResetModel()
-        self._data = data.copy() if data is not None else pd.DataFrame()
+        if self._ring is not None or base is not self._frame:
+            self._ring = None
+            self._ring_frame = None
+            self._search_text.invalidate()
+            self._invalidate_styles()
+            self._column_cache = {}
+        self._frame = base
+        self._rows = None if rows is None else np.asarray(rows, dtype=np.int64)
+        self._base_ids = None if row_ids is None else np.asarray(row_ids, dtype=np.uint64)
+        self._view_frame = None
+        self.data_version += 1
+        self.reset_version += 1
         self.endResetModel()
 
-    def append_data(self, df_chunk):
+    def _start_ring(self):
+        """현재 뷰를 max_rows 크기의 원형 버퍼로 옮깁니다. (실시간 append가 처음 들어올 때 한 번)"""
+        ring = ColumnarRingBuffer(self.max_rows)
+        ring.append(self._data, row_ids=self.row_ids())
+        self._ring = ring
+        self._ring_frame = None
+        self._ring_layout = None
+        self._frame = None
+        self._rows = None
+        self._base_ids = None
+        self._view_frame = None
+        self._search_text.invalidate()
+        self._invalidate_styles()
+        self._column_cache = {}
+        self.reset_version += 1
+
+    def append_data(self, df_chunk, row_ids=None):
+        """
+        새 행들을 원형 버퍼에 제자리로 추가합니다. 용량을 넘으면 가장 오래된 행부터 제거하며,
+        한 번의 비용은 청크 크기에 비례합니다. (하이라이트/검색용 파생 배열도 새 행만 계산)
+        row_ids는 새 행마다 붙일 고유 번호입니다. (None이면 버퍼의 절대 행 번호)
+        """
         if df_chunk is None or df_chunk.empty:
             return
 
-        start_row = self.rowCount()
-        end_row = start_row + len(df_chunk) - 1
+        if self._ring is None and (
+            self._rows is not None or self.rowCount() > self.max_rows
+        ):
+            # 필터된 뷰이거나 용량보다 큰 원본이면 행 구성이 바뀌므로 전체를 다시 그립니다.
+            self.beginResetModel()
+            self._start_ring()
+            self.endResetModel()
+        elif self._ring is None:
+            self._start_ring()
+        ring = self._ring
 
-        self.beginInsertRows(QModelIndex(), start_row, end_row)
-        self._data = pd.concat([self._data, df_chunk], ignore_index=True)
-        self.endInsertRows()
+        if any(col not in ring.columns for col in df_chunk.columns):
+            # 새 컬럼이 생기면 헤더가 바뀌므로 전체를 다시 그립니다.
+            self.beginResetModel()
+            ring.append(df_chunk, row_ids)
+            self._ring_frame = None
+            self.data_version += 1
+            self.endResetModel()
+            return
 
-        overflow = self.rowCount() - self.max_rows
+        overflow = ring.overflow_for(len(df_chunk))
         if overflow > 0:
             self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
-            self._data = self._data.iloc[overflow:].reset_index(drop=True)
+            ring.drop_head(overflow)
+            self.evicted_total += overflow
+            self._ring_frame = None
+            self.data_version += 1
+            self.endRemoveRows()
+
+        start_row = len(ring)
+        end_row = start_row + min(len(df_chunk), ring.capacity) - 1
+        self.beginInsertRows(QModelIndex(), start_row, end_row)
+        ring.append(df_chunk, row_ids)
+        self._ring_frame = None
+        self.data_version += 1
+        self.endInsertRows()
+
+    def drop_rows_before(self, row_id):
+        """
+        고유 번호가 row_id보다 작은 앞쪽 행들을 제거하고 그 수를 반환합니다.
+        필터된 뷰는 원본보다 적은 행을 담아 스스로는 밀려나지 않으므로, 원본 버퍼에서 밀려난 행을 여기서 함께 뺍니다.
+        (원형 버퍼의 행은 추가된 순서이므로 고유 번호가 오름차순입니다.)
+        """
+        if self._ring is None or len(self._ring) == 0:
+            return 0
+        count = int(np.searchsorted(self._ring.row_ids(), np.uint64(row_id)))
+        if count > 0:
+            self.beginRemoveRows(QModelIndex(), 0, count - 1)
+            self._ring.drop_head(count)
+            self.evicted_total += count
+            self._ring_frame = None
+            self.data_version += 1
             self.endRemoveRows()
+        return count
+
+    def search_all_columns(self, text, case_sensitive=False, start=0, stop=None):
+        """
+        모든 컬럼 중 하나라도 text를 포함하는 행을 True로 표시한 boolean 배열을 반환합니다.
+        start/stop을 주면 뷰의 행 [start, stop) 범위만 평가합니다. (append된 행만 검사할 때)
+        """
+        stop = self.rowCount() if stop is None else stop
+        if self._ring is not None:
+            slots = self._ring.physical(np.arange(start, stop, dtype=np.int64))
+            if case_sensitive:
+                frame = self._ring.to_frame(np.arange(start, stop, dtype=np.int64))
+                return contains_mask(build_search_text(frame, lower=False), text, True)
+            search_text = self._ring.derived(_SEARCH_TEXT_ARRAY, _search_text_values)
+            return contains_mask(pd.Series(search_text[slots], dtype=object), text)
+        positions = slice(start, stop) if self._rows is None else self._rows[start:stop]
+        return self._search_text.contains(
+            self._frame, text, positions=positions, case_sensitive=case_sensitive
+        )
+
+    def make_match_job(self, text, case_sensitive=False, plan=None):
+        """
+        현재 뷰의 스냅샷에 대해 필터 일치 여부(boolean 배열)를 계산하는 함수 job(should_stop)과,
+        스냅샷 시점을 나타내는 토큰 (reset_version, evicted_total, 행 수)을 반환합니다.
+        job은 GUI 스레드 밖에서 실행할 수 있으며, should_stop()이 True가 되면 블록 사이에서 멈추고 None을 반환합니다.
+        """
+        count = self.rowCount()
+        token = (self.reset_version, self.evicted_total, count)
+
+        if plan is not None:
+            base, rows = (self._base, None) if self._ring is not None else (self._frame, self._rows)
+
+            def evaluate(start, stop):
+                frame = base.iloc[start:stop] if rows is None else base.iloc[rows[start:stop]]
+                return plan.mask(frame)
+        elif self._ring is not None and not case_sensitive:
+            search_text = self._ring.derived(_SEARCH_TEXT_ARRAY, _search_text_values)
+            texts = pd.Series(search_text[self._ring.logical_slots()], dtype=object)
+
+            def evaluate(start, stop):
+                return contains_mask(texts.iloc[start:stop], text)
+        elif self._ring is not None:
+            base = self._base
+
+            def evaluate(start, stop):
+                frame = base.iloc[start:stop]
+                return contains_mask(build_search_text(frame, lower=False), text, True)
+        else:
+            search_text, base, rows = self._search_text, self._frame, self._rows
+            generation = search_text.generation
+
+            def evaluate(start, stop):
+                positions = slice(start, stop) if rows is None else rows[start:stop]
+                return search_text.contains(
+                    base, text, positions, case_sensitive, generation=generation
+                )
+
+        def job(should_stop=lambda: False):
+            parts = []
+            for start in range(0, count, FILTER_BLOCK_ROWS):
+                if should_stop():
+                    return None
+                stop = min(start + FILTER_BLOCK_ROWS, count)
+                parts.append(np.asarray(evaluate(start, stop), dtype=bool))
+            return np.concatenate(parts) if parts else np.zeros(0, dtype=bool)
+
+        return job, token
+
+    def evaluate_query(self, plan, start=0, stop=None):
+        """컴파일된 QueryPlan을 현재 뷰의 행 [start, stop)(기본: 전체)에 대해 한 번에 평가한 boolean 배열을 반환합니다."""
+        if start == 0 and stop is None:
+            return plan.mask(self._data)
+        stop = self.rowCount() if stop is None else stop
+        return plan.mask(self.get_rows_frame(np.arange(start, stop, dtype=np.int64)))
+
+    def _column_sort_key(self, column):
+        """
+        원본 행 순서의 컬럼 정렬 키. SystemDate처럼 '<이름>_dt' 컬럼이 있으면 그 시간 값으로 정렬합니다.
+        원형 버퍼 모드에서는 DataFrame을 만들지 않고 버퍼의 컬럼 배열에서 바로 계산합니다.
+        """
+        # 파일 모드는 원본 DataFrame이 그대로면, 원형 버퍼 모드는 data_version이 그대로면 재사용합니다.
+        version = self.data_version if self._ring is not None else None
+        frame, cached_version, cache = self._sort_key_cache
+        if frame is not self._frame or cached_version != version:
+            cache = {}
+            self._sort_key_cache = (self._frame, version, cache)
+        if column not in cache:
+            labels = self._column_labels()
+            name = labels[column]
+            if f"{name}_dt" in labels:
+                name = f"{name}_dt"
+            if self._ring is not None:
+                series = pd.Series(self._ring.column_array(name)[self._ring.logical_slots()])
+            else:
+                series = self._frame[name]
+            cache[column] = native_sort_key(series)
+        return cache[column]
+
+    def sort_order(self, sort_keys):
+        """
+        [(컬럼 번호, 오름차순 여부), ...] (앞쪽이 우선)로 정렬한 뷰 행 번호 배열을 반환합니다.
+        네이티브 타입의 정렬 키로 한 번에 argsort하며, 데이터가 바뀔 때까지 정렬 키 조합별로 캐시합니다.
+        """
+        sort_keys = tuple(sort_keys)
+        if self._sort_cache[0] != self.data_version:
+            self._sort_cache = (self.data_version, {})
+        cache = self._sort_cache[1]
+        if sort_keys not in cache:
+            keys = []
+            for column, ascending in sort_keys:
+                key, missing = self._column_sort_key(column)
+                if self._rows is not None:
+                    key, missing = key[self._rows], missing[self._rows]
+                keys.append((key, missing, ascending))
+            cache[sort_keys] = sort_permutation(keys)
+        return cache[sort_keys]
+
+    def set_row_fetcher(self, fetcher, columns):
+        """
+        모델의 DataFrame에 없는 컬럼을 fetcher(원본 행 라벨 배열, 컬럼 목록)로 가져오게 합니다.
+        columns는 그렇게 얻을 수 있는 전체 컬럼 목록(내보내기 순서)입니다.
+        """
+        self._row_fetcher = fetcher
+        self._fetchable_columns = list(columns)
+
+    def all_column_names(self):
+        """
+        모델에 실린 컬럼과 행 번호로 가져올 수 있는 컬럼을 모두 포함한 목록 (내보내기용)
+        원본 컬럼 순서를 따르고, 원본에 없는 컬럼(배치 추적의 TraceID 등)은 앞에 둡니다.
+        """
+        names = self.column_names()
+        if not self._fetchable_columns:
+            return names
+        return [c for c in names if c not in self._fetchable_columns] + self._fetchable_columns
+
+    def get_rows_frame(self, rows, columns=None):
+        """
+        뷰의 행 번호 목록에 해당하는 행들을 원본에서 바로 꺼내 DataFrame으로 반환합니다.
+        columns가 주어지면 그 컬럼들로 반환하며, 모델에 없는 컬럼은 row fetcher로 해당 행만 가져옵니다.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        if self._ring is not None:
+            frame = self._ring.to_frame(rows)
+        else:
+            if self._rows is not None:
+                rows = self._rows[rows]
+            frame = self._frame.iloc[rows]
+        if columns is None:
+            return frame
+        return attach_columns(frame, self._row_fetcher, columns)
+
+    def row_batches(self, rows, columns=None, batch_size=EXPORT_BATCH_ROWS):
+        """
+        뷰의 행 번호 목록을 batch_size 행씩 DataFrame으로 돌려주는 이터레이터를 만듭니다. (백그라운드 내보내기용)
+        지금의 원본과 행 배열을 붙잡아 두므로 이후 뷰가 바뀌어도 만들 때의 행을 그대로 돌려줍니다.
+        원형 버퍼는 제자리에서 덮어써지므로 선택된 행을 먼저 복사해 둡니다. (최대 max_rows 행)
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        if self._ring is not None:
+            frame = self._ring.to_frame(rows)
+            base_rows = np.arange(len(rows), dtype=np.int64)
+        else:
+            frame = self._frame
+            base_rows = rows if self._rows is None else self._rows[rows]
+        fetcher = self._row_fetcher
+
+        def batches():
+            for start in range(0, len(base_rows), batch_size):
+                chunk = base_rows[start : start + batch_size]
+                if columns is None:
+                    yield frame.iloc[chunk]
+                else:
+                    yield attach_columns(take_columns(frame, chunk, columns), fetcher, columns)
+
+        return batches()
+
+    def row_ids(self, rows=None):
+        """뷰의 행들(rows가 None이면 전체)에 붙은 고유 번호 배열을 반환합니다."""
+        if self._ring is not None:
+            return self._ring.row_ids(rows)
+        if rows is None:
+            base_rows = (
+                np.arange(self._frame.shape[0], dtype=np.int64)
+                if self._rows is None
+                else self._rows
+            )
+        else:
+            base_rows = np.asarray(self._base_row(np.asarray(rows, dtype=np.int64)))
+        if self._base_ids is None:
+            return base_rows.astype(np.uint64)
+        return self._base_ids[base_rows]
+
+    def find_row_by_id(self, row_id):
+        """
+        고유 번호에 해당하는 뷰의 행 번호를 반환합니다. 없으면(필터로 빠졌거나 밀려난 행) KeyError를 발생시킵니다.
+        역매핑 배열은 뷰가 바뀐 뒤 처음 찾을 때 한 번 만들고, 이후에는 배열 한 칸만 읽습니다.
+        """
+        key = (self.reset_version, self.data_version)
+        cached_key, first_id, lookup = self._id_lookup
+        if cached_key != key:
+            ids = self.row_ids()
+            first_id = int(ids.min()) if len(ids) else 0
+            offsets = ids - np.uint64(first_id)
+            if len(ids) and int(offsets.max()) < 4 * len(ids) + 1024:
+                # 번호가 촘촘하면 (대부분의 경우) 번호 -> 행 배열로 바로 찾습니다.
+                lookup = np.full(int(offsets.max()) + 1, -1, dtype=np.int64)
+                lookup[offsets] = np.arange(len(ids), dtype=np.int64)
+            else:
+                # 번호가 드문드문하면 (오래 누적된 실시간 필터 뷰 등) 정렬해 두고 이진 탐색합니다.
+                order = np.argsort(ids, kind="stable")
+                lookup = (ids[order], order)
+            self._id_lookup = (key, first_id, lookup)
+
+        if not isinstance(row_id, (int, np.integer)) or row_id < first_id:
+            raise KeyError(row_id)
+        offset = int(row_id) - first_id
+        if isinstance(lookup, tuple):
+            sorted_ids, order = lookup
+            position = int(np.searchsorted(sorted_ids, np.uint64(row_id)))
+            if position < len(sorted_ids) and int(sorted_ids[position]) == row_id:
+                return int(order[position])
+        elif offset < len(lookup) and lookup[offset] >= 0:
+            return int(lookup[offset])
+        raise KeyError(row_id)
 
     def get_data_by_col_name(self, row_index, col_name):
-        if col_name in self._data.columns and 0 <= row_index < len(self._data):
+        if col_name in self._column_labels() and 0 <= row_index < self.rowCount():
+            if self._ring is not None:
+                return self._ring.column_array(col_name)[self._ring.physical(row_index)]
             # ✅ iloc를 사용하여 위치 기반으로 접근합니다. (KeyError 방지)
-            return self._data.iloc[row_index][col_name]
+            return self._frame.iloc[self._base_row(row_index)][col_name]
+        if (
+            self._row_fetcher is not None
+            and col_name in self._fetchable_columns
+            and self._ring is None
+            and 0 <= row_index < self.rowCount()
+        ):
+            # 모델에 싣지 않은 컬럼(상세 보기의 ParsedBodyObject 등)은 이 행만 가져옵니다.
+            label = self._frame.index[self._base_row(row_index)]
+            fetched = self._row_fetcher(np.array([label]), [col_name])
+            if col_name in fetched.columns and len(fetched):
+                return fetched[col_name].iloc[0]
         return None
 
         # ✅ 아래 메소드를 새로 추가해주세요.
@@ -162,4 +657,6 @@ class LogTableModel(QAbstractTableModel):
 
         self.beginResetModel()
         self._highlighting_rules = []
+        self._rule_colors = []
+        self._invalidate_styles()
         self.endResetModel()
@@ -0,0 +1,216 @@
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from PySide6.QtCore import QAbstractTableModel, Qt, QModelIndex, QTimer
+from PySide6 import QtGui
+
+from utils.highlight_rules import NO_STYLE, compute_style_indices
+
+# 한 번에 읽는 페이지 크기(행)와 메모리에 유지하는 최대 페이지 수
+PAGE_ROWS = 2000
+MAX_CACHED_PAGES = 32
+# 페이지 경계에서 이 행 수 이내로 다가가면 이웃 페이지를 미리 읽습니다.
+PREFETCH_MARGIN_ROWS = 200
+
+
+class _Page:
+    """한 페이지의 컬럼별 값 배열과 하이라이트 규칙 번호 배열"""
+
+    __slots__ = ("frame", "values", "styles")
+
+    def __init__(self, frame, values, styles):
+        self.frame = frame
+        self.values = values
+        self.styles = styles
+
+
+class PagedLogTableModel(QAbstractTableModel):
+    """
+    로컬 캐시(SQLite)의 로그를 페이지 단위로 읽어 보여주는 가상 테이블 모델입니다.
+
+    rowCount는 캐시 전체 행 수이지만, 실제로는 화면에 보이는 행이 속한 페이지(와 이웃 페이지)만 읽고,
+    최근에 사용한 MAX_CACHED_PAGES개 페이지만 LRU로 유지하므로 수천만 행 이력도 메모리 사용량이 일정합니다.
+
+    page_source는 DatabaseManager처럼 count_cached_logs(), get_cached_log_columns(),
+    read_cached_logs_page(limit, offset, after_key, columns) -> (DataFrame, 다음 페이지 시작 키)를 제공하면 됩니다.
+    순서대로 스크롤할 때는 이전 페이지가 돌려준 키로 다음 페이지를 인덱스에서 바로 찾습니다.
+    """
+
+    def __init__(
+        self, page_source, page_rows=PAGE_ROWS, max_pages=MAX_CACHED_PAGES, columns=None, parent=None
+    ):
+        super().__init__(parent)
+        self.page_source = page_source
+        # 읽을 컬럼 (None이면 캐시의 모든 컬럼). 페이지에는 이 컬럼들만 읽어 둡니다.
+        self.requested_columns = list(columns) if columns else None
+        self.page_rows = max(int(page_rows), 1)
+        self.max_pages = max(int(max_pages), 2)
+        self._row_count = 0
+        self._columns = []
+        self._pages = OrderedDict()  # 페이지 번호 -> _Page (가장 최근에 사용한 페이지가 뒤)
+        self._anchors = {}  # 페이지 번호 -> 그 페이지의 시작 키 (keyset 조회용)
+        self._prefetch_pending = set()
+        self._highlighting_rules = []
+        self._rule_colors = []
+        self.refresh()
+
+    # --- 데이터 원본 ---
+    def refresh(self):
+        """캐시의 행 수와 컬럼을 다시 읽고, 메모리의 페이지를 모두 버립니다."""
+        self.beginResetModel()
+        self._row_count = self.page_source.count_cached_logs()
+        self._columns = list(self.page_source.get_cached_log_columns())
+        if self.requested_columns is not None:
+            self._columns = [c for c in self._columns if c in self.requested_columns]
+        self._pages.clear()
+        self._anchors.clear()
+        self._prefetch_pending.clear()
+        self.endResetModel()
+
+    def cached_page_count(self):
+        return len(self._pages)
+
+    def _page(self, number):
+        page = self._pages.get(number)
+        if page is not None:
+            self._pages.move_to_end(number)
+            return page
+        page = self._load_page(number)
+        self._pages[number] = page
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
+        return page
+
+    def _nearest_anchor(self, number):
+        """number 이하에서 시작 키를 아는 가장 가까운 페이지 번호 (없으면 None)"""
+        if number in self._anchors:
+            return number
+        known = [page for page in self._anchors if page < number]
+        return max(known) if known else None
+
+    def _load_page(self, number):
+        # 시작 키를 아는 가장 가까운 앞 페이지에서 건너뛰어, 멀리 이동해도 OFFSET으로 훑는 행 수를 줄입니다.
+        anchor = self._nearest_anchor(number)
+        skip_pages = number if anchor is None else number - anchor
+        frame, next_key = self.page_source.read_cached_logs_page(
+            self.page_rows,
+            offset=skip_pages * self.page_rows,
+            after_key=None if anchor is None else self._anchors[anchor],
+            columns=self._columns,
+        )
+        if next_key is not None:
+            self._anchors[number + 1] = next_key
+        frame = frame.reset_index(drop=True)
+        values = [
+            frame[name].to_numpy(dtype=object) if name in frame.columns else None
+            for name in self._columns
+        ]
+        styles = None
+        if self._highlighting_rules and not frame.empty:
+            styles = np.column_stack(compute_style_indices(frame, self._highlighting_rules))
+        return _Page(frame, values, styles)
+
+    def _prefetch_around(self, row):
+        """페이지 경계에 가까우면 이웃 페이지를 이벤트 루프가 한가할 때 미리 읽어 둡니다."""
+        number, offset = divmod(row, self.page_rows)
+        if offset >= self.page_rows - PREFETCH_MARGIN_ROWS:
+            neighbour = number + 1
+        elif offset < PREFETCH_MARGIN_ROWS:
+            neighbour = number - 1
+        else:
+            return
+        if (
+            neighbour < 0
+            or neighbour * self.page_rows >= self._row_count
+            or neighbour in self._pages
+            or neighbour in self._prefetch_pending
+        ):
+            return
+        self._prefetch_pending.add(neighbour)
+        QTimer.singleShot(0, lambda: self._prefetch(neighbour))
+
+    def _prefetch(self, number):
+        self._prefetch_pending.discard(number)
+        if number not in self._pages and number * self.page_rows < self._row_count:
+            self._page(number)
+
+    # --- QAbstractTableModel 구현 ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def column_names(self):
+        return list(self._columns)
+
+    def is_empty(self):
+        return self._row_count == 0 or not self._columns
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role not in (
+            Qt.ItemDataRole.DisplayRole,
+            Qt.ItemDataRole.BackgroundRole,
+            Qt.ItemDataRole.ForegroundRole,
+        ):
+            return None
+        row = index.row()
+        number, offset = divmod(row, self.page_rows)
+        page = self._page(number)
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            self._prefetch_around(row)
+            values = page.values[index.column()] if index.column() < len(page.values) else None
+            if values is None or offset >= len(values):
+                return None
+            value = values[offset]
+            return "" if value is None else str(value)
+
+        if page.styles is None or offset >= len(page.styles):
+            return None
+        number = page.styles[offset, 0 if role == Qt.ItemDataRole.BackgroundRole else 1]
+        if number == NO_STYLE:
+            return None
+        background, foreground = self._rule_colors[number]
+        return background if role == Qt.ItemDataRole.BackgroundRole else foreground
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._columns[section] if 0 <= section < len(self._columns) else None
+        return str(section + 1)
+
+    def get_rows_frame(self, rows):
+        """행 번호 목록에 해당하는 행들을 (필요한 페이지만 읽어) DataFrame으로 반환합니다."""
+        rows = np.asarray(rows, dtype=np.int64)
+        if rows.size == 0:
+            return pd.DataFrame(columns=self._columns)
+        parts, positions = [], []
+        numbers, offsets = np.divmod(rows, self.page_rows)
+        for number in np.unique(numbers):
+            selected = np.flatnonzero(numbers == number)
+            parts.append(self._page(int(number)).frame.iloc[offsets[selected]])
+            positions.append(selected)
+        result = pd.concat(parts, ignore_index=True)
+        result = result.iloc[np.argsort(np.concatenate(positions), kind="stable")]
+        result.index = rows
+        return result
+
+    # --- 하이라이트 ---
+    def set_highlighting_rules(self, rules):
+        self.beginResetModel()
+        self._highlighting_rules = [r for r in rules if r.get("enabled")]
+        self._rule_colors = [
+            (
+                QtGui.QColor(r["background"]) if r.get("background") else None,
+                QtGui.QColor(r["foreground"]) if r.get("foreground") else None,
+            )
+            for r in self._highlighting_rules
+        ]
+        # 스타일은 페이지를 읽을 때 계산하므로, 읽어 둔 페이지를 버립니다. (keyset 키는 유지)
+        self._pages.clear()
+        self.endResetModel()
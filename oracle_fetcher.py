@@ -4,15 +4,20 @@ from PySide6.QtCore import QThread, Signal, QDateTime, Qt
 import time
 from datetime import datetime, timedelta
 
+from utils.oracle_fetch import LOG_COLUMNS, MIN_ARRAYSIZE, iter_frames, tune_cursor
+from utils.oracle_pool import shared_pool_manager
+
 class OracleFetcherThread(QThread):
     progress = Signal(str)
     data_fetched = Signal(pd.DataFrame)
     finished = Signal()
     error = Signal(str)
 
-    def __init__(self, connection_info, query_conditions, templates, chunk_size=1000, parent=None):
+    def __init__(self, connection_info, query_conditions, templates, chunk_size=1000, parent=None, pools=None):
         super().__init__(parent)
         self.conn_info = connection_info
+        # 세션은 접속 프로필별 공유 풀에서 빌려 쓰고, 다 쓰면 풀로 돌려줍니다.
+        self.pools = pools or shared_pool_manager()
         self.conditions = query_conditions
         self.templates = templates
         self.chunk_size = chunk_size
@@ -53,6 +58,12 @@ class OracleFetcherThread(QThread):
         self._is_paused = False
         self.progress.emit("Resuming...")
 
+    def _wait_if_paused(self):
+        """일시정지 중이면 풀릴 때까지 기다립니다. 계속 가져와도 되면 True를 반환합니다."""
+        while self._is_paused and self._is_running:
+            time.sleep(0.5)
+        return self._is_running
+
     def _run_db_time_range(self):
         """임무 1: Real Database에서 특정 시간 범위의 데이터를 조회합니다. (실제 쿼리 반영)"""
         conn = None
@@ -116,53 +127,41 @@ class OracleFetcherThread(QThread):
             final_query = f"{base_query} WHERE {' AND '.join(where_clauses)}"
 
             self.progress.emit("Connecting to Oracle DB...")
-            db_conn_info = self.conn_info.copy()
-            db_conn_info.pop('type', None)
-            conn = oracledb.connect(**db_conn_info)
+            conn = self.pools.acquire(self.conn_info)
             self.progress.emit("Connection successful. Fetching data...")
             
-            with conn.cursor() as cursor:
-                cursor.execute(final_query, params)
-                while self._is_running:
-                    if self._is_paused: time.sleep(0.5); continue
-                    rows = cursor.fetchmany(self.chunk_size)
-                    if not rows: break
-                    
-                    columns = [desc[0].upper() for desc in cursor.description]
-                    # DataFrame 컬럼 이름을 애플리케이션에서 사용하는 CamelCase로 변경
-                    df_chunk = pd.DataFrame(rows, columns=columns)
-                    df_chunk.columns = ['SystemDate', 'NumericalTimeStamp', 'LevelID', 'Category', 'MethodID', 'DeviceID', 'TrackingID', 'MessageName', 'AsciiData', 'BinaryData']
-                    
-                    self.data_fetched.emit(df_chunk)
+            # 드라이버가 지원하면 Arrow 컬럼 배열로, 아니면 배치 크기를 맞춰 가며 커서로 가져옵니다.
+            for df_chunk in iter_frames(conn, final_query, params, self._wait_if_paused):
+                self.data_fetched.emit(df_chunk)
 
+            # 조회에 쓴 세션은 풀로 돌려주고, 실시간 추적은 조회할 때마다 다시 빌립니다.
+            conn.close()
+            conn = None
             if self._is_running and self.conditions.get('tail_after_query'):
                 self.progress.emit("Initial data fetched. Starting real-time tailing...")
-                self._run_db_real_time(connection=conn)
+                self._run_db_real_time()
             else:
                 if self._is_running: self.progress.emit("Data fetching complete.")
 
         except oracledb.DatabaseError as e:
             error_obj, = e.args; self.error.emit(f"DB Error: {error_obj.message}")
         finally:
-            if conn and not (self._is_running and self.conditions.get('tail_after_query')):
+            if conn:
                 conn.close()
 
-    def _run_db_real_time(self, connection=None):
-        """임무 2: Real Database에서 새로운 로그를 실시간으로 추적합니다. (실제 쿼리 반영)"""
-        conn = connection
+    def _run_db_real_time(self):
+        """
+        임무 2: Real Database에서 새로운 로그를 실시간으로 추적합니다. (실제 쿼리 반영)
+        세션은 조회할 때만 풀에서 빌리고, 기다리는 동안에는 풀로 돌려줍니다.
+        """
         try:
-            if not conn:
-                self.progress.emit("Connecting to Oracle DB for real-time tailing...")
-                db_conn_info = self.conn_info.copy()
-                db_conn_info.pop('type', None)
-                conn = oracledb.connect(**db_conn_info)
-                self.progress.emit("Connection successful. Tailing logs...")
-            
-            cursor = conn.cursor()
-            # ✅ 테이블과 컬럼 이름 수정
-            cursor.execute("SELECT MAX(SYSTEMDATE) FROM CLASS.LOGDATA")
-            last_timestamp, = cursor.fetchone()
+            self.progress.emit("Connecting to Oracle DB for real-time tailing...")
+            with self.pools.connection(self.conn_info) as conn, conn.cursor() as cursor:
+                # ✅ 테이블과 컬럼 이름 수정
+                cursor.execute("SELECT MAX(SYSTEMDATE) FROM CLASS.LOGDATA")
+                last_timestamp, = cursor.fetchone()
             if last_timestamp is None: last_timestamp = 0
+            self.progress.emit("Connection successful. Tailing logs...")
 
             # ✅ SELECT 구문 수정
             base_query = """
@@ -178,6 +177,8 @@ class OracleFetcherThread(QThread):
             FROM CLASS.LOGDATA A
             """
 
+            # 직전 조회의 행 수로 다음 조회의 arraysize/prefetchrows를 정해, 보통은 왕복 한 번으로 끝나게 합니다.
+            expected_rows = MIN_ARRAYSIZE
             while self._is_running:
                 if self._is_paused:
                     time.sleep(1); continue
@@ -195,20 +196,17 @@ class OracleFetcherThread(QThread):
 
                 final_query = f"{base_query} WHERE {' AND '.join(clauses)} ORDER BY A.SYSTEMDATE"
                 
-                cursor.execute(final_query, params)
-                rows = cursor.fetchall()
+                with self.pools.connection(self.conn_info) as conn, conn.cursor() as cursor:
+                    tune_cursor(cursor, expected_rows * 2)
+                    cursor.execute(final_query, params)
+                    rows = cursor.fetchall()
+                expected_rows = max(len(rows), MIN_ARRAYSIZE)
                 if rows:
-                    columns = [desc[0].upper() for desc in cursor.description]
-                    df_chunk = pd.DataFrame(rows, columns=columns)
-                    # DataFrame 컬럼 이름을 애플리케이션에서 사용하는 CamelCase로 변경
-                    df_chunk.columns = ['SystemDate', 'NumericalTimeStamp', 'LevelID', 'Category', 'MethodID', 'DeviceID', 'TrackingID', 'MessageName', 'AsciiData', 'BinaryData']
-                    
+                    df_chunk = pd.DataFrame(rows, columns=LOG_COLUMNS)
                     self.data_fetched.emit(df_chunk)
                     last_timestamp = df_chunk['NumericalTimeStamp'].max()
         except oracledb.DatabaseError as e:
             error_obj, = e.args; self.error.emit(f"DB Error: {error_obj.message}")
-        finally:
-            if conn: conn.close()
 
     def _run_mock_time_range(self):
         """임무 3: 특정 시간 범위의 Mock 데이터를 생성합니다."""
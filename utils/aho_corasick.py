@@ -0,0 +1,102 @@
+from collections import deque
+
+try:
+    # pyahocorasick가 설치되어 있으면 C 구현을 사용합니다. (선택 사항)
+    import ahocorasick as _pyahocorasick
+except ImportError:
+    _pyahocorasick = None
+
+
+class AhoCorasickMatcher:
+    """
+    여러 개의 ID(패턴)를 하나의 오토마톤으로 묶어,
+    텍스트를 한 번만 훑어서 포함된 모든 패턴을 찾아내는 다중 패턴 매처입니다.
+    pyahocorasick가 있으면 그것을 사용하고, 없으면 순수 파이썬 구현으로 동작합니다.
+    """
+
+    def __init__(self, patterns, case_sensitive=False):
+        self.case_sensitive = case_sensitive
+        # 정규화된 패턴 -> 원본 패턴 목록 (대소문자만 다른 ID가 여러 개일 수 있음)
+        self._originals = {}
+        for pattern in patterns:
+            if not pattern:
+                continue
+            key = self._normalize(pattern)
+            self._originals.setdefault(key, [])
+            if pattern not in self._originals[key]:
+                self._originals[key].append(pattern)
+
+        if _pyahocorasick is not None:
+            self._automaton = _pyahocorasick.Automaton()
+            for key in self._originals:
+                self._automaton.add_word(key, key)
+            if self._originals:
+                self._automaton.make_automaton()
+        else:
+            self._automaton = None
+            self._build_trie()
+
+    def __len__(self):
+        return len(self._originals)
+
+    def _normalize(self, text):
+        return text if self.case_sensitive else text.lower()
+
+    def _build_trie(self):
+        """순수 파이썬 Aho-Corasick 오토마톤(goto/fail/output)을 구성합니다."""
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [set()]
+
+        for key in self._originals:
+            state = 0
+            for char in key:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(set())
+                state = next_state
+            self._output[state].add(key)
+
+        # BFS로 실패 링크를 계산하고, 실패 링크의 출력을 병합합니다.
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                if self._fail[next_state] == next_state:
+                    self._fail[next_state] = 0
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+    def find_all(self, text):
+        """텍스트에 포함된 모든 원본 패턴의 집합을 반환합니다."""
+        if not self._originals or not text:
+            return set()
+
+        text = self._normalize(text)
+        found_keys = set()
+
+        if self._automaton is not None:
+            for _, key in self._automaton.iter(text):
+                found_keys.add(key)
+        else:
+            goto, fail, output = self._goto, self._fail, self._output
+            state = 0
+            for char in text:
+                while state and char not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(char, 0)
+                if output[state]:
+                    found_keys |= output[state]
+
+        found = set()
+        for key in found_keys:
+            found.update(self._originals[key])
+        return found
@@ -0,0 +1,43 @@
+# 행마다 크기가 크지만 표시/검색에는 거의 쓰이지 않는 컬럼.
+# 뷰와 추적 결과에는 싣지 않고, 상세 보기나 내보내기에서 필요할 때 행 번호로 따로 가져옵니다.
+HEAVY_COLUMNS = ("BinaryData", "ParsedBodyObject", "LogParserClassName")
+
+
+def light_columns(columns, visible=None):
+    """
+    columns 중 뷰에 실을 컬럼 목록(원래 순서 유지)을 반환합니다.
+    무거운 컬럼은 빼고, visible이 주어지면 그 안에 있는 컬럼만 남깁니다.
+    """
+    visible = set(visible) if visible else None
+    return [
+        c for c in columns if c not in HEAVY_COLUMNS and (visible is None or c in visible)
+    ]
+
+
+def take_columns(frame, rows, columns=None):
+    """
+    frame에서 rows(행 위치 배열 또는 불리언 마스크)와 columns만 한 번에 복사합니다.
+    (행을 먼저 전부 복사한 뒤 컬럼을 고르는 것보다 복사량이 적습니다)
+    """
+    is_mask = getattr(rows, "dtype", None) == bool
+    if columns is None:
+        return frame[rows] if is_mask else frame.iloc[rows]
+    if is_mask:
+        return frame.loc[rows, [c for c in columns if c in frame.columns]]
+    return frame.iloc[rows, [frame.columns.get_loc(c) for c in columns if c in frame.columns]]
+
+
+def attach_columns(frame, fetcher, columns):
+    """
+    frame에 없는 columns를 fetcher(행 라벨 배열, 컬럼 목록)로 가져와 붙이고,
+    columns 순서로 정렬한 DataFrame을 반환합니다. fetcher가 없으면 있는 컬럼만 돌려줍니다.
+    fetcher는 라벨마다 한 행씩, 주어진 순서대로 담은 DataFrame을 반환해야 합니다. (없는 행은 결측값)
+    """
+    missing = [c for c in columns if c not in frame.columns]
+    if missing and fetcher is not None and len(frame):
+        fetched = fetcher(frame.index.to_numpy(), missing)
+        frame = frame.copy()
+        for name in fetched.columns:
+            frame[name] = fetched[name].to_numpy()
+    return frame[[c for c in columns if c in frame.columns]]
+
@@ -1,44 +1,32 @@
 import oracledb
 from PySide6.QtCore import QThread, Signal
 
-def try_connect(conn_info):
+from utils.oracle_pool import shared_pool_manager
+
+def try_connect(conn_info, pools=None):
     """
     제공된 접속 정보를 기반으로 데이터베이스 연결을 시도합니다.
     현재 'Oracle' 타입만 지원합니다.
+    공유 세션 풀(pools)에서 세션을 빌려 확인하므로, 성공한 세션은 이후 조회에서 그대로 재사용됩니다.
     성공 메시지를 반환하거나 예외를 발생시킵니다.
     """
     db_type = conn_info.get('type')
     if db_type != 'Oracle':
         raise NotImplementedError(f"'{db_type}' 타입의 데이터베이스는 연결 테스트를 지원하지 않습니다.")
 
-    db_params = conn_info.copy()
-    db_params.pop('type', None)
-
+    pools = pools or shared_pool_manager()
     try:
-        # host, port, sid/service_name 정보로 DSN(Data Source Name)을 생성합니다.
-        if all(k in db_params for k in ['host', 'port']) and ('sid' in db_params or 'service_name' in db_params):
-            host = db_params.pop('host')
-            port = int(db_params.pop('port'))
-            
-            # service_name이 있으면 우선적으로 사용합니다.
-            if 'service_name' in db_params:
-                service_name = db_params.pop('service_name')
-                dsn = oracledb.makedsn(host, port, service_name=service_name)
-            else:
-                sid = db_params.pop('sid')
-                dsn = oracledb.makedsn(host, port, sid=sid)
-            db_params['dsn'] = dsn
-        
-        if not db_params.get('dsn'):
-            raise ValueError("DSN을 생성할 수 없습니다. 'host', 'port', 'sid' 또는 'service_name'을 확인하세요.")
-
-        with oracledb.connect(**db_params) as connection:
+        with pools.connection(conn_info) as connection:
+            connection.ping()
             return f"Oracle DB에 성공적으로 연결되었습니다 (Version: {connection.version})."
-            
+
     except oracledb.DatabaseError as e:
+        # 잘못된 접속 정보로 만든 풀은 남겨 두지 않습니다.
+        pools.discard(conn_info)
         error_obj, = e.args
         raise ConnectionError(f"DB 오류: {error_obj.message.strip()}")
     except Exception as e:
+        pools.discard(conn_info)
         raise ConnectionError(f"예상치 못한 오류가 발생했습니다: {e}")
 
 
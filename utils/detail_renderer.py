@@ -0,0 +1,93 @@
+import json
+from collections import OrderedDict
+from itertools import islice
+
+# 상세 보기에 한 번에 표시하는 최대 줄 수 (나머지는 '전체 보기'를 요청할 때 렌더링)
+MAX_DETAIL_LINES = 2000
+# 일반 텍스트 본문을 상세 보기에 싣는 최대 글자 수
+MAX_DETAIL_CHARS = 200000
+# 이보다 항목이 많은 본문은 백그라운드에서 포맷합니다.
+LARGE_BODY_ITEMS = 20000
+
+
+def _secs_lines(items, indent=0):
+    """SECS 메시지 트리(SimpleNamespace(type, value) 목록)를 한 줄씩 만들어 냅니다."""
+    indent_str = "    " * indent
+    for item in items:
+        # SimpleNamespace 객체인지 확인
+        if hasattr(item, "type") and hasattr(item, "value"):
+            if item.type == "L":
+                yield f"{indent_str}<L [{len(item.value)}]>"
+                yield from _secs_lines(item.value, indent + 1)
+            else:
+                yield f"{indent_str}<{item.type} '{item.value}'>"
+
+
+def render_detail(body, max_lines=MAX_DETAIL_LINES):
+    """
+    상세 보기에 표시할 (텍스트, 잘렸는지 여부)를 반환합니다.
+    SECS 트리는 필요한 줄까지만 만들고, max_lines가 None이면 전부 렌더링합니다.
+    """
+    if isinstance(body, dict):
+        lines = iter(json.dumps(body, indent=4, ensure_ascii=False).splitlines())
+    elif isinstance(body, list):
+        lines = _secs_lines(body)
+    else:
+        text = str(body)
+        if max_lines is not None and len(text) > MAX_DETAIL_CHARS:
+            return text[:MAX_DETAIL_CHARS], True
+        return text, False
+
+    if max_lines is None:
+        return "\n".join(lines), False
+    head = list(islice(lines, max_lines))
+    truncated = next(lines, None) is not None
+    return "\n".join(head), truncated
+
+
+def is_large_body(body, limit=LARGE_BODY_ITEMS):
+    """본문의 항목(SECS 아이템, JSON 값) 수가 limit을 넘는지 limit개까지만 세어 확인합니다."""
+    count = 0
+    stack = [body]
+    while stack:
+        node = stack.pop()
+        count += 1
+        if count > limit:
+            return True
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+        elif hasattr(node, "type") and isinstance(getattr(node, "value", None), list):
+            stack.extend(node.value)
+    return False
+
+
+class DetailTextCache:
+    """
+    렌더링한 상세 텍스트의 LRU 캐시입니다.
+    같은 로그의 본문 객체는 원본과 모든 추적 뷰가 공유하므로 객체 자체를 키로 사용하고,
+    id 재사용을 막기 위해 객체 참조를 함께 보관합니다.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # (id(본문), 전체 여부) -> (본문, 텍스트, 잘림 여부)
+
+    def get(self, body, full=False):
+        key = (id(body), full)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] is not body:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1], entry[2]
+
+    def put(self, body, full, text, truncated):
+        key = (id(body), full)
+        self._entries[key] = (body, text, truncated)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,28 @@
+from PySide6.QtCore import Signal
+
+from utils.detail_renderer import render_detail
+from utils.worker_base import BackgroundWorker
+
+
+class DetailRenderWorker(BackgroundWorker):
+    """
+    큰 SECS/JSON 본문의 상세 텍스트를 백그라운드에서 포맷하는 QThread 입니다.
+    generation은 요청 번호로, 결과를 받는 쪽에서 아직 같은 행을 보고 있는지 확인하는 데 사용합니다.
+    """
+    result_ready = Signal(int, object, bool, str, bool)  # (generation, 본문, 전체 렌더링 여부, 텍스트, 잘림 여부)
+    error = Signal(int, str)
+
+    def __init__(self, generation, body, full, max_lines, parent=None):
+        super().__init__(parent)
+        self.generation = generation
+        self.body = body
+        self.full = full
+        self.max_lines = max_lines
+
+    def run(self):
+        try:
+            text, truncated = render_detail(self.body, self.max_lines)
+        except Exception as e:
+            self.error.emit(self.generation, str(e))
+            return
+        self.result_ready.emit(self.generation, self.body, self.full, text, truncated)
@@ -1,4 +1,5 @@
 import pandas as pd
+from utils.query_operators import split_list_value, split_range_value, to_number
 
 class EventMatcher:
     """
@@ -13,6 +14,12 @@ class EventMatcher:
             "equals": self._equals,
             "starts with": self._starts_with,
             "ends with": self._ends_with,
+            "<": self._less_than,
+            "<=": self._less_equal,
+            ">": self._greater_than,
+            ">=": self._greater_equal,
+            "between": self._between,
+            "in list": self._in_list,
         }
 
     def _contains(self, cell_value, check_value):
@@ -27,6 +34,38 @@ class EventMatcher:
     def _ends_with(self, cell_value, check_value):
         return cell_value.endswith(check_value)
 
+    def _compare(self, cell_value, check_value):
+        """두 값을 비교해 -1/0/1을 반환합니다. 둘 다 숫자면 숫자로, 아니면 문자열로 비교합니다."""
+        cell_number, check_number = to_number(cell_value), to_number(check_value)
+        if cell_number is not None and check_number is not None:
+            cell_value, check_value = cell_number, check_number
+        return (cell_value > check_value) - (cell_value < check_value)
+
+    def _less_than(self, cell_value, check_value):
+        return self._compare(cell_value, check_value) < 0
+
+    def _less_equal(self, cell_value, check_value):
+        return self._compare(cell_value, check_value) <= 0
+
+    def _greater_than(self, cell_value, check_value):
+        return self._compare(cell_value, check_value) > 0
+
+    def _greater_equal(self, cell_value, check_value):
+        return self._compare(cell_value, check_value) >= 0
+
+    def _between(self, cell_value, check_value):
+        start, end = split_range_value(check_value)
+        return self._compare(cell_value, start) >= 0 and self._compare(cell_value, end) <= 0
+
+    def _in_list(self, cell_value, check_value):
+        items = split_list_value(check_value)
+        cell_number = to_number(cell_value)
+        return any(
+            item == cell_value.strip()
+            or (cell_number is not None and to_number(item) == cell_number)
+            for item in items
+        )
+
     def match(self, row, rule_group):
         """
         주어진 로그(row)가 규칙 그룹(rule_group)과 일치하는지 재귀적으로 확인합니다.
@@ -57,7 +96,10 @@ class EventMatcher:
                 return False
                 
             cell_value = str(row[col]).lower()
-            check_value = str(val).lower()
+            if isinstance(val, (list, tuple)):
+                check_value = [str(v).lower() for v in val]
+            else:
+                check_value = str(val).lower()
             
             # 딕셔너리에서 적절한 연산자(전략)를 찾아 실행
             if op in self._operators:
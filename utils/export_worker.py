@@ -0,0 +1,52 @@
+import time
+
+from PySide6.QtCore import Signal
+
+from utils.export_writer import write_batches
+from utils.worker_base import BackgroundWorker
+
+# 진행률 신호를 보내는 최소 간격(초)
+PROGRESS_INTERVAL = 0.1
+
+
+class ExportWorker(BackgroundWorker):
+    """
+    보이는 행들을 배치 단위로 꺼내 파일에 쓰는 QThread 입니다.
+    batches는 DataFrame 이터러블로, 이 스레드에서 하나씩 만들어지므로 전체 결과를 한 번에 복사하지 않습니다.
+    cancel()하면 다음 배치 경계에서 멈추고, 쓰다 만 파일을 지웁니다.
+    """
+    progress = Signal(int, int)  # (지금까지 쓴 행 수, 전체 행 수)
+    result_ready = Signal(str, int, float)  # (경로, 쓴 행 수, 걸린 시간(초))
+    error = Signal(str)
+
+    def __init__(self, path, fmt, batches, total_rows, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.fmt = fmt
+        self.batches = batches
+        self.total_rows = total_rows
+        self._last_report = 0.0
+
+    def _report(self, written):
+        # 진행률은 화면 갱신에 필요한 만큼만 (최대 PROGRESS_INTERVAL초에 한 번) 보냅니다.
+        now = time.perf_counter()
+        if now - self._last_report >= PROGRESS_INTERVAL:
+            self._last_report = now
+            self.progress.emit(written, self.total_rows)
+
+    def run(self):
+        started = self._last_report = time.perf_counter()
+        try:
+            written = write_batches(
+                self.path,
+                self.fmt,
+                self.batches,
+                progress=self._report,
+                should_stop=self.is_cancelled,
+            )
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+        if written is None:
+            return
+        self.result_ready.emit(self.path, written, time.perf_counter() - started)
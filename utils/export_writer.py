@@ -0,0 +1,144 @@
+import os
+
+import numpy as np
+
+try:
+    # Parquet/Feather/Arrow IPC 내보내기는 pyarrow가 설치되어 있을 때만 사용합니다. (선택 사항)
+    import pyarrow as _pa
+    import pyarrow.ipc as _ipc
+    import pyarrow.parquet as _pq
+except ImportError:
+    _pa = None
+
+# 한 번에 꺼내어 쓰는 행 수. 내보내기 중 추가로 쓰는 메모리는 이 크기의 배치 하나 정도입니다.
+EXPORT_BATCH_ROWS = 50000
+
+# 형식 -> (파일 대화상자 필터, 확장자)
+EXPORT_FORMATS = {
+    "csv": ("CSV Files (*.csv)", ".csv"),
+    "parquet": ("Parquet Files (*.parquet)", ".parquet"),
+    "feather": ("Feather Files (*.feather)", ".feather"),
+    "arrow": ("Arrow IPC Files (*.arrow)", ".arrow"),
+}
+
+
+def available_formats():
+    """지금 환경에서 쓸 수 있는 내보내기 형식 목록 (pyarrow가 없으면 CSV만)"""
+    return ["csv"] if _pa is None else list(EXPORT_FORMATS)
+
+
+def file_dialog_filter():
+    """저장 대화상자에 넘길 형식 필터 문자열"""
+    return ";;".join(EXPORT_FORMATS[fmt][0] for fmt in available_formats())
+
+
+def export_format_for(path, selected_filter=None):
+    """
+    파일 확장자(없으면 대화상자에서 고른 필터)로 내보내기 형식과, 확장자를 붙인 경로를 반환합니다.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    for fmt in available_formats():
+        if EXPORT_FORMATS[fmt][1] == extension:
+            return fmt, path
+    for fmt in available_formats():
+        if EXPORT_FORMATS[fmt][0] == selected_filter:
+            return fmt, path + EXPORT_FORMATS[fmt][1]
+    return "csv", path
+
+
+def _is_missing(value):
+    return value is None or (isinstance(value, float) and np.isnan(value))
+
+
+def _arrow_ready(df):
+    """Arrow로 옮길 수 없는 객체 컬럼(SECS 트리 등)은 CSV에 쓰이는 것과 같은 문자열로 바꿉니다."""
+    objects = [name for name in df.columns if df[name].dtype == object]
+    if not objects:
+        return df
+    df = df.copy(deep=False)
+    for name in objects:
+        df[name] = [
+            None if _is_missing(v) else v if isinstance(v, (str, bytes)) else str(v)
+            for v in df[name]
+        ]
+    return df
+
+
+class _CsvSink:
+    def __init__(self, path):
+        # utf-8-sig는 파일 맨 앞에 BOM을 한 번만 씁니다. (Excel 호환, 기존 CSV 저장과 동일)
+        self._file = open(path, "w", encoding="utf-8-sig", newline="")
+        self._header = True
+
+    def write(self, df):
+        df.to_csv(self._file, index=False, header=self._header)
+        self._header = False
+
+    def close(self):
+        self._file.close()
+
+
+class _ArrowSink:
+    """Parquet 또는 Arrow IPC(Feather v2) 파일에 배치 단위로 씁니다. 스키마는 첫 배치를 따릅니다."""
+
+    def __init__(self, path, fmt):
+        self.path = path
+        self.fmt = fmt
+        self._schema = None
+        self._writer = None
+
+    def _open(self, table):
+        # 첫 배치에서 값이 모두 비어 타입을 알 수 없는 컬럼은 문자열로 둡니다.
+        self._schema = _pa.schema(
+            [
+                field.with_type(_pa.string()) if _pa.types.is_null(field.type) else field
+                for field in table.schema
+            ]
+        )
+        if self.fmt == "parquet":
+            self._writer = _pq.ParquetWriter(self.path, self._schema)
+        else:
+            options = _ipc.IpcWriteOptions(
+                compression="lz4" if self.fmt == "feather" else None
+            )
+            self._writer = _ipc.new_file(self.path, self._schema, options=options)
+
+    def write(self, df):
+        table = _pa.Table.from_pandas(_arrow_ready(df), preserve_index=False)
+        if self._writer is None:
+            self._open(table)
+        self._writer.write_table(table.cast(self._schema))
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        elif self._schema is None:
+            # 쓸 행이 없었으면 빈 파일 대신 아무 컬럼도 없는 파일을 남깁니다.
+            self._open(_pa.table({}))
+            self._writer.close()
+
+
+def write_batches(path, fmt, batches, progress=None, should_stop=lambda: False):
+    """
+    batches(DataFrame 이터러블)를 차례로 path에 fmt 형식으로 쓰고, 쓴 행 수를 반환합니다.
+    배치마다 progress(지금까지 쓴 행 수)를 호출하며, should_stop()이 참이 되면 쓰다 만 파일을 지우고 None을 반환합니다.
+    """
+    if fmt not in available_formats():
+        raise ValueError(f"Export format '{fmt}' is not available (pyarrow is required).")
+    sink = _CsvSink(path) if fmt == "csv" else _ArrowSink(path, fmt)
+    written = 0
+    completed = False
+    try:
+        for df in batches:
+            if should_stop():
+                return None
+            sink.write(df)
+            written += len(df)
+            if progress is not None:
+                progress(written)
+        completed = True
+    finally:
+        sink.close()
+        if not completed and os.path.exists(path):
+            os.remove(path)
+    return written
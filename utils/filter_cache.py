@@ -0,0 +1,119 @@
+import json
+from collections import OrderedDict
+
+import numpy as np
+
+
+def canonicalize_query(query):
+    """
+    쿼리 트리를 비교 가능한 형태로 정규화합니다.
+    UI 전용 키('type')를 제거하고, AND/OR 그룹의 하위 규칙 순서를 정렬합니다.
+    """
+    if "logic" in query:
+        rules = [canonicalize_query(rule) for rule in query.get("rules", [])]
+        rules.sort(key=lambda r: json.dumps(r, sort_keys=True, default=str))
+        return {"logic": query.get("logic", "AND").upper(), "rules": rules}
+    value = query.get("value")
+    if isinstance(value, tuple):
+        value = list(value)
+    return {
+        "column": query.get("column"),
+        "operator": query.get("operator"),
+        "value": value,
+    }
+
+
+class _CacheEntry:
+    __slots__ = ("row_ids", "covered_upto", "data_version")
+
+    def __init__(self, row_ids, covered_upto, data_version):
+        self.row_ids = row_ids  # 일치하는 행의 절대 행 번호 (오름차순)
+        self.covered_upto = covered_upto  # 이 절대 행 번호 이전까지 평가됨
+        self.data_version = data_version
+
+
+class FilterResultCache:
+    """
+    고급 필터 결과(일치하는 행 번호 배열)를 정규화된 쿼리 트리 기준으로 보관하는 LRU 캐시입니다.
+
+    행 번호는 데이터 로드 이후 붙는 절대 번호(위치 + row_offset)로 저장하므로,
+    실시간 append로 데이터가 늘어나면 새 행만 평가해 결과를 이어 붙이고,
+    앞쪽 행이 잘려 나가면(row_offset 증가) 해당 번호만 버립니다.
+    데이터가 새로 로드되면 clear()로 전체를 비웁니다.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(query):
+        return json.dumps(canonicalize_query(query), sort_keys=True, default=str)
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def nbytes(self):
+        return self._bytes
+
+    def get(self, key, row_offset, row_end, data_version, evaluate_tail):
+        """
+        캐시된 결과를 현재 데이터 기준의 위치 배열로 반환합니다. 없으면 None을 반환합니다.
+
+        row_offset: 현재 위치 0에 해당하는 절대 행 번호
+        row_end: 현재 마지막 행 다음의 절대 행 번호
+        evaluate_tail(start_position): start_position 이후 행들 중 일치하는 위치 배열을 반환하는 함수
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        old_bytes = entry.row_ids.nbytes
+
+        if entry.data_version != data_version:
+            # 앞쪽에서 잘려 나간 행을 버리고, 새로 추가된 행만 평가해서 이어 붙입니다.
+            row_ids = entry.row_ids
+            if row_ids.size and row_ids[0] < row_offset:
+                row_ids = row_ids[np.searchsorted(row_ids, row_offset):]
+            start = max(entry.covered_upto, row_offset)
+            if start < row_end:
+                new_positions = evaluate_tail(start - row_offset)
+                row_ids = np.concatenate(
+                    [row_ids, np.asarray(new_positions, dtype=np.int64) + row_offset]
+                )
+            entry.row_ids = row_ids
+            entry.covered_upto = row_end
+            entry.data_version = data_version
+            self._bytes += entry.row_ids.nbytes - old_bytes
+            self._evict()
+
+        return entry.row_ids - row_offset
+
+    def put(self, key, positions, row_offset, row_end, data_version):
+        """위치 배열을 절대 행 번호로 바꾸어 저장합니다. 예산보다 큰 결과는 저장하지 않습니다."""
+        row_ids = np.asarray(positions, dtype=np.int64) + row_offset
+        if row_ids.nbytes > self.max_bytes:
+            return
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old.row_ids.nbytes
+        self._entries[key] = _CacheEntry(row_ids, row_end, data_version)
+        self._bytes += row_ids.nbytes
+        self._evict()
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.row_ids.nbytes
@@ -0,0 +1,34 @@
+import time
+
+import numpy as np
+from PySide6.QtCore import Signal
+
+from utils.worker_base import BackgroundWorker
+
+
+class FilterWorker(BackgroundWorker):
+    """
+    백그라운드에서 필터와 일치하는 행을 계산하는 QThread 입니다.
+    generation은 요청 번호로, 결과를 받는 쪽에서 최신 요청의 결과인지 확인하는 데 사용합니다.
+    cancel()된 검색은 다음 블록 경계에서 멈추고 결과를 보내지 않습니다.
+    """
+    result_ready = Signal(int, object, float)  # (generation, 일치한 행 번호 배열, 걸린 시간(초))
+    error = Signal(int, str)
+
+    def __init__(self, generation, job, parent=None):
+        super().__init__(parent)
+        self.generation = generation
+        self.job = job
+
+    def run(self):
+        started = time.perf_counter()
+        try:
+            mask = self.job(self.is_cancelled)
+        except Exception as e:
+            self.error.emit(self.generation, str(e))
+            return
+        if mask is None or self.is_cancelled():
+            return
+        self.result_ready.emit(
+            self.generation, np.flatnonzero(mask), time.perf_counter() - started
+        )
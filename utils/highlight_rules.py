@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+
+from utils.query_language import compile_query
+
+# 일치하는 규칙이 없는 행의 스타일 번호
+NO_STYLE = -1
+
+
+def _condition_mask(series, op, value):
+    """
+    하이라이트 조건 하나(LogTableModel.check_rule과 같은 의미, 대소문자 무시)를 벡터 연산으로 평가합니다.
+    고유값에 대해서만 문자열 비교를 하고, 결과를 행으로 펼칩니다.
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    texts = pd.Series(uniques, dtype=object).map(str).str.lower()
+    check_value = value.lower()
+
+    if op == "contains":
+        hits = texts.str.contains(check_value, regex=False)
+    elif op == "equals":
+        hits = texts == check_value
+    elif op == "starts with":
+        hits = texts.str.startswith(check_value)
+    elif op == "ends with":
+        hits = texts.str.endswith(check_value)
+    else:
+        return np.zeros(len(series), dtype=bool)
+
+    hits = hits.to_numpy(dtype=bool)
+    # 결측값(codes == -1)은 str(nan) == 'nan'으로 비교합니다.
+    na_hit = _condition_mask_scalar("nan", op, check_value)
+    return np.where(codes >= 0, hits[codes] if len(hits) else False, na_hit)
+
+
+def _condition_mask_scalar(cell_value, op, check_value):
+    if op == "contains":
+        return check_value in cell_value
+    if op == "equals":
+        return check_value == cell_value
+    if op == "starts with":
+        return cell_value.startswith(check_value)
+    if op == "ends with":
+        return cell_value.endswith(check_value)
+    return False
+
+
+def rule_mask(df, rule):
+    """하이라이트 규칙 하나가 적용되는 행을 True로 표시한 boolean 배열을 반환합니다."""
+    query_text = rule.get("query")
+    if query_text:
+        # 텍스트 쿼리 규칙은 조건 목록 대신 컴파일된 쿼리로 평가합니다.
+        try:
+            return np.asarray(compile_query(query_text).mask(df), dtype=bool)
+        except Exception as e:
+            print(f"Invalid highlight query {query_text!r}: {e}")
+            return np.zeros(len(df), dtype=bool)
+
+    mask = np.ones(len(df), dtype=bool)
+    for condition in rule.get("conditions", []):
+        col = condition.get("column")
+        op = condition.get("operator")
+        val = condition.get("value")
+        if not all([col, op, val]) or col not in df.columns:
+            # 조건이 불완전하면 규칙 불일치
+            return np.zeros(len(df), dtype=bool)
+        mask &= _condition_mask(df[col], op, val)
+        if not mask.any():
+            break
+    return mask
+
+
+def compute_style_indices(df, rules):
+    """
+    각 행에 적용할 (배경색 규칙 번호, 글자색 규칙 번호) 배열을 계산합니다.
+    규칙 목록의 앞쪽이 우선하며, 해당 색을 지정한 규칙이 없으면 NO_STYLE(-1)입니다.
+    """
+    background = np.full(len(df), NO_STYLE, dtype=np.int16)
+    foreground = np.full(len(df), NO_STYLE, dtype=np.int16)
+    for number, rule in enumerate(rules):
+        if not rule.get("enabled", False):
+            continue
+        if not (rule.get("background") or rule.get("foreground")):
+            continue
+        mask = rule_mask(df, rule)
+        if rule.get("background"):
+            background[mask & (background == NO_STYLE)] = number
+        if rule.get("foreground"):
+            foreground[mask & (foreground == NO_STYLE)] = number
+    return background, foreground
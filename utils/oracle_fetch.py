@@ -0,0 +1,177 @@
+import time
+
+import oracledb
+import pandas as pd
+
+try:
+    # python-oracledb의 DataFrame(Arrow) 조회 결과를 pandas로 옮길 때 사용합니다. (선택 사항)
+    import pyarrow as _pa
+except ImportError:
+    _pa = None
+
+# OracleFetcherThread 조회 쿼리의 결과 컬럼 순서 그대로의 애플리케이션 컬럼 이름
+LOG_COLUMNS = [
+    "SystemDate",
+    "NumericalTimeStamp",
+    "LevelID",
+    "Category",
+    "MethodID",
+    "DeviceID",
+    "TrackingID",
+    "MessageName",
+    "AsciiData",
+    "BinaryData",
+]
+
+# 한 번의 왕복(round trip)으로 가져오는 행 수의 범위
+MIN_ARRAYSIZE = 100
+MAX_ARRAYSIZE = 20000
+# 시간 범위 조회의 첫 배치 크기와, 배치 하나를 가져오는 데 목표로 하는 시간(초)
+INITIAL_ARRAYSIZE = 2000
+TARGET_BATCH_SECONDS = 0.25
+# Arrow(DataFrame) 조회의 배치 크기. 드라이버가 고정 크기로 가져오므로 첫 화면이 늦지 않을 만큼으로 둡니다.
+ARROW_BATCH_ROWS = 10000
+
+
+def _clamp(size):
+    return int(min(max(size, MIN_ARRAYSIZE), MAX_ARRAYSIZE))
+
+
+def lob_output_type_handler(cursor, metadata):
+    """
+    CLOB/NCLOB(AsciiData)은 문자열, BLOB(BinaryData)은 bytes로 바로 가져오는 출력 타입 핸들러입니다.
+    LOB 로케이터를 받아 행마다 read()로 다시 왕복하지 않습니다.
+    """
+    if metadata.type_code in (oracledb.DB_TYPE_CLOB, oracledb.DB_TYPE_NCLOB):
+        return cursor.var(oracledb.DB_TYPE_LONG, arraysize=cursor.arraysize)
+    if metadata.type_code is oracledb.DB_TYPE_BLOB:
+        return cursor.var(oracledb.DB_TYPE_LONG_RAW, arraysize=cursor.arraysize)
+    return None
+
+
+def tune_cursor(cursor, expected_rows):
+    """
+    예상 행 수에 맞춰 arraysize와 prefetchrows를 정합니다.
+    prefetchrows를 arraysize + 1로 두면 예상만큼의 결과는 execute 응답 한 번에 끝까지 받아옵니다.
+    """
+    cursor.arraysize = _clamp(expected_rows)
+    cursor.prefetchrows = cursor.arraysize + 1
+    cursor.outputtypehandler = lob_output_type_handler
+
+
+class AdaptiveBatchSize:
+    """
+    배치를 가져오는 데 걸린 시간을 보고 다음 배치 크기를 조절합니다.
+    빠르면 두 배로 늘려 왕복 횟수를 줄이고, 목표 시간보다 오래 걸리면 절반으로 줄여 화면에 자주 보냅니다.
+    """
+
+    def __init__(self, initial=INITIAL_ARRAYSIZE):
+        self.size = _clamp(initial)
+
+    def update(self, rows, elapsed):
+        if rows < self.size:
+            return  # 마지막 배치는 크기를 판단하는 데 쓰지 않습니다.
+        if elapsed < TARGET_BATCH_SECONDS / 2:
+            self.size = _clamp(self.size * 2)
+        elif elapsed > TARGET_BATCH_SECONDS * 2:
+            self.size = _clamp(self.size // 2)
+
+
+def arrow_frame(odf):
+    """python-oracledb DataFrame(Arrow 컬럼 배열)을 pandas DataFrame으로 옮깁니다. (행 튜플을 거치지 않음)"""
+    df = _pa.table(odf).to_pandas()
+    df.columns = LOG_COLUMNS[: len(df.columns)]
+    # 정밀도를 정하지 않은 NUMBER는 Arrow에서 double로 오므로, 커서 조회처럼 정수 값이면 int64로 되돌립니다.
+    for col in df.columns:
+        values = df[col]
+        if values.dtype.kind == "f" and values.notna().all() and (values % 1 == 0).all():
+            df[col] = values.astype("int64")
+    return df
+
+
+# DataFrame(Arrow) 조회가 변환할 수 있는 컬럼 타입. 이 밖의 타입이 결과에 있으면 처음부터 커서 조회를 씁니다.
+_ARROW_TYPES = frozenset(
+    (
+        oracledb.DB_TYPE_BINARY_DOUBLE,
+        oracledb.DB_TYPE_BINARY_FLOAT,
+        oracledb.DB_TYPE_BLOB,
+        oracledb.DB_TYPE_BOOLEAN,
+        oracledb.DB_TYPE_CHAR,
+        oracledb.DB_TYPE_CLOB,
+        oracledb.DB_TYPE_DATE,
+        oracledb.DB_TYPE_LONG,
+        oracledb.DB_TYPE_LONG_RAW,
+        oracledb.DB_TYPE_NCHAR,
+        oracledb.DB_TYPE_NCLOB,
+        oracledb.DB_TYPE_NUMBER,
+        oracledb.DB_TYPE_NVARCHAR,
+        oracledb.DB_TYPE_RAW,
+        oracledb.DB_TYPE_TIMESTAMP,
+        oracledb.DB_TYPE_TIMESTAMP_LTZ,
+        oracledb.DB_TYPE_TIMESTAMP_TZ,
+        oracledb.DB_TYPE_VARCHAR,
+    )
+)
+
+
+def supports_arrow_fetch(connection, statement=None):
+    """
+    드라이버의 DataFrame 조회(python-oracledb 3.0 이상)와 pyarrow를 모두 쓸 수 있는지 확인합니다.
+    statement를 주면 실행하지 않고 파싱만 해서 결과 컬럼 타입이 모두 Arrow로 변환되는지도 봅니다.
+    """
+    if _pa is None or not hasattr(connection, "fetch_df_batches"):
+        return False
+    if statement is None:
+        return True
+    with connection.cursor() as cursor:
+        cursor.parse(statement)
+        description = cursor.description or ()
+    return all(column.type_code in _ARROW_TYPES for column in description)
+
+
+def _iter_arrow_frames(connection, statement, params, should_continue, batch_size):
+    batches = connection.fetch_df_batches(statement, params, size=batch_size or ARROW_BATCH_ROWS)
+    for odf in batches:
+        yield arrow_frame(odf)
+        if not should_continue():
+            return
+
+
+def _iter_cursor_frames(connection, statement, params, should_continue, batch_size):
+    batch = AdaptiveBatchSize(batch_size or INITIAL_ARRAYSIZE)
+    with connection.cursor() as cursor:
+        tune_cursor(cursor, batch.size)
+        cursor.execute(statement, params)
+        while should_continue():
+            # 드라이버는 cursor.arraysize 만큼씩 왕복하므로, 조절한 배치 크기를 매번 커서에 반영합니다.
+            cursor.arraysize = batch.size
+            started = time.perf_counter()
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            batch.update(len(rows), time.perf_counter() - started)
+            # 행 튜플 목록에서 바로 컬럼 이름을 붙여 만듭니다. (이름 변경을 위한 추가 복사 없음)
+            yield pd.DataFrame(rows, columns=LOG_COLUMNS[: len(cursor.description)])
+
+
+def iter_frames(connection, statement, params, should_continue=lambda: True, batch_size=None):
+    """
+    쿼리 결과를 LOG_COLUMNS 이름의 DataFrame 배치로 차례로 돌려줍니다.
+    가능하면 드라이버가 만든 Arrow 컬럼 배열을 그대로 받고(batch_size 고정, 기본 ARROW_BATCH_ROWS),
+    아니면 커서로 받아 배치 크기를 걸린 시간에 맞춰 조절합니다. should_continue()가 거짓이면 멈춥니다.
+    """
+    if supports_arrow_fetch(connection, statement):
+        frames = _iter_arrow_frames(connection, statement, params, should_continue, batch_size)
+        yielded = False
+        try:
+            for frame in frames:
+                yielded = True
+                yield frame
+            return
+        except oracledb.NotSupportedError:
+            # 컬럼 타입은 미리 확인했으므로 여기까지 오는 경우는 드뭅니다.
+            # 아직 아무 배치도 보내지 않았으면 커서 조회로 넘어가고, 보낸 뒤라면 중복/누락을 막기 위해 그대로 알립니다.
+            if yielded:
+                raise
+
+    yield from _iter_cursor_frames(connection, statement, params, should_continue, batch_size)
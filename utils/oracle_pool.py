@@ -0,0 +1,141 @@
+import threading
+from contextlib import contextmanager
+
+import oracledb
+
+# 세션 풀 기본 설정. config.json의 "oracle_pool" 항목으로 바꿀 수 있습니다.
+DEFAULT_POOL_SETTINGS = {
+    "min": 1,  # 항상 열어 두는 세션 수
+    "max": 4,  # 최대 세션 수 (조회, 실시간 추적, 연결 테스트 등이 동시에 빌리는 수)
+    "increment": 1,  # 세션이 모자랄 때 한 번에 더 여는 수
+    "stmtcachesize": 40,  # 세션별 문장 캐시 크기 (반복 쿼리를 다시 파싱하지 않음)
+    "ping_interval": 60,  # 이 시간(초) 넘게 쉬던 세션은 빌려줄 때 살아 있는지 확인하고, 끊겼으면 새로 엽니다
+    "timeout": 300,  # min을 넘는 세션이 이 시간(초) 넘게 쉬면 닫습니다
+    "wait_timeout": 10000,  # 모든 세션이 사용 중일 때 기다리는 최대 시간(ms)
+}
+
+
+def connect_params(conn_info):
+    """
+    접속 정보(connections.json 항목)를 oracledb 연결 인자로 바꿉니다.
+    host/port와 sid 또는 service_name이 있으면 DSN을 만들고, 없으면 주어진 dsn을 그대로 사용합니다.
+    """
+    params = dict(conn_info)
+    params.pop("type", None)
+
+    if all(k in params for k in ["host", "port"]) and ("sid" in params or "service_name" in params):
+        host = params.pop("host")
+        port = int(params.pop("port"))
+
+        # service_name이 있으면 우선적으로 사용합니다.
+        if "service_name" in params:
+            service_name = params.pop("service_name")
+            params.pop("sid", None)
+            params["dsn"] = oracledb.makedsn(host, port, service_name=service_name)
+        else:
+            params["dsn"] = oracledb.makedsn(host, port, sid=params.pop("sid"))
+
+    if not params.get("dsn"):
+        raise ValueError("DSN을 생성할 수 없습니다. 'host', 'port', 'sid' 또는 'service_name'을 확인하세요.")
+    return params
+
+
+class OraclePoolManager:
+    """
+    접속 프로필별 oracledb 세션 풀을 만들어 두고 세션을 빌려주는 관리자입니다.
+    같은 접속 정보로 들어온 조회, 재조회, 실시간 추적, 연결 테스트는 모두 같은 풀의 세션을 재사용하므로
+    매번 TCP 연결, 인증, 세션 생성 비용을 치르지 않습니다.
+    """
+
+    def __init__(self, settings=None):
+        self.settings = dict(DEFAULT_POOL_SETTINGS)
+        self.configure(settings)
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    def configure(self, settings):
+        """풀 설정을 바꿉니다. 이미 만들어진 풀에는 적용되지 않고, 이후 새로 만드는 풀부터 적용됩니다."""
+        if settings:
+            self.settings.update(
+                {k: v for k, v in settings.items() if k in DEFAULT_POOL_SETTINGS}
+            )
+
+    @staticmethod
+    def _key(params):
+        return tuple(sorted((k, str(v)) for k, v in params.items()))
+
+    def get_pool(self, conn_info):
+        """접속 정보에 해당하는 풀을 반환합니다. 처음 요청될 때 만듭니다."""
+        params = connect_params(conn_info)
+        key = self._key(params)
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = oracledb.create_pool(
+                    **params,
+                    **self.settings,
+                    getmode=oracledb.POOL_GETMODE_TIMEDWAIT,
+                )
+                self._pools[key] = pool
+        return pool
+
+    def acquire(self, conn_info):
+        """풀에서 세션을 빌립니다. 다 쓴 세션은 close()를 호출하면 풀로 돌아갑니다."""
+        return self.get_pool(conn_info).acquire()
+
+    @contextmanager
+    def connection(self, conn_info):
+        """with 블록 동안 세션을 빌렸다가 끝나면 풀로 돌려줍니다."""
+        connection = self.acquire(conn_info)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    def discard(self, conn_info):
+        """접속 정보의 풀을 닫고 버립니다. (인증 실패 등으로 다시 만들어야 할 때)"""
+        try:
+            key = self._key(connect_params(conn_info))
+        except ValueError:
+            return
+        with self._lock:
+            pool = self._pools.pop(key, None)
+        if pool is not None:
+            pool.close(force=True)
+
+    def close_all(self):
+        """모든 풀을 닫습니다. (프로그램 종료 시)"""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            try:
+                pool.close(force=True)
+            except oracledb.Error as e:
+                print(f"Error closing Oracle session pool: {e}")
+
+    def stats(self, conn_info):
+        """(열린 세션 수, 사용 중인 세션 수)를 반환합니다. 풀이 아직 없으면 None."""
+        try:
+            key = self._key(connect_params(conn_info))
+        except ValueError:
+            return None
+        with self._lock:
+            pool = self._pools.get(key)
+        return None if pool is None else (pool.opened, pool.busy)
+
+
+_shared_manager = None
+_shared_lock = threading.Lock()
+
+
+def shared_pool_manager():
+    """
+    프로세스 전체에서 함께 쓰는 풀 관리자를 반환합니다.
+    접속 관리 창의 연결 테스트로 열린 세션을 이후 컨트롤러의 조회가 그대로 이어받습니다.
+    """
+    global _shared_manager
+    with _shared_lock:
+        if _shared_manager is None:
+            _shared_manager = OraclePoolManager()
+        return _shared_manager
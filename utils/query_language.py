@@ -0,0 +1,421 @@
+import fnmatch
+import re
+from functools import lru_cache
+
+import numpy as np
+
+from utils.query_operators import (
+    COMPARISON_OPERATORS,
+    LIST_OPERATOR,
+    RANGE_OPERATOR,
+    build_between_mask,
+    build_comparison_mask,
+    build_in_list_mask,
+)
+from utils.regex_cache import compile_pattern, regex_match_mask
+from utils.search_text import build_search_text
+from utils.time_index import (
+    MISSING_TIMESTAMP,
+    extract_timestamps,
+    is_time_rule,
+    time_rule_bounds,
+)
+
+# 텍스트 쿼리 문법 (예: cat:Com AND dev:J1FCNV* AND ascii~"IDRead.*LHAE")
+#   field:value      같음 (대소문자 무시). 값에 * 또는 ?가 있으면 와일드카드, *abc*는 포함
+#   field~"regex"    정규식 검색
+#   field!=value     같지 않음 (-field:*abc* 는 포함하지 않음)
+#   field>=10, field<"2024-01-01 10:00"   비교
+#   field:a..b       범위 (양 끝 포함),  field:(a,b,c)  목록 중 하나
+#   after:"...", before:"...", time:a..b  시간 조건 (숫자만 쓰면 날짜 20240101, epoch ms는 1735689600000ms)
+#   "text" 또는 text  (필드 없이) 모든 컬럼에서 포함 검색
+#   AND / OR / 괄호. 공백으로 나열하면 AND 입니다.
+
+# 필드 약어 -> 컬럼 이름
+FIELD_ALIASES = {
+    "cat": "Category",
+    "category": "Category",
+    "level": "LevelID",
+    "lvl": "LevelID",
+    "dev": "DeviceID",
+    "device": "DeviceID",
+    "method": "MethodID",
+    "tid": "TrackingID",
+    "track": "TrackingID",
+    "ascii": "AsciiData",
+    "msg": "MessageName",
+    "src": "SourceID",
+    "ts": "NumericalTimeStamp",
+    "time": "SystemDate",
+}
+TIME_SHORTCUTS = {"after": "After", "before": "Before"}
+
+# 모든 컬럼을 대상으로 하는 규칙의 컬럼 이름
+ANY_COLUMN = "*"
+
+_VALUE = r'"(?:[^"\\]|\\.)*"|\([^)]*\)|[^\s()]+'
+_TOKEN_RE = re.compile(
+    r"\s*(?:"
+    r"(?P<lparen>\()|(?P<rparen>\))"
+    r"|(?P<cond>(?P<neg>-)?(?P<field>[A-Za-z_][\w.]*)\s*"
+    r"(?P<op>>=|<=|!=|!~|[:~<>=])\s*(?P<value>" + _VALUE + r"))"
+    r"|(?P<word>" + _VALUE + r")"
+    r")"
+)
+_FIELD_HINT_RE = re.compile(r"(?:^|[\s(])-?([A-Za-z_][\w.]*)\s*(?:>=|<=|!=|!~|[:~<>=])\S")
+
+
+class QuerySyntaxError(ValueError):
+    """텍스트 쿼리를 해석할 수 없을 때 발생합니다."""
+
+
+def looks_like_query(text, columns=None):
+    """
+    입력이 (단순 검색어가 아닌) 텍스트 쿼리 문법을 사용하는지 빠르게 확인합니다.
+    'ERROR: timeout' 같은 일반 검색어를 쿼리로 오인하지 않도록, 필드 이름이 약어나 실제 컬럼일 때만 쿼리로 봅니다.
+    """
+    if not text:
+        return False
+    known = set(FIELD_ALIASES) | set(TIME_SHORTCUTS)
+    known |= {str(c).lower() for c in (columns or [])}
+    return any(
+        field.lower() in known for field in _FIELD_HINT_RE.findall(text)
+    )
+
+
+def _unquote(value):
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        # 정규식의 역슬래시(\d 등)는 그대로 두고 \" 와 \\ 만 풉니다.
+        return re.sub(r'\\([\\"])', r"\1", value[1:-1]), True
+    return value, False
+
+
+def _tokenize(text):
+    tokens = []
+    pos = 0
+    text = text.strip()
+    while pos < len(text):
+        match = _TOKEN_RE.match(text, pos)
+        if not match or match.end() == pos:
+            raise QuerySyntaxError(f"Unexpected input at position {pos}: {text[pos:pos + 20]!r}")
+        pos = match.end()
+        if match.group("lparen"):
+            tokens.append(("(", None))
+        elif match.group("rparen"):
+            tokens.append((")", None))
+        elif match.group("cond"):
+            tokens.append(("cond", match.groupdict()))
+        else:
+            word = match.group("word")
+            if word.upper() in ("AND", "OR"):
+                tokens.append((word.upper(), None))
+            else:
+                tokens.append(("word", word))
+        while pos < len(text) and text[pos].isspace():
+            pos += 1
+    return tokens
+
+
+def _resolve_field(field):
+    return FIELD_ALIASES.get(field.lower(), field)
+
+
+def _glob_rule(column, value, negate):
+    """와일드카드 값을 가장 값싼 연산자로 바꿉니다. (*abc* -> 포함, 그 외 -> 정규식)"""
+    inner = value[1:-1]
+    if (
+        len(value) >= 2
+        and value.startswith("*")
+        and value.endswith("*")
+        and inner
+        and not any(ch in inner for ch in "*?[")
+    ):
+        operator = "Does Not Contain" if negate else "Contains"
+        # 와일드카드 안의 글자는 정규식이 아니므로, 어디서 평가하든 리터럴로 찾도록 표시합니다.
+        return {"column": column, "operator": operator, "value": inner, "literal": True}
+    if negate:
+        raise QuerySyntaxError(f"Negated wildcard is only supported as -field:*text*: {value!r}")
+    pattern = "(?i)" + fnmatch.translate(value)
+    return {"column": column, "operator": "Matches Regex", "value": pattern}
+
+
+def _condition_rule(parts):
+    field, op = parts["field"], parts["op"]
+    raw_value = parts["value"]
+    negate = bool(parts["neg"])
+
+    if field.lower() in TIME_SHORTCUTS and op == ":":
+        value, _ = _unquote(raw_value)
+        return {"column": "SystemDate", "operator": TIME_SHORTCUTS[field.lower()], "value": value}
+
+    column = _resolve_field(field)
+
+    if raw_value.startswith("(") and op == ":":
+        if negate:
+            raise QuerySyntaxError("Negated lists are not supported.")
+        items = [_unquote(item.strip())[0] for item in raw_value[1:-1].split(",")]
+        return {"column": column, "operator": LIST_OPERATOR, "value": [i for i in items if i]}
+
+    value, quoted = _unquote(raw_value)
+
+    if op in ("~", "!~"):
+        if negate or op == "!~":
+            raise QuerySyntaxError("Negated regular expressions are not supported.")
+        # 'Matches Regex'는 문자열 시작부터 일치를 보므로, 어디서든 찾도록 앞을 열어 둡니다.
+        return {"column": column, "operator": "Matches Regex", "value": f"(?s:.*?)(?:{value})"}
+
+    if op in COMPARISON_OPERATORS:
+        if negate:
+            raise QuerySyntaxError("Use the opposite comparison instead of '-' for comparisons.")
+        return {"column": column, "operator": op, "value": value}
+
+    if op == "!=":
+        negate = not negate
+    elif op not in (":", "="):
+        raise QuerySyntaxError(f"Unsupported operator: {op}")
+
+    if not quoted and ".." in value:
+        if negate:
+            raise QuerySyntaxError("Negated ranges are not supported.")
+        start, end = value.split("..", 1)
+        return {"column": column, "operator": RANGE_OPERATOR, "value": [start, end]}
+
+    if not quoted and any(ch in value for ch in "*?"):
+        return _glob_rule(column, value, negate)
+
+    return {"column": column, "operator": "Not Equals" if negate else "Equals", "value": value}
+
+
+class _Parser:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else None
+
+    def take(self):
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def parse(self):
+        if not self.tokens:
+            raise QuerySyntaxError("Empty query.")
+        node = self.parse_or()
+        if self.pos != len(self.tokens):
+            raise QuerySyntaxError(f"Unexpected token: {self.tokens[self.pos][0]}")
+        return node
+
+    def parse_or(self):
+        rules = [self.parse_and()]
+        while self.peek() == "OR":
+            self.take()
+            rules.append(self.parse_and())
+        return rules[0] if len(rules) == 1 else {"logic": "OR", "rules": rules}
+
+    def parse_and(self):
+        rules = [self.parse_term()]
+        while self.peek() not in (None, "OR", ")"):
+            if self.peek() == "AND":
+                self.take()
+            rules.append(self.parse_term())
+        return rules[0] if len(rules) == 1 else {"logic": "AND", "rules": rules}
+
+    def parse_term(self):
+        kind = self.peek()
+        if kind == "(":
+            self.take()
+            node = self.parse_or()
+            if self.peek() != ")":
+                raise QuerySyntaxError("Missing closing parenthesis.")
+            self.take()
+            return node
+        if kind == "cond":
+            return _condition_rule(self.take()[1])
+        if kind == "word":
+            value, _ = _unquote(self.take()[1])
+            return {"column": ANY_COLUMN, "operator": "Contains", "value": value}
+        raise QuerySyntaxError(f"Unexpected token: {kind}")
+
+
+def parse_query(text):
+    """
+    텍스트 쿼리를 고급 필터와 같은 규칙 트리({"logic": ..., "rules": [...]})로 변환합니다.
+    문법 오류가 있으면 QuerySyntaxError를 발생시킵니다.
+    """
+    node = _Parser(_tokenize(text)).parse()
+    if "logic" not in node:
+        node = {"logic": "AND", "rules": [node]}
+    check_time_values(node)
+    return node
+
+
+def _time_bounds(rule):
+    try:
+        return time_rule_bounds(rule["operator"], rule["value"], rule.get("column"))
+    except (TypeError, ValueError) as e:
+        raise QuerySyntaxError(f"{rule.get('operator')}: {e}") from e
+
+
+def check_time_values(query):
+    """
+    규칙 트리의 시간 규칙 값이 모두 시간으로 해석되는지 확인합니다.
+    비어 있거나 해석할 수 없는 값이 있으면 QuerySyntaxError를 발생시킵니다. (필터가 조용히 풀리지 않도록)
+    """
+    for rule in (query or {}).get("rules", []):
+        if "logic" in rule:
+            check_time_values(rule)
+        elif is_time_rule(rule):
+            _time_bounds(rule)
+
+
+def resolve_column(columns, column):
+    """
+    규칙의 컬럼 이름을 실제 컬럼 이름으로 바꿉니다. 같은 이름이 없으면 대소문자를 무시하고 찾습니다.
+    텍스트 쿼리와 고급 필터가 모두 이 규칙을 쓰며, 없는 컬럼이면 QuerySyntaxError를 발생시킵니다.
+    """
+    if column in columns:
+        return column
+    lowered = str(column).lower()
+    for name in columns:
+        if str(name).lower() == lowered:
+            return name
+    raise QuerySyntaxError(f"Unknown column: {column}")
+
+
+def check_columns(query, columns):
+    """규칙 트리가 가리키는 컬럼이 모두 columns에 있는지 확인합니다. 없으면 QuerySyntaxError를 발생시킵니다."""
+    for rule in (query or {}).get("rules", []):
+        if "logic" in rule:
+            check_columns(rule, columns)
+        elif rule.get("column") != ANY_COLUMN and not is_time_rule(rule):
+            resolve_column(columns, rule.get("column"))
+
+
+def _column_of(df, column):
+    return df[resolve_column(df.columns, column)]
+
+
+def _check_pattern(pattern, flags=0):
+    try:
+        compile_pattern(pattern, flags)
+    except re.error as e:
+        raise QuerySyntaxError(f"Invalid regular expression {pattern!r}: {e}") from e
+
+
+def _compile_rule(rule):
+    """규칙 하나를 (df, 실행 문맥) -> boolean 배열 함수로 미리 변환합니다. 값 파싱/정규식 컴파일은 여기서 한 번만 합니다."""
+    column, op, value = rule["column"], rule["operator"], rule["value"]
+
+    if is_time_rule(rule):
+        start, end = _time_bounds(rule)
+
+        def time_mask(df, context):
+            ts = context.get("timestamps")
+            if ts is None:
+                ts = context["timestamps"] = extract_timestamps(df)
+            mask = ts != MISSING_TIMESTAMP
+            if start is not None:
+                mask &= ts >= start
+            if end is not None:
+                mask &= ts <= end
+            return mask
+
+        return time_mask
+
+    if column == ANY_COLUMN:
+        needle = str(value).lower()
+
+        def any_column_mask(df, context):
+            text = context.get("search_text")
+            if text is None:
+                text = context["search_text"] = build_search_text(df)
+            return text.str.contains(needle, regex=False, na=False).to_numpy(dtype=bool)
+
+        return any_column_mask
+
+    if op == "Matches Regex":
+        _check_pattern(value)  # 문법 오류를 미리 확인하고 캐시에 올려 둡니다.
+
+        def series_mask(series):
+            return regex_match_mask(series, value)
+
+    elif op in ("Contains", "Does Not Contain"):
+        # 고급 필터(AppController)와 같이, literal 표시가 없으면 값을 정규식으로 찾습니다.
+        literal = bool(rule.get("literal"))
+        needle = str(value)
+        if not literal:
+            _check_pattern(needle, re.IGNORECASE)
+
+        def series_mask(series):
+            mask = series.astype(str).str.contains(needle, case=False, regex=not literal, na=False)
+            return ~mask if op == "Does Not Contain" else mask
+
+    elif op in ("Equals", "Not Equals"):
+        lowered = str(value).lower()
+
+        def series_mask(series):
+            mask = series.astype(str).str.lower() == lowered
+            return ~mask if op == "Not Equals" else mask
+
+    elif op in COMPARISON_OPERATORS:
+
+        def series_mask(series):
+            return build_comparison_mask(series, op, value)
+
+    elif op == RANGE_OPERATOR:
+
+        def series_mask(series):
+            return build_between_mask(series, value)
+
+    elif op == LIST_OPERATOR:
+
+        def series_mask(series):
+            return build_in_list_mask(series, value)
+
+    else:
+        raise QuerySyntaxError(f"Unsupported operator: {op}")
+
+    def column_mask(df, context):
+        series = _column_of(df, column)
+        return np.asarray(series_mask(series).fillna(False), dtype=bool)
+
+    return column_mask
+
+
+def _compile_node(node):
+    if "logic" not in node:
+        return _compile_rule(node)
+    children = [_compile_node(rule) for rule in node.get("rules", [])]
+    combine = np.logical_or if node.get("logic", "AND").upper() == "OR" else np.logical_and
+
+    def group_mask(df, context):
+        if not children:
+            return np.ones(len(df), dtype=bool)
+        result = children[0](df, context)
+        for child in children[1:]:
+            result = combine(result, child(df, context))
+        return result
+
+    return group_mask
+
+
+class QueryPlan:
+    """규칙 트리를 미리 컴파일한 벡터 연산 계획입니다. mask(df)로 행별 일치 여부 배열을 얻습니다."""
+
+    def __init__(self, tree, text=None):
+        self.text = text
+        self.tree = tree
+        self._evaluate = _compile_node(tree)
+
+    def mask(self, df):
+        if df is None or df.empty:
+            return np.zeros(0 if df is None else len(df), dtype=bool)
+        return np.asarray(self._evaluate(df, {}), dtype=bool)
+
+
+@lru_cache(maxsize=128)
+def compile_query(text):
+    """텍스트 쿼리를 파싱하고 컴파일한 QueryPlan을 반환합니다. 같은 텍스트는 캐시된 계획을 재사용합니다."""
+    return QueryPlan(parse_query(text), text=text)
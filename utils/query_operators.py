@@ -0,0 +1,88 @@
+import operator
+
+import numpy as np
+import pandas as pd
+
+# 비교 연산자 이름 -> 파이썬 연산자 함수
+COMPARISON_OPERATORS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+RANGE_OPERATOR = "Between"
+LIST_OPERATOR = "In List"
+
+
+def split_range_value(value):
+    """'Between' 값(리스트/튜플 또는 'A ~ B' 문자열)을 (시작, 끝) 튜플로 분리합니다."""
+    if isinstance(value, (list, tuple)) and len(value) == 2:
+        return value[0], value[1]
+    if isinstance(value, str) and "~" in value:
+        start, end = value.split("~", 1)
+        return start.strip(), end.strip()
+    raise ValueError(f"Invalid range value: {value!r}")
+
+
+def split_list_value(value):
+    """'In List' 값(리스트 또는 쉼표로 구분된 문자열)을 문자열 리스트로 분리합니다."""
+    if isinstance(value, (list, tuple)):
+        items = value
+    else:
+        items = str(value).split(",")
+    return [str(item).strip() for item in items if str(item).strip()]
+
+
+def to_number(value):
+    """값을 float로 변환합니다. 숫자가 아니면 None을 반환합니다."""
+    if isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool):
+        return None if pd.isna(value) else float(value)
+    try:
+        return float(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def to_sql_param(value):
+    """Oracle 바인드 변수 값으로 변환합니다. 숫자라면 NUMBER 비교가 되도록 int/float로 넘깁니다."""
+    number = to_number(value)
+    if number is None:
+        return value
+    return int(number) if number.is_integer() else number
+
+
+def numeric_view(series):
+    """컬럼을 숫자 Series로 봅니다. 이미 숫자 dtype이면 그대로, 아니면 변환(실패 시 NaN)합니다."""
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return series
+    return pd.to_numeric(series.astype(str).str.strip(), errors="coerce")
+
+
+def build_comparison_mask(series, op, value):
+    """
+    <, <=, >, >= 비교를 벡터 연산으로 수행합니다.
+    값이 숫자면 컬럼의 숫자 값으로, 아니면 문자열 사전순으로 비교합니다.
+    """
+    compare = COMPARISON_OPERATORS[op]
+    number = to_number(value)
+    if number is not None:
+        return compare(numeric_view(series), number).fillna(False).astype(bool)
+    return compare(series.astype(str), str(value)).fillna(False).astype(bool)
+
+
+def build_between_mask(series, value):
+    """양 끝을 포함하는 Between 비교를 벡터 연산으로 수행합니다."""
+    start, end = split_range_value(value)
+    return build_comparison_mask(series, ">=", start) & build_comparison_mask(
+        series, "<=", end
+    )
+
+
+def build_in_list_mask(series, value):
+    """컬럼 값이 목록 중 하나와 일치(대소문자 무시)하는지 벡터 연산으로 확인합니다."""
+    items = split_list_value(value)
+    numbers = [to_number(item) for item in items]
+    if items and all(n is not None for n in numbers) and pd.api.types.is_numeric_dtype(series):
+        return series.isin(numbers)
+    lowered = [item.lower() for item in items]
+    return series.astype(str).str.strip().str.lower().isin(lowered)
@@ -0,0 +1,149 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+try:
+    import re._parser as sre_parse  # Python 3.11+
+    from re._constants import BRANCH, LITERAL, MAX_REPEAT, MIN_REPEAT, SUBPATTERN
+except ImportError:
+    import sre_parse
+    from sre_constants import BRANCH, LITERAL, MAX_REPEAT, MIN_REPEAT, SUBPATTERN
+
+# 사전 필터에 사용할 리터럴의 최소 길이와 최대 개수
+MIN_LITERAL_LENGTH = 3
+MAX_PREFILTER_LITERALS = 3
+
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern, flags=0):
+    """정규식을 한 번만 컴파일하여 재사용합니다. (필터, 시나리오 추출기 공용 캐시)"""
+    return re.compile(pattern, flags)
+
+
+def _collect_literals(items, literals):
+    """파싱된 정규식에서 모든 일치 결과에 반드시 포함되는 연속 리터럴 문자열을 모읍니다."""
+    run = []
+
+    def flush():
+        if run:
+            literals.append("".join(run))
+            run.clear()
+
+    for op, av in items:
+        if op is LITERAL:
+            run.append(chr(av))
+            continue
+        flush()
+        if op is SUBPATTERN:
+            sub_items = av[-1]
+            _collect_literals(sub_items, literals)
+        elif op in (MAX_REPEAT, MIN_REPEAT):
+            min_count, _, sub_items = av
+            # 최소 1회 이상 반복되는 부분만 필수입니다.
+            if min_count >= 1:
+                _collect_literals(sub_items, literals)
+        # BRANCH(|), IN([...]), ANY(.), AT(^, $, \b) 등은 필수 리터럴을 만들지 않습니다.
+    flush()
+
+
+def _has_scoped_ignorecase(items):
+    for op, av in items:
+        if op is SUBPATTERN:
+            add_flags = av[1]
+            if add_flags & re.IGNORECASE or _has_scoped_ignorecase(av[-1]):
+                return True
+        elif op in (MAX_REPEAT, MIN_REPEAT) and _has_scoped_ignorecase(av[2]):
+            return True
+        elif op is BRANCH and any(_has_scoped_ignorecase(b) for b in av[1]):
+            return True
+    return False
+
+
+@lru_cache(maxsize=256)
+def required_literals(pattern, flags=0):
+    """
+    정규식이 일치하려면 반드시 포함해야 하는 리터럴 문자열들과 대소문자 무시 여부를 반환합니다.
+    분석할 수 없는 패턴이면 빈 튜플을 반환합니다.
+    """
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except (re.error, TypeError):
+        return (), False
+
+    ignore_case = bool(
+        (parsed.state.flags | flags) & re.IGNORECASE
+    ) or _has_scoped_ignorecase(parsed.data)
+
+    literals = []
+    _collect_literals(parsed.data, literals)
+    literals = [lit for lit in literals if len(lit) >= MIN_LITERAL_LENGTH]
+    if ignore_case:
+        # 유니코드 대소문자 접기 규칙이 특수한 문자가 있으면 사전 필터를 쓰지 않습니다.
+        literals = [lit for lit in literals if lit.isascii()]
+    literals.sort(key=len, reverse=True)
+    return tuple(literals[:MAX_PREFILTER_LITERALS]), ignore_case
+
+
+def candidate_mask(strings, pattern, flags=0):
+    """
+    필수 리터럴을 모두 포함하는 행만 True인 boolean 배열을 반환합니다.
+    리터럴을 뽑을 수 없으면 None(모든 행이 후보)을 반환합니다.
+    """
+    literals, ignore_case = required_literals(pattern, flags)
+    if not literals:
+        return None
+    mask = np.ones(len(strings), dtype=bool)
+    for literal in literals:
+        mask &= strings.str.contains(
+            literal, case=not ignore_case, regex=False, na=False
+        ).to_numpy(dtype=bool)
+    return mask
+
+
+def regex_match_mask(series, pattern, flags=0):
+    """
+    'Matches Regex' 규칙(문자열 시작에서 일치)을 벡터 연산으로 평가합니다.
+    리터럴 사전 필터로 후보 행을 먼저 거른 뒤, 후보에 대해서만 정규식을 실행합니다.
+    """
+    strings = series.astype(str)
+    compiled = compile_pattern(pattern, flags)
+    candidates = candidate_mask(strings, pattern, flags)
+    if candidates is None:
+        return strings.str.match(compiled, na=False).astype(bool)
+
+    result = np.zeros(len(strings), dtype=bool)
+    if candidates.any():
+        result[candidates] = (
+            strings[candidates].str.match(compiled, na=False).to_numpy(dtype=bool)
+        )
+    return pd.Series(result, index=series.index)
+
+
+def regex_search_group(series, pattern, group=1):
+    """
+    각 행에 re.search를 적용해 (일치 여부 mask, 그룹 값 Series)를 반환합니다.
+    시나리오의 from_regex 컨텍스트 추출기에서 사용하며, 리터럴 사전 필터로 후보를 먼저 거릅니다.
+    """
+    strings = series.astype(str)
+    compiled = compile_pattern(pattern)
+    candidates = candidate_mask(strings, pattern)
+    positions = (
+        np.arange(len(strings)) if candidates is None else np.flatnonzero(candidates)
+    )
+
+    matched = np.zeros(len(strings), dtype=bool)
+    values = np.full(len(strings), None, dtype=object)
+    candidate_strings = strings.to_numpy(dtype=object)[positions]
+    for pos, text in zip(positions, candidate_strings):
+        if not isinstance(text, str):
+            continue
+        match = compiled.search(text)
+        if match:
+            matched[pos] = True
+            values[pos] = match.group(group)
+    return (
+        pd.Series(matched, index=series.index),
+        pd.Series(values, index=series.index, dtype=object),
+    )
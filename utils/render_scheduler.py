@@ -0,0 +1,72 @@
+import time
+from collections import deque
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+# 화면 갱신 간격의 기본 하한(약 30fps)과 상한(ms)
+MIN_INTERVAL_MS = 33
+MAX_INTERVAL_MS = 1000
+# 한 번의 갱신에 걸린 시간이 간격의 이 비율을 넘지 않도록 간격을 늘립니다. (나머지는 입력/그리기에 남김)
+UI_BUDGET = 0.25
+# 초당 갱신 횟수를 계산하는 최근 구간(초)
+RATE_WINDOW = 2.0
+
+
+class RenderScheduler(QObject):
+    """
+    잦은 변경 요청을 모아 flush()를 화면 갱신 주기에 맞춰 한 번씩만 호출하는 스케줄러입니다.
+
+    request()는 몇 번을 부르든 다음 갱신 때 flush가 한 번 실행됩니다.
+    flush에 걸린 시간을 재어, 부하가 크면 간격을 늘리고(최대 max_interval_ms)
+    가벼워지면 다시 화면 주기(min_interval_ms)까지 줄입니다.
+    """
+    # 갱신이 끝날 때마다 (초당 갱신 횟수, 지금 간격(ms), 마지막 갱신에 걸린 시간(ms))
+    stats_updated = Signal(float, int, float)
+
+    def __init__(self, flush, min_interval_ms=MIN_INTERVAL_MS, max_interval_ms=MAX_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self._flush = flush
+        self.min_interval_ms = max(int(min_interval_ms), 1)
+        self.max_interval_ms = max(int(max_interval_ms), self.min_interval_ms)
+        self.interval_ms = self.min_interval_ms
+        self.last_cost_ms = 0.0
+        self._flush_times = deque()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._run)
+
+    def request(self):
+        """다음 갱신 때 flush가 실행되도록 예약합니다. 이미 예약되어 있으면 아무것도 하지 않습니다."""
+        if not self._timer.isActive():
+            self._timer.start(self.interval_ms)
+
+    def cancel(self):
+        """예약된 갱신을 취소합니다."""
+        self._timer.stop()
+
+    def flush_now(self):
+        """예약을 기다리지 않고 바로 flush를 실행합니다. (조회가 끝났을 때 남은 변경 반영 등)"""
+        self._timer.stop()
+        self._run()
+
+    def update_rate(self):
+        """최근 RATE_WINDOW초 동안의 초당 화면 갱신 횟수"""
+        now = time.perf_counter()
+        while self._flush_times and now - self._flush_times[0] > RATE_WINDOW:
+            self._flush_times.popleft()
+        if len(self._flush_times) < 2:
+            return float(len(self._flush_times))
+        return (len(self._flush_times) - 1) / max(now - self._flush_times[0], 1e-3)
+
+    def _run(self):
+        started = time.perf_counter()
+        self._flush()
+        finished = time.perf_counter()
+        self.last_cost_ms = (finished - started) * 1000
+        self._flush_times.append(finished)
+
+        # 걸린 시간이 예산(UI_BUDGET)에 맞는 간격을 목표로, 급격히 흔들리지 않게 절반씩 따라갑니다.
+        target = self.last_cost_ms / UI_BUDGET
+        interval = (self.interval_ms + target) / 2
+        self.interval_ms = int(min(max(interval, self.min_interval_ms), self.max_interval_ms))
+        self.stats_updated.emit(self.update_rate(), self.interval_ms, self.last_cost_ms)
@@ -0,0 +1,175 @@
+import numpy as np
+import pandas as pd
+
+
+def _column_values(series):
+    """버퍼에 쓸 NumPy 배열로 변환합니다. NumPy 기본 타입이 아니면(문자열, 확장 타입 등) object 배열입니다."""
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biufcmM":
+        return series.to_numpy()
+    return series.to_numpy(dtype=object)
+
+
+def _missing_values(dtype, count):
+    """청크에 없는 컬럼을 채울 결측값 배열입니다."""
+    if dtype.kind == "f":
+        return np.full(count, np.nan, dtype=dtype)
+    if dtype.kind == "M":
+        return np.full(count, np.datetime64("NaT"), dtype=dtype)
+    if dtype.kind == "m":
+        return np.full(count, np.timedelta64("NaT"), dtype=dtype)
+    return np.full(count, None, dtype=object)
+
+
+class ColumnarRingBuffer:
+    """
+    최대 capacity개의 행을 컬럼별 고정 크기 배열에 담는 원형 버퍼입니다. (실시간 tailing용)
+
+    append는 새 행을 빈 칸(또는 가장 오래된 행의 자리)에 제자리로 기록하고,
+    오래된 행은 head 포인터를 옮기는 것만으로 제거하므로 한 번의 비용이 청크 크기에 비례합니다.
+    논리 행 번호(0 = 가장 오래된 행)는 physical()로 배열 위치로 바뀝니다.
+
+    derived()로 등록한 파생 배열(검색 텍스트, 하이라이트 스타일 등)은 append 때 새 행에 대해서만 계산됩니다.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = max(int(capacity), 1)
+        self.columns = []
+        self._arrays = {}
+        # 행마다 붙는 고유 번호(uint64). 따로 주지 않으면 버퍼가 생긴 뒤의 절대 행 번호입니다.
+        self._row_ids = np.zeros(self.capacity, dtype=np.uint64)
+        # 이름 -> [물리 배열, builder(df) -> 행별 값 배열]
+        self._derived = {}
+        self.head = 0
+        self.size = 0
+        # 지금까지 밀려난 행의 수. (논리 행 번호 + dropped = 버퍼가 생긴 뒤의 절대 행 번호)
+        self.dropped = 0
+        # 컬럼이 추가되거나 배열 타입이 바뀔 때 증가합니다. (배열 참조를 캐시한 쪽에서 확인)
+        self.layout_version = 0
+
+    def __len__(self):
+        return self.size
+
+    def physical(self, rows):
+        """논리 행 번호(정수 또는 배열)를 배열 위치로 변환합니다."""
+        return (self.head + rows) % self.capacity
+
+    def logical_slots(self):
+        """모든 논리 행의 배열 위치를 순서대로 반환합니다."""
+        return self.physical(np.arange(self.size, dtype=np.int64))
+
+    def row_ids(self, rows=None):
+        """논리 행(rows가 None이면 전체)의 고유 번호 배열을 반환합니다."""
+        if rows is None:
+            return self._row_ids[self.logical_slots()]
+        return self._row_ids[self.physical(np.asarray(rows, dtype=np.int64))]
+
+    def column_array(self, name):
+        """컬럼의 물리 배열을 반환합니다. (physical()로 얻은 위치로 읽습니다)"""
+        return self._arrays[name]
+
+    def overflow_for(self, count):
+        """count개 행을 추가하면 밀려나는 가장 오래된 행의 수"""
+        return max(0, self.size + min(count, self.capacity) - self.capacity)
+
+    def drop_head(self, count):
+        """가장 오래된 count개 행을 제거합니다. 데이터는 지우지 않고 head만 옮깁니다."""
+        count = min(max(count, 0), self.size)
+        self.head = (self.head + count) % self.capacity
+        self.size -= count
+        self.dropped += count
+
+    def _store(self, arrays, name, slots, values):
+        target = arrays[name]
+        if values.dtype != target.dtype and not np.can_cast(values.dtype, target.dtype, casting="safe"):
+            # 새 청크의 값이 기존 타입에 담기지 않으면 (예: 정수 -> 결측 포함 실수) 한 번 넓혀 둡니다.
+            try:
+                wider = np.promote_types(target.dtype, values.dtype)
+            except TypeError:
+                wider = np.dtype(object)
+            target = arrays[name] = target.astype(wider)
+            self.layout_version += 1
+        target[slots] = values
+
+    def append(self, df, row_ids=None):
+        """
+        df의 행들을 뒤에 추가하고, 용량을 넘겨 밀려난 가장 오래된 행의 수를 반환합니다.
+        (용량보다 큰 청크라서 넣지 못한 앞쪽 행도 밀려난 행으로 셉니다)
+        처음 보는 컬럼은 기존 행을 결측값으로 채워 추가합니다.
+        row_ids는 행마다 붙일 고유 번호입니다. (None이면 절대 행 번호)
+        """
+        if df is None or df.empty:
+            return 0
+        if row_ids is None:
+            row_ids = self.dropped + self.size + np.arange(len(df), dtype=np.uint64)
+        skipped = max(0, len(df) - self.capacity)
+        if skipped:
+            df = df.iloc[skipped:]
+            row_ids = np.asarray(row_ids)[skipped:]
+        count = len(df)
+        evicted = self.overflow_for(count)
+        self.drop_head(evicted)
+        self.dropped += skipped
+
+        slots = self.physical(np.arange(self.size, self.size + count, dtype=np.int64))
+        self._row_ids[slots] = row_ids
+        for name in df.columns:
+            values = _column_values(df[name])
+            if name not in self._arrays:
+                self._arrays[name] = np.empty(self.capacity, dtype=values.dtype)
+                self.columns.append(name)
+                self.layout_version += 1
+                if self.size:
+                    self._store(
+                        self._arrays,
+                        name,
+                        self.logical_slots(),
+                        _missing_values(values.dtype, self.size),
+                    )
+            self._store(self._arrays, name, slots, values)
+        for name in self.columns:
+            if name not in df.columns:
+                self._store(
+                    self._arrays, name, slots, _missing_values(self._arrays[name].dtype, count)
+                )
+
+        for array, builder in self._derived.values():
+            array[slots] = builder(df)
+        self.size += count
+        return evicted + skipped
+
+    def derived(self, name, builder):
+        """
+        builder(df)가 돌려주는 행별 값 배열을 버퍼와 같은 배치로 유지하는 파생 배열을 반환합니다.
+        처음 요청될 때 현재 행 전체에 대해 한 번 계산하고, 이후 append된 행에 대해서만 builder를 호출합니다.
+        """
+        entry = self._derived.get(name)
+        if entry is None:
+            values = np.asarray(builder(self.to_frame()))
+            array = np.empty((self.capacity,) + values.shape[1:], dtype=values.dtype)
+            array[self.logical_slots()] = values
+            entry = self._derived[name] = [array, builder]
+        return entry[0]
+
+    def drop_derived(self, name=None):
+        """파생 배열을 버립니다. (name이 None이면 전부) 다음 요청 때 다시 계산됩니다."""
+        if name is None:
+            self._derived.clear()
+        else:
+            self._derived.pop(name, None)
+
+    def to_frame(self, rows=None):
+        """
+        논리 행(rows가 None이면 전체)을 DataFrame으로 복사해 반환합니다.
+        인덱스는 논리 행 번호입니다.
+        """
+        if rows is None:
+            slots = self.logical_slots()
+            index = pd.RangeIndex(self.size)
+        else:
+            index = np.asarray(rows, dtype=np.int64)
+            slots = self.physical(index)
+        return pd.DataFrame(
+            {name: self._arrays[name][slots] for name in self.columns},
+            index=index,
+            columns=self.columns,
+        )
@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+
+# 셀 값 사이에 넣는 구분자입니다. 검색어가 두 셀에 걸쳐 일치하지 않도록 로그에 나타나지 않는 문자를 씁니다.
+SEARCH_TEXT_SEPARATOR = "\x1f"
+
+
+def build_search_text(df, lower=True):
+    """
+    각 행의 모든 셀을 문자열로 바꿔 구분자로 이어 붙인 Series(행 위치 기준 RangeIndex)를 만듭니다.
+    lower=True이면 대소문자 무시 검색용으로 소문자로 변환합니다.
+    """
+    if df is None or df.empty or len(df.columns) == 0:
+        return pd.Series([], dtype=object)
+
+    text = None
+    for col in df.columns:
+        values = df[col].astype(str).fillna("").reset_index(drop=True)
+        text = values if text is None else text + SEARCH_TEXT_SEPARATOR + values
+    return text.str.lower() if lower else text
+
+
+def contains_mask(text, needle, case_sensitive=False):
+    """검색용 텍스트 Series에서 needle을 포함하는 행을 True로 표시한 boolean 배열을 반환합니다."""
+    if not case_sensitive:
+        needle = needle.lower()
+    return text.str.contains(needle, regex=False, na=False).to_numpy(dtype=bool)
+
+
+class SearchTextColumn:
+    """
+    DataFrame과 나란히 유지되는 행별 검색용 텍스트(소문자, 구분자로 연결)입니다.
+
+    처음 검색할 때 한 번만 만들고(lazy), 이후에는 append/trim_head로 원본의 변경을 따라갑니다.
+    전체 컬럼 검색은 이 한 컬럼에 대한 벡터 연산 한 번으로 끝납니다.
+    텍스트는 여유 용량을 둔 객체 배열의 [start, stop) 구간에 두어, append는 뒤에 쓰고 trim_head는 start만 옮깁니다.
+    배열이 꽉 차면 살아 있는 행의 두 배 크기로 한 번 옮기므로 실시간 틱마다의 비용은 청크 크기에 비례합니다.
+    """
+
+    # 배열을 새로 잡을 때의 최소 용량
+    MIN_CAPACITY = 1024
+
+    def __init__(self):
+        self._values = None
+        self._start = 0
+        self._stop = 0
+        # invalidate될 때마다 증가합니다. 백그라운드 검색이 만든 텍스트가 그 사이 바뀐 데이터의 캐시로
+        # 들어가지 않도록 검색 시작 시점의 값과 비교합니다.
+        self.generation = 0
+
+    def __len__(self):
+        return self._stop - self._start
+
+    @property
+    def is_built(self):
+        return self._values is not None
+
+    def invalidate(self):
+        """원본 데이터가 통째로 바뀌었을 때 호출합니다. 다음 검색 때 다시 만듭니다."""
+        self._values = None
+        self._start = self._stop = 0
+        self.generation += 1
+
+    def _text(self):
+        # 배열 구간을 복사 없이 감싼 Series. 이미 내준 구간은 이후 append/trim_head가 덮어쓰지 않습니다.
+        return pd.Series(self._values[self._start : self._stop], dtype=object, copy=False)
+
+    def _store(self, *parts):
+        size = sum(len(part) for part in parts)
+        array = np.empty(max(2 * size, self.MIN_CAPACITY), dtype=object)
+        stop = 0
+        for part in parts:
+            array[stop : stop + len(part)] = part
+            stop += len(part)
+        self._values, self._start, self._stop = array, 0, size
+
+    def get(self, df, generation=None):
+        """
+        df에 대한 검색 텍스트를 반환합니다. 아직 없거나 길이가 맞지 않으면 새로 만듭니다.
+        generation이 주어지면, 만드는 동안 invalidate된 경우 캐시에 저장하지 않습니다.
+        """
+        if self._values is not None and len(self) == len(df):
+            return self._text()
+        text = build_search_text(df)
+        if generation is None or generation == self.generation:
+            self._store(text.to_numpy(dtype=object))
+            return self._text()
+        return text
+
+    def append(self, df_chunk):
+        """새로 추가된 행들의 검색 텍스트를 뒤에 붙입니다. 아직 만들어지지 않았다면 아무것도 하지 않습니다."""
+        if self._values is None or df_chunk is None or df_chunk.empty:
+            return
+        values = build_search_text(df_chunk).to_numpy(dtype=object)
+        if self._stop + len(values) > len(self._values):
+            # 여유가 없으면 살아 있는 행과 새 행을 새 배열 앞쪽으로 한 번 옮깁니다. (분할 상환 O(1))
+            self._store(self._values[self._start : self._stop], values)
+            return
+        self._values[self._stop : self._stop + len(values)] = values
+        self._stop += len(values)
+
+    def trim_head(self, count):
+        """앞쪽(가장 오래된) count개 행을 제거합니다. 배열은 그대로 두고 시작 위치만 옮깁니다."""
+        if self._values is None or count <= 0:
+            return
+        self._start = min(self._start + count, self._stop)
+
+    def contains(self, df, needle, positions=None, case_sensitive=False, generation=None):
+        """
+        모든 컬럼 중 하나라도 needle을 포함하는 행을 True로 표시한 boolean 배열을 반환합니다.
+        positions가 주어지면 해당 행 위치들에 대해서만 검사합니다.
+        """
+        if case_sensitive:
+            # 대소문자 구분 검색은 드물기 때문에 캐시하지 않고 필요한 행만 만듭니다.
+            subset = df if positions is None else df.iloc[positions]
+            return contains_mask(build_search_text(subset, lower=False), needle, True)
+
+        text = self.get(df, generation)
+        if positions is not None:
+            # positions는 위치 배열 또는 (시간 인덱스가 돌려준) slice입니다.
+            text = text.iloc[positions]
+        return contains_mask(text, needle)
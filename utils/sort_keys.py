@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+
+def native_sort_key(series):
+    """
+    컬럼을 정렬하기 위한 (키 배열, 결측 여부 배열)을 반환합니다.
+
+    숫자/날짜 컬럼은 값 그대로(int64/float64), 숫자로만 이루어진 문자열 컬럼(NumericalTimeStamp, LevelID 등)은
+    숫자로, 그 외 문자열은 정렬된 범주 코드로 바꿉니다. 표시 문자열을 셀마다 비교하지 않습니다.
+    """
+    dtype = series.dtype
+    missing = series.isna().to_numpy(dtype=bool)
+
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        key = series.to_numpy(dtype="datetime64[ns]").view(np.int64).copy()
+    elif pd.api.types.is_timedelta64_dtype(dtype):
+        key = series.to_numpy(dtype="timedelta64[ns]").view(np.int64).copy()
+    elif pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_signed_integer_dtype(dtype):
+        key = series.to_numpy(dtype=np.int64, na_value=0)
+    elif pd.api.types.is_numeric_dtype(dtype):
+        key = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    else:
+        # 문자열은 고유값 단위로 한 번만 변환/비교합니다. (같은 값이 반복되는 로그 컬럼에서 빠릅니다)
+        values = series if pd.api.types.is_string_dtype(dtype) else series.map(str, na_action="ignore")
+        codes, uniques = pd.factorize(values)
+        numbers = pd.to_numeric(pd.Series(uniques), errors="coerce")
+        if len(uniques) and numbers.notna().all():
+            ranks = numbers.to_numpy(dtype=np.float64)
+        else:
+            ranks = np.empty(len(uniques), dtype=np.int64)
+            ranks[np.argsort(np.asarray(uniques, dtype=object), kind="stable")] = np.arange(len(uniques))
+        key = ranks[codes] if len(uniques) else np.zeros(len(series), dtype=np.int64)
+
+    if missing.any():
+        key[missing] = 0
+    return key, missing
+
+
+def sort_permutation(keys):
+    """
+    [(키 배열, 결측 여부 배열, 오름차순 여부), ...] (앞쪽이 우선)로 행 순서 배열을 만듭니다.
+    안정 정렬이며, 결측값은 정렬 방향과 관계없이 항상 뒤에 놓입니다.
+    """
+    lex_keys = []
+    for key, missing, ascending in reversed(keys):
+        lex_keys.append(key if ascending else -key)
+        lex_keys.append(missing)
+    return np.lexsort(lex_keys)
@@ -0,0 +1,384 @@
+import re
+import sqlite3
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+
+from utils.regex_cache import compile_pattern
+
+try:
+    # DuckDB가 설치되어 있으면 컬럼 기반 엔진을 사용합니다. (선택 사항)
+    import duckdb as _duckdb
+except ImportError:
+    _duckdb = None
+
+# 등록되는 테이블/추가 컬럼 이름
+TABLE_NAME = "logs"
+ROW_ID_COLUMN = "__row"  # 절대 행 번호 (original_data 위치 + row_offset)
+TIMESTAMP_COLUMN = "__ts"  # epoch ms (시간 인덱스와 동일한 값, 결측은 NULL)
+
+# _parse_filter_group이 만드는 SQL의 방언 정의입니다.
+# text: 문자열 연산자에서 컬럼을 감싸는 식, number: 숫자 비교 시 컬럼을 감싸는 식,
+# list_column: In List 비교 대상 식, lower_list: 목록 값을 소문자로 바꿀지 여부
+ORACLE_DIALECT = {
+    "ops": {
+        "Contains": "INSTR({col}, :{p}) > 0",
+        "Does Not Contain": "INSTR({col}, :{p}) = 0",
+        "Equals": "{col} = :{p}",
+        "Not Equals": "{col} != :{p}",
+        "Matches Regex": "REGEXP_LIKE({col}, :{p})",
+    },
+    "number": "{col}",
+    "list_column": "{col}",
+    "lower_list": False,
+    "time_column": "A.SYSTEMDATE",
+}
+
+# 내장 엔진용 방언: pandas 마스크와 같은 의미(대소문자 무시, 결측은 빈 문자열)가 되도록 만듭니다.
+_LOCAL_TEXT = "LOWER(COALESCE(CAST({col} AS VARCHAR), ''))"
+_LOCAL_OPS = {
+    "Contains": f"INSTR({_LOCAL_TEXT}, LOWER(:{{p}})) > 0",
+    "Does Not Contain": f"INSTR({_LOCAL_TEXT}, LOWER(:{{p}})) = 0",
+    "Equals": f"{_LOCAL_TEXT} = LOWER(:{{p}})",
+    "Not Equals": f"{_LOCAL_TEXT} != LOWER(:{{p}})",
+    # REGEXP_LIKE는 각 엔진에 파이썬 re.match 기반 함수로 등록합니다. ('Matches Regex'와 동일)
+    "Matches Regex": "REGEXP_LIKE(CAST({col} AS VARCHAR), :{p})",
+}
+# pandas의 Contains(str.contains, 대소문자 무시)는 값을 정규식으로 찾으므로,
+# 정규식 문자가 든 값은 INSTR 대신 re.search 기반 REGEXP_SEARCH로 변환합니다.
+_LOCAL_PATTERN_OPS = {
+    "Contains": "REGEXP_SEARCH(COALESCE(CAST({col} AS VARCHAR), ''), :{p})",
+    "Does Not Contain": "NOT REGEXP_SEARCH(COALESCE(CAST({col} AS VARCHAR), ''), :{p})",
+}
+
+_REGEX_SYNTAX = set(".^$*+?{}[]\\|()")
+
+
+def has_regex_syntax(value):
+    """값에 정규식으로 해석되는 문자가 있는지 확인합니다. (없으면 포함 검색과 정규식 검색의 결과가 같음)"""
+    return isinstance(value, str) and any(ch in _REGEX_SYNTAX for ch in value)
+
+
+def _regexp_like(value, pattern):
+    if value is None or pattern is None:
+        return False
+    return compile_pattern(pattern).match(value) is not None
+
+
+def _regexp_search(value, pattern):
+    if value is None or pattern is None:
+        return False
+    return compile_pattern(pattern, re.IGNORECASE).search(value) is not None
+
+
+def _engine_columns(df):
+    """엔진에서 조회할 수 있는 컬럼 목록. 문자열이 아닌 객체(dict/list 등)를 담은 컬럼은 제외합니다."""
+    columns = []
+    for col in df.columns:
+        series = df[col]
+        if series.dtype == object:
+            sample = series.dropna()
+            if not sample.empty and not isinstance(sample.iloc[0], str):
+                continue
+        columns.append(col)
+    return columns
+
+
+def _row_meta(row_offset, count, timestamps):
+    """절대 행 번호와 타임스탬프(결측은 NULL) 두 컬럼만 담은 DataFrame을 만듭니다."""
+    ts = np.asarray(timestamps, dtype=np.int64)
+    return pd.DataFrame(
+        {
+            ROW_ID_COLUMN: np.arange(row_offset, row_offset + count, dtype=np.int64),
+            TIMESTAMP_COLUMN: pd.array(
+                np.where(ts == np.iinfo(np.int64).min, None, ts), dtype="Int64"
+            ),
+        }
+    )
+
+
+def _prepare_frame(df, row_offset, timestamps):
+    """
+    엔진에 복사해 넣을 DataFrame을 만듭니다. 조회할 수 있는 컬럼만 골라
+    절대 행 번호와 타임스탬프 컬럼을 추가합니다.
+    """
+    frame = df[_engine_columns(df)].reset_index(drop=True)
+    meta = _row_meta(row_offset, len(df), timestamps)
+    for col in meta.columns:
+        frame[col] = meta[col].to_numpy()
+    return frame
+
+
+def _quote(column):
+    return '"' + str(column).replace('"', '""') + '"'
+
+
+class SqlQueryBackend(ABC):
+    """
+    original_data를 내장 SQL 엔진에 등록해 두고, _parse_filter_group이 만든 WHERE 절로
+    일치하는 행 번호를 조회하는 백엔드의 공통 인터페이스입니다.
+    """
+
+    name = ""
+    dialect = None
+
+    def __init__(self):
+        self.row_offset = 0
+        self.row_end = 0
+        self.columns = []  # 엔진에서 조회할 수 있는 original_data 컬럼
+
+    @abstractmethod
+    def sync(self, df, row_offset, timestamps):
+        """엔진의 테이블을 original_data(행 번호 row_offset부터)와 같게 맞춥니다."""
+
+    def reset(self):
+        self.row_offset = 0
+        self.row_end = 0
+        self.columns = []
+
+    def _select(self, columns, where):
+        select = ", ".join(columns)
+        sql = f"SELECT {select} FROM {TABLE_NAME} A"
+        if where:
+            sql += f" WHERE {where}"
+        return sql
+
+    def fetch_positions(self, where, params):
+        """WHERE 절과 일치하는 행의 original_data 위치 배열(오름차순)을 반환합니다."""
+        sql = self._select([ROW_ID_COLUMN], where) + f" ORDER BY {ROW_ID_COLUMN}"
+        row_ids = self._fetch_row_ids(sql, params or {})
+        return row_ids - self.row_offset
+
+    @abstractmethod
+    def _fetch_row_ids(self, sql, params):
+        """SELECT 결과의 첫 컬럼(절대 행 번호)을 int64 배열로 반환합니다."""
+
+    def iter_batches(self, where, params, columns, batch_size=50000):
+        """
+        WHERE 절과 일치하는 행들의 columns와 절대 행 번호(ROW_ID_COLUMN)를 batch_size 행씩
+        DataFrame으로 돌려주는 이터레이터를 만듭니다. 쿼리는 호출할 때 실행되므로,
+        이후 sync로 테이블이 바뀌어도 이터레이터는 호출 시점의 결과를 돌려주며 다른 스레드에서 꺼내도 됩니다.
+        """
+        select = [_quote(c) for c in columns] + [ROW_ID_COLUMN]
+        sql = self._select(select, where) + f" ORDER BY {ROW_ID_COLUMN}"
+        return self._stream_frames(sql, params or {}, batch_size)
+
+    @abstractmethod
+    def _stream_frames(self, sql, params, batch_size):
+        """SELECT 결과를 batch_size 행씩의 DataFrame 이터레이터로 반환합니다."""
+
+    def count_by(self, column, where="", params=None, limit=None):
+        """column 값별 행 수를 많은 순으로 반환합니다. (value_counts와 같은 형태: [column, 'count'], 결측 제외)"""
+        target = _quote(column)
+        clauses = [f"{target} IS NOT NULL"] + ([f"({where})"] if where else [])
+        sql = (
+            f"SELECT {target}, COUNT(*) AS count FROM {TABLE_NAME} A"
+            f" WHERE {' AND '.join(clauses)}"
+            f" GROUP BY {target} ORDER BY count DESC, {target}"
+        )
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return self._read_frame(sql, params or {})
+
+    @abstractmethod
+    def _read_frame(self, sql, params):
+        """SELECT 결과 전체를 DataFrame으로 반환합니다."""
+
+    def close(self):
+        pass
+
+
+class DuckDBBackend(SqlQueryBackend):
+    """
+    DuckDB에 original_data를 복사 없이 등록해 조회합니다.
+    행 번호와 타임스탬프는 두 컬럼짜리 작은 DataFrame으로 따로 등록해 위치 기준(POSITIONAL JOIN)으로 붙입니다.
+    """
+
+    name = "duckdb"
+    dialect = {
+        "ops": _LOCAL_OPS,
+        "pattern_ops": _LOCAL_PATTERN_OPS,
+        "number": "TRY_CAST({col} AS DOUBLE)",
+        "list_column": f"TRIM({_LOCAL_TEXT})",
+        "lower_list": True,
+        "time_column": f"A.{TIMESTAMP_COLUMN}",
+    }
+    _DATA = f"{TABLE_NAME}_data"
+    _META = f"{TABLE_NAME}_meta"
+
+    def __init__(self):
+        super().__init__()
+        self._con = _duckdb.connect(database=":memory:")
+        # 함수는 데이터베이스에 등록되므로 cursor()로 만든 연결에서도 쓸 수 있습니다.
+        for name, func in (("REGEXP_LIKE", _regexp_like), ("REGEXP_SEARCH", _regexp_search)):
+            self._con.create_function(
+                name, func, ["VARCHAR", "VARCHAR"], "BOOLEAN", null_handling="special"
+            )
+        self._frames = None
+
+    def _attach(self, con):
+        # 등록과 뷰는 연결마다 따로이므로, 스트리밍용 커서에도 같은 DataFrame을 다시 붙입니다.
+        data, meta = self._frames
+        con.register(self._DATA, data)
+        con.register(self._META, meta)
+        select = ", ".join(_quote(c) for c in self.columns)
+        con.execute(
+            f"CREATE OR REPLACE TEMP VIEW {TABLE_NAME} AS "
+            f"SELECT {select}, {ROW_ID_COLUMN}, {TIMESTAMP_COLUMN} "
+            f"FROM {self._DATA} POSITIONAL JOIN {self._META}"
+        )
+
+    def sync(self, df, row_offset, timestamps):
+        # DuckDB는 등록된 DataFrame을 직접 스캔하므로 매번 다시 등록해도 비용이 작습니다.
+        self.columns = _engine_columns(df)
+        self._frames = (df, _row_meta(row_offset, len(df), timestamps))
+        self._attach(self._con)
+        self.row_offset = row_offset
+        self.row_end = row_offset + len(df)
+
+    def reset(self):
+        super().reset()
+        if self._frames is not None:
+            self._con.execute(f"DROP VIEW IF EXISTS {TABLE_NAME}")
+            self._con.unregister(self._DATA)
+            self._con.unregister(self._META)
+            self._frames = None
+
+    @staticmethod
+    def _convert(sql):
+        # Oracle 스타일 바인드 변수(:p0)를 DuckDB의 이름 있는 파라미터($p0)로 바꿉니다.
+        return re.sub(r":(p\d+)\b", r"$\1", sql)
+
+    def _fetch_row_ids(self, sql, params):
+        result = self._con.execute(self._convert(sql), params).fetchnumpy()
+        return np.asarray(result[ROW_ID_COLUMN], dtype=np.int64)
+
+    def _stream_frames(self, sql, params, batch_size):
+        # 같은 연결에서 다시 등록하면 읽던 결과가 끊기므로, 지금의 DataFrame을 붙인 별도 커서로 읽습니다.
+        cursor = self._con.cursor()
+        self._attach(cursor)
+        reader = cursor.execute(self._convert(sql), params).to_arrow_reader(batch_size)
+
+        def frames():
+            try:
+                for batch in reader:
+                    yield batch.to_pandas()
+            finally:
+                cursor.close()
+
+        return frames()
+
+    def _read_frame(self, sql, params):
+        return self._con.execute(self._convert(sql), params).df()
+
+    def close(self):
+        self._con.close()
+
+
+class SQLiteBackend(SqlQueryBackend):
+    """
+    표준 라이브러리 sqlite3의 인메모리 DB를 사용하는 대체 백엔드입니다.
+    데이터를 복사해 넣어야 하므로, 실시간 append 시에는 새 행만 추가하고 잘려 나간 행만 지웁니다.
+    """
+
+    name = "sqlite"
+    dialect = {
+        "ops": _LOCAL_OPS,
+        "pattern_ops": _LOCAL_PATTERN_OPS,
+        "number": "TRY_NUMBER({col})",
+        "list_column": f"TRIM({_LOCAL_TEXT})",
+        "lower_list": True,
+        "time_column": f"A.{TIMESTAMP_COLUMN}",
+    }
+
+    def __init__(self):
+        super().__init__()
+        self._con = sqlite3.connect(":memory:", check_same_thread=False)
+        self._con.create_function("REGEXP_LIKE", 2, _regexp_like, deterministic=True)
+        self._con.create_function("REGEXP_SEARCH", 2, _regexp_search, deterministic=True)
+        self._con.create_function("TRY_NUMBER", 1, self._try_number, deterministic=True)
+
+    @staticmethod
+    def _try_number(value):
+        try:
+            return float(str(value).strip())
+        except (TypeError, ValueError):
+            return None
+
+    def sync(self, df, row_offset, timestamps):
+        row_end = row_offset + len(df)
+        if self.row_end == 0 or row_offset >= self.row_end or row_end < self.row_end:
+            # 처음 등록하거나, 이어 붙일 수 없는 경우에는 테이블을 새로 만듭니다.
+            self.reset()
+            self._insert(df, row_offset, timestamps, replace=True)
+        else:
+            if row_offset > self.row_offset:
+                self._con.execute(
+                    f"DELETE FROM {TABLE_NAME} WHERE {ROW_ID_COLUMN} < ?", (row_offset,)
+                )
+            start = self.row_end - row_offset
+            if start < len(df):
+                self._insert(
+                    df.iloc[start:], self.row_end, np.asarray(timestamps)[start:]
+                )
+        self.row_offset = row_offset
+        self.row_end = row_end
+
+    def _insert(self, df, row_offset, timestamps, replace=False):
+        frame = _prepare_frame(df, row_offset, timestamps)
+        frame.to_sql(
+            TABLE_NAME,
+            self._con,
+            if_exists="replace" if replace else "append",
+            index=False,
+            chunksize=10000,
+        )
+        if replace:
+            self.columns = [
+                c for c in frame.columns if c not in (ROW_ID_COLUMN, TIMESTAMP_COLUMN)
+            ]
+            self._con.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{TABLE_NAME}_ts ON {TABLE_NAME} ({TIMESTAMP_COLUMN})"
+            )
+
+    def reset(self):
+        super().reset()
+        self._con.execute(f"DROP TABLE IF EXISTS {TABLE_NAME}")
+
+    def _fetch_row_ids(self, sql, params):
+        rows = self._con.execute(sql, params).fetchall()
+        return np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+
+    def _stream_frames(self, sql, params, batch_size):
+        # 읽는 중에 sync가 같은 테이블을 고치지 못하도록, 결과를 먼저 모두 읽은 뒤 나눠 돌려줍니다.
+        frame = pd.read_sql(sql, self._con, params=params)
+
+        def frames():
+            for start in range(0, len(frame), batch_size):
+                yield frame.iloc[start : start + batch_size]
+
+        return frames()
+
+    def _read_frame(self, sql, params):
+        return pd.read_sql(sql, self._con, params=params)
+
+    def close(self):
+        self._con.close()
+
+
+def available_backends():
+    """사용 가능한 내장 엔진 이름 목록 (선호 순서)"""
+    return (["duckdb"] if _duckdb is not None else []) + ["sqlite"]
+
+
+def create_sql_backend(preferred="auto"):
+    """
+    설정값에 맞는 백엔드를 만듭니다. 'auto'나 'duckdb'는 DuckDB가 없으면 SQLite로 대체합니다.
+    'pandas'(또는 알 수 없는 값)이면 None을 반환합니다.
+    """
+    if preferred in ("auto", "duckdb") and _duckdb is not None:
+        return DuckDBBackend()
+    if preferred in ("auto", "duckdb", "sqlite"):
+        return SQLiteBackend()
+    return None
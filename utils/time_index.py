@@ -0,0 +1,219 @@
+import numpy as np
+import pandas as pd
+
+from utils.query_operators import COMPARISON_OPERATORS, split_range_value
+
+# 로그의 SystemDate(벽시계 시간)가 기록되는 시간대입니다. (OracleFetcherThread와 동일한 기준)
+LOG_TIMEZONE = "America/New_York"
+
+# 타임스탬프가 없는 행은 항상 가장 앞에 정렬되도록 최소값으로 채웁니다.
+MISSING_TIMESTAMP = np.iinfo(np.int64).min
+
+TIME_COLUMNS = ("NumericalTimeStamp", "SystemDate", "SystemDate_dt")
+TIME_OPERATORS = ("Between", "Before", "After")
+
+# QueryBuilderDialog(ConditionWidget)에서 사용하던 연산자 이름을 새 연산자로 매핑합니다.
+TIME_OPERATOR_ALIASES = {
+    "is between": "Between",
+    "is before": "Before",
+    "is after": "After",
+}
+
+
+# 문자열 시간 값을 epoch 밀리초로 읽게 하는 접미사 (예: "1735689600000ms"). 접미사 없는 숫자열은 날짜로 읽습니다.
+EPOCH_MS_SUFFIX = "ms"
+# 값 자체가 epoch 밀리초인 시간 컬럼. 이 컬럼의 규칙은 접미사 없는 숫자열도 epoch 밀리초로 읽습니다.
+EPOCH_MS_COLUMNS = ("NumericalTimeStamp",)
+
+
+def to_epoch_ms(value, digits_are_epoch=False):
+    """
+    시간 값을 NumericalTimeStamp와 같은 epoch 밀리초(int)로 변환합니다.
+    숫자는 이미 epoch ms로 간주하고, 시간대가 없는 날짜/시간은 LOG_TIMEZONE 기준으로 해석합니다.
+    숫자만 있는 문자열은 날짜(예: "20240101")로 읽으며, "...ms" 접미사가 있거나 digits_are_epoch이면 epoch ms입니다.
+    해석할 수 없는 문자열이면 ValueError를 발생시킵니다.
+    """
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return None if np.isnan(value) else int(value)
+    if isinstance(value, str):
+        text = value.strip()
+        digits = text[: -len(EPOCH_MS_SUFFIX)] if text.lower().endswith(EPOCH_MS_SUFFIX) else None
+        if digits is not None and digits.strip().isdigit():
+            return int(digits)
+        if digits_are_epoch and text.isdigit():
+            return int(text)
+
+    try:
+        ts = pd.Timestamp(value)
+    except (ValueError, OverflowError) as e:
+        raise ValueError(f"Invalid time value {value!r}: {e}") from e
+    if ts is pd.NaT:
+        return None
+    if ts.tzinfo is None:
+        ts = ts.tz_localize(LOG_TIMEZONE, ambiguous=True, nonexistent="shift_forward")
+    return int(ts.value // 1_000_000)
+
+
+def from_epoch_ms(value):
+    """epoch 밀리초를 LOG_TIMEZONE 기준의 (시간대 없는) 벽시계 시간으로 변환합니다."""
+    ts = pd.Timestamp(int(value), unit="ms", tz="UTC").tz_convert(LOG_TIMEZONE)
+    return ts.tz_localize(None)
+
+
+def _rule_epoch_ms(value, digits_are_epoch):
+    """시간 규칙의 값 하나를 epoch ms로 변환합니다. 비어 있거나 해석할 수 없으면 ValueError를 발생시킵니다."""
+    if value is None or not str(value).strip():
+        raise ValueError("Time value is empty.")
+    epoch_ms = to_epoch_ms(value, digits_are_epoch)
+    if epoch_ms is None:
+        raise ValueError(f"Invalid time value {value!r}")
+    return epoch_ms
+
+
+def time_rule_bounds(operator, value, column=None):
+    """
+    시간 규칙(Between/Before/After 및 시간 컬럼의 <, <=, >, >=)을
+    양 끝을 포함하는 (start, end) epoch ms 구간으로 변환합니다. 열린 쪽은 None입니다.
+    값이 비어 있거나 시간으로 해석할 수 없으면 ValueError를 발생시킵니다.
+    """
+    operator = TIME_OPERATOR_ALIASES.get(operator, operator)
+    epoch = column in EPOCH_MS_COLUMNS
+    if operator == "Between":
+        start, end = split_range_value(value)
+        return _rule_epoch_ms(start, epoch), _rule_epoch_ms(end, epoch)
+    if operator in ("Before", "<"):
+        return None, _rule_epoch_ms(value, epoch) - 1
+    if operator == "<=":
+        return None, _rule_epoch_ms(value, epoch)
+    if operator in ("After", ">"):
+        return _rule_epoch_ms(value, epoch) + 1, None
+    if operator == ">=":
+        return _rule_epoch_ms(value, epoch), None
+    raise ValueError(f"Unsupported time operator: {operator}")
+
+
+def is_time_rule(rule):
+    """
+    시간 인덱스로 처리할 규칙인지 확인합니다.
+    Before/After는 항상, Between과 비교 연산자는 시간 컬럼에 대해서만 시간 규칙입니다.
+    """
+    operator = rule.get("operator")
+    operator = TIME_OPERATOR_ALIASES.get(operator, operator)
+    if operator in ("Before", "After"):
+        return True
+    return (
+        operator in TIME_OPERATORS or operator in COMPARISON_OPERATORS
+    ) and rule.get("column") in TIME_COLUMNS
+
+
+def extract_timestamps(df):
+    """DataFrame에서 epoch ms(int64) 배열을 추출합니다. 결측값은 MISSING_TIMESTAMP가 됩니다."""
+    if df.empty:
+        return np.array([], dtype=np.int64)
+
+    ts = pd.Series(np.nan, index=df.index, dtype="float64")
+    if "NumericalTimeStamp" in df.columns:
+        ts = pd.to_numeric(df["NumericalTimeStamp"], errors="coerce").astype("float64")
+
+    if ts.isna().any() and "SystemDate_dt" in df.columns:
+        dt = pd.to_datetime(df["SystemDate_dt"], errors="coerce")
+        if dt.dt.tz is None:
+            dt = dt.dt.tz_localize(
+                LOG_TIMEZONE, ambiguous="NaT", nonexistent="shift_forward"
+            )
+        derived = dt.dt.tz_convert("UTC").dt.tz_localize(None)
+        derived_ms = (derived - pd.Timestamp(0)) // pd.Timedelta(milliseconds=1)
+        ts = ts.fillna(derived_ms.astype("float64"))
+
+    return ts.fillna(MISSING_TIMESTAMP).to_numpy(dtype=np.int64)
+
+
+class TimeIndex:
+    """
+    original_data의 행 순서와 나란히 유지되는 NumericalTimeStamp 인덱스입니다.
+    데이터가 시간순으로 정렬되어 있으면 searchsorted로 O(log n)에 구간을 찾아
+    복사 없는 slice를 돌려주고, 정렬이 깨진 경우에는 정렬 순열을 통해 위치 배열을 돌려줍니다.
+    """
+
+    def __init__(self, timestamps=None):
+        self.timestamps = (
+            np.asarray(timestamps, dtype=np.int64)
+            if timestamps is not None
+            else np.array([], dtype=np.int64)
+        )
+        self._refresh_order()
+
+    @classmethod
+    def from_dataframe(cls, df):
+        return cls(extract_timestamps(df))
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    @property
+    def is_sorted(self):
+        return self._order is None
+
+    def _refresh_order(self):
+        ts = self.timestamps
+        if len(ts) < 2 or bool(np.all(ts[1:] >= ts[:-1])):
+            self._order = None
+            self._sorted = ts
+        else:
+            self._order = np.argsort(ts, kind="stable")
+            self._sorted = ts[self._order]
+
+    def append(self, timestamps):
+        """새로 추가된 행들의 타임스탬프를 뒤에 붙입니다."""
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        if timestamps.size == 0:
+            return
+        stays_sorted = self.is_sorted and (
+            len(self.timestamps) == 0 or timestamps[0] >= self.timestamps[-1]
+        ) and bool(np.all(timestamps[1:] >= timestamps[:-1]))
+
+        self.timestamps = np.concatenate([self.timestamps, timestamps])
+        if stays_sorted:
+            self._sorted = self.timestamps
+        else:
+            self._refresh_order()
+
+    def trim_head(self, count):
+        """앞쪽(가장 오래된) count개 행을 제거합니다."""
+        if count <= 0:
+            return
+        self.timestamps = self.timestamps[count:]
+        if self.is_sorted:
+            self._sorted = self.timestamps
+        else:
+            self._refresh_order()
+
+    def _bounds(self, start=None, end=None):
+        # 결측 타임스탬프는 어떤 시간 구간에도 포함되지 않습니다.
+        lo = int(np.searchsorted(self._sorted, MISSING_TIMESTAMP, side="right"))
+        hi = len(self._sorted)
+        if start is not None:
+            lo = max(lo, int(np.searchsorted(self._sorted, start, side="left")))
+        if end is not None:
+            hi = min(hi, int(np.searchsorted(self._sorted, end, side="right")))
+        return lo, max(lo, hi)
+
+    def positions(self, start=None, end=None):
+        """
+        [start, end] (양 끝 포함, epoch ms) 구간에 해당하는 행 위치를 반환합니다.
+        정렬된 상태라면 slice(복사 없음)를, 아니라면 오름차순 위치 배열을 반환합니다.
+        """
+        lo, hi = self._bounds(start, end)
+        if self.is_sorted:
+            return slice(lo, hi)
+        return np.sort(self._order[lo:hi])
+
+    def mask(self, start=None, end=None):
+        """구간에 해당하는 행을 True로 표시한 boolean 배열을 반환합니다."""
+        result = np.zeros(len(self.timestamps), dtype=bool)
+        result[self.positions(start, end)] = True
+        return result
@@ -0,0 +1,32 @@
+from PySide6.QtCore import QThread
+
+
+class BackgroundWorker(QThread):
+    """
+    요청한 위젯/창보다 오래 살 수 있는 백그라운드 작업 QThread의 기반 클래스입니다.
+    start()하면 실행이 끝날 때까지 클래스 쪽에서 참조를 잡아 두므로, 요청한 쪽이 먼저 닫혀도
+    실행 중인 스레드가 파괴되지 않습니다. 끝나면 참조를 놓고 deleteLater()로 정리합니다.
+    cancel()은 요청만 표시하며, 하위 클래스의 run()이 작업 경계에서 is_cancelled()를 확인해 멈춥니다.
+    """
+
+    # 실행 중인 워커의 참조
+    _running = set()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cancelled = False
+
+    def start(self):
+        BackgroundWorker._running.add(self)
+        self.finished.connect(self._release)
+        super().start()
+
+    def _release(self):
+        BackgroundWorker._running.discard(self)
+        self.deleteLater()
+
+    def cancel(self):
+        self._cancelled = True
+
+    def is_cancelled(self):
+        return self._cancelled
@@ -0,0 +1,69 @@
+import os
+import sys
+
+import pandas as pd
+from PySide6.QtWidgets import QApplication
+
+from app_controller import AppController
+
+# 같은 필터가 query_backend(pandas / duckdb / sqlite)에 상관없이 같은 행을 돌려주는지 확인합니다.
+# 값별 개수(count_by)와 배치로 내보내는 결과(iter_filtered_batches)도 백엔드마다 같아야 하고,
+# 배치 trace(get_batch_trace_rows)는 단일 trace(get_trace_data)와 같은 행을 골라야 합니다.
+# 사용법: QT_QPA_PLATFORM=offscreen python verify_filter_backends.py [로그 파일]
+
+LOG_FILE = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(os.path.abspath(__file__)), "realLog.csv")
+
+QUERIES = {
+    "Contains regex": {"logic": "AND", "rules": [{"column": "AsciiData", "operator": "Contains", "value": "carrier.*id"}]},
+    "Does Not Contain regex": {"logic": "AND", "rules": [{"column": "AsciiData", "operator": "Does Not Contain", "value": "carrier.*id"}]},
+    "Contains literal": {"logic": "AND", "rules": [{"column": "AsciiData", "operator": "Contains", "value": "CarrierID"}]},
+}
+TRACE_IDS = ["CNV12305.104", "CNV12305", "cnv12305", "CarrierID"]
+
+app = QApplication.instance() or QApplication([])
+base = AppController("file")
+base.load_log_file(LOG_FILE)
+
+EXPORT_FILTER = QUERIES["Contains regex"]
+
+results = {}
+exports = {}
+for backend in ["pandas", "duckdb", "sqlite"]:
+    controller = AppController("file")
+    controller.config["query_backend"] = backend
+    controller.config["sql_backend_min_rows"] = 0
+    controller.original_data = base.original_data
+    controller._sort_by_time()
+    controller._on_data_replaced()
+    counts = {name: len(controller._get_filter_positions(query)) for name, query in QUERIES.items()}
+    counts.update({f"trace {tid}": len(controller.get_trace_data(tid)) for tid in TRACE_IDS})
+    # 여러 ID를 한 번에 찾는 배치 trace도 단일 trace와 같은 행을 골라야 합니다. (ID는 글자 그대로, 대소문자 무시)
+    for extra in (None, "Send"):
+        batch_rows = controller.get_batch_trace_rows(TRACE_IDS, extra)
+        for tid in TRACE_IDS:
+            single_rows = controller.get_trace_data(tid, extra).index.to_numpy()
+            assert list(batch_rows[tid]) == list(single_rows), (backend, tid, extra, len(batch_rows[tid]), len(single_rows))
+    counts["categories"] = controller.count_by("Category", EXPORT_FILTER).set_index("Category")["count"].to_dict()
+    counts["top devices"] = int(controller.count_by("DeviceID", limit=3)["count"].sum())
+    results[backend] = counts
+    print(backend, counts)
+
+    # 같은 필터를 다시 적용하면 (엔진을 쓰더라도) 캐시된 결과를 씁니다.
+    engine_calls = []
+    evaluate = controller._sql_filter_positions
+    controller._sql_filter_positions = lambda query: engine_calls.append(query) or evaluate(query)
+    controller._get_filter_positions(EXPORT_FILTER)
+    assert not engine_calls, f"{backend}: filter result was not cached"
+
+    batches = controller.iter_filtered_batches(EXPORT_FILTER, batch_size=7)
+    # 이터레이터를 만든 뒤 원본이 다시 등록되어도 만들 때의 결과를 돌려줘야 합니다.
+    controller.data_version += 1
+    controller._get_sql_backend()
+    exports[backend] = pd.concat(list(batches))
+
+assert results["pandas"]["Contains regex"] > 0
+assert results["pandas"] == results["duckdb"] == results["sqlite"], results
+for backend in ["duckdb", "sqlite"]:
+    pd.testing.assert_frame_equal(exports["pandas"], exports[backend], check_dtype=False)
+    assert list(exports[backend].dtypes) == list(exports["pandas"].dtypes), backend
+print("Verification Successful!")
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+from PySide6.QtWidgets import QApplication
+
+from models.LogTableModel import LogTableModel
+from widgets.base_log_viewer import CustomFilterProxyModel
+
+# 검색어가 걸린 상태에서 행이 append/밀려난 뒤 정렬해도 프록시가 올바른 행을 보여 주는지 확인합니다.
+# 사용법: QT_QPA_PLATFORM=offscreen python verify_proxy_filter_sort.py
+
+app = QApplication.instance() or QApplication([])
+
+
+def make_rows(start, count):
+    return pd.DataFrame(
+        {
+            "DeviceID": [f"DEV{i % 7}" for i in range(start, start + count)],
+            "TrackingID": [f"T{(start + count - i) * 37 % 1000:04d}" for i in range(start, start + count)],
+            "NumericalTimeStamp": np.arange(start, start + count, dtype=np.int64),
+        }
+    )
+
+
+def expected_rows(model, needle, sort_column):
+    frame = model.get_rows_frame(np.arange(model.rowCount()))
+    matched = frame[frame.apply(lambda r: r.astype(str).str.contains(needle, case=False).any(), axis=1)]
+    return matched.sort_values(sort_column, kind="stable")["NumericalTimeStamp"].tolist()
+
+
+def shown_rows(proxy, model):
+    column = model.column_names().index("NumericalTimeStamp")
+    return [int(proxy.index(r, column).data()) for r in range(proxy.rowCount())]
+
+
+for max_rows in (100000, 150):
+    model = LogTableModel(max_rows=max_rows)
+    model.update_data(make_rows(0, 100))
+    proxy = CustomFilterProxyModel()
+    proxy.setSourceModel(model)
+    proxy.set_filter_text("dev3")
+
+    # 필터가 걸린 채로 append (max_rows=150이면 앞쪽 행이 밀려납니다)
+    model.append_data(make_rows(100, 60))
+    model.append_data(make_rows(160, 40))
+
+    sort_column = model.column_names().index("TrackingID")
+    proxy.sort(sort_column)
+    assert shown_rows(proxy, model) == expected_rows(model, "dev3", "TrackingID"), max_rows
+
+    # 정렬을 푼 뒤 다시 append하고 정렬해도 같아야 합니다.
+    proxy.sort(-1)
+    model.append_data(make_rows(200, 30))
+    proxy.sort(sort_column)
+    assert shown_rows(proxy, model) == expected_rows(model, "dev3", "TrackingID"), max_rows
+    print(f"max_rows={max_rows}: {proxy.rowCount()} of {model.rowCount()} rows shown, sorted correctly")
+
+print("Verification Successful!")
@@ -0,0 +1,58 @@
+import os
+import sys
+
+from PySide6.QtWidgets import QApplication
+
+from app_controller import AppController
+from utils.query_language import QuerySyntaxError, compile_query, parse_query
+
+# 같은 텍스트 쿼리가 메인 필터 입력창(compile_query().mask)과 조회 조건 창(parse_query -> 고급 필터)에서
+# 같은 행을 고르는지 확인합니다. 고급 필터는 pandas / duckdb / sqlite 백엔드 모두에서 확인합니다.
+# 사용법: QT_QPA_PLATFORM=offscreen python verify_query_paths.py [로그 파일]
+
+LOG_FILE = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(os.path.abspath(__file__)), "realLog.csv")
+
+QUERIES = [
+    "ascii:*CNV12305.104*",
+    "-ascii:*CNV12305.104*",
+    "ascii:*carrierid*",
+    'ascii~"carrier.*id"',
+    "cat:Com AND ascii:*CNV12305*",
+    "categoRY:debug OR messagename:*F*",
+]
+# 없는 컬럼은 두 경로 모두 (조용히 전부/아무것도 고르지 않는 대신) QuerySyntaxError로 알려야 합니다.
+UNKNOWN_COLUMN_QUERY = "nosuchcolumn:abc"
+
+app = QApplication.instance() or QApplication([])
+base = AppController("file")
+base.load_log_file(LOG_FILE)
+df = base.original_data
+
+failed = False
+for backend in ["pandas", "duckdb", "sqlite"]:
+    controller = AppController("file")
+    controller.config["query_backend"] = backend
+    controller.config["sql_backend_min_rows"] = 0
+    controller.original_data = df
+    controller._sort_by_time()
+    controller._on_data_replaced()
+    for text in QUERIES:
+        plan_rows = int(compile_query(text).mask(controller.original_data).sum())
+        filter_rows = len(controller._get_filter_positions(parse_query(text)))
+        status = "ok" if plan_rows == filter_rows else "MISMATCH"
+        failed |= plan_rows != filter_rows
+        print(f"{backend:<7} {text:<36} plan={plan_rows:<5} filter={filter_rows:<5} {status}")
+    for evaluate in (
+        lambda: compile_query(UNKNOWN_COLUMN_QUERY).mask(controller.original_data),
+        lambda: controller._get_filter_positions(parse_query(UNKNOWN_COLUMN_QUERY)),
+        lambda: controller.apply_advanced_filter(parse_query(UNKNOWN_COLUMN_QUERY)),
+    ):
+        try:
+            evaluate()
+        except QuerySyntaxError:
+            continue
+        failed = True
+        print(f"{backend:<7} {UNKNOWN_COLUMN_QUERY:<36} was not rejected")
+
+assert not failed, "text query results differ between the filter box and the advanced filter"
+print("Verification Successful!")
@@ -0,0 +1,59 @@
+import os
+import sys
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from app_controller import AppController
+from utils.time_index import TimeIndex, extract_timestamps
+
+# 실시간 tailing 중 고급 필터가 걸린 상태에서 원본 원형 버퍼가 앞쪽 행을 밀어내도,
+# 필터된 뷰와 뷰 스택이 밀려난 행을 계속 가리키지 않고 원본에 남은 일치 행만 보여 주는지 확인합니다.
+# 사용법: QT_QPA_PLATFORM=offscreen python verify_realtime_filter_eviction.py [로그 파일]
+
+LOG_FILE = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(os.path.abspath(__file__)), "realLog.csv")
+MAX_ROWS = 150
+CHUNK_ROWS = 37
+
+app = QApplication.instance() or QApplication([])
+base = AppController("file")
+base.load_log_file(LOG_FILE)
+logs = base.original_data
+
+controller = AppController("realtime")
+controller.source_model.max_rows = MAX_ROWS
+controller.original_data = logs.iloc[:100].reset_index(drop=True)
+controller.time_index = TimeIndex(extract_timestamps(controller.original_data))
+controller._on_data_replaced()
+controller.update_model_data(controller.original_data)
+
+outer = {"logic": "AND", "rules": [{"column": "Category", "operator": "Equals", "value": "Debug"}]}
+inner = {"logic": "AND", "rules": [{"column": "AsciiData", "operator": "Contains", "value": "CNV"}]}
+controller.apply_advanced_filter(outer)
+controller.apply_advanced_filter(inner)
+
+
+def expected_ids(query):
+    positions = controller._get_filter_positions(query)
+    return controller.row_ids(positions)
+
+
+for start in range(100, len(logs), CHUNK_ROWS):
+    controller._update_queue.append(logs.iloc[start : start + CHUNK_ROWS].reset_index(drop=True))
+    controller._process_update_queue()
+
+    live = controller._original_row_count()
+    shown = controller.source_model.row_ids()
+    assert live <= MAX_ROWS
+    assert len(shown) == 0 or int(shown.min()) >= controller._row_id_start + controller._row_offset
+    assert np.array_equal(shown, expected_ids(inner)), (start, len(shown), len(expected_ids(inner)))
+    for view in controller.view_stack:
+        assert len(view["rows"]) == 0 or (view["rows"].min() >= 0 and view["rows"].max() < live)
+
+print(f"filtered view: {controller.source_model.rowCount()} rows of {controller._original_row_count()} live rows")
+
+# 뒤로 가기는 밀려난 행 없이 바깥 필터 결과를 다시 보여 줘야 합니다.
+assert controller.go_back_view()
+assert np.array_equal(controller.source_model.row_ids(), expected_ids(outer))
+print(f"after go back: {controller.source_model.rowCount()} rows")
+print("Verification Successful!")
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+from utils.search_text import SearchTextColumn, build_search_text
+
+# 실시간 tailing처럼 append/trim_head를 반복해도 SearchTextColumn이 원본을 새로 만든 검색 텍스트와 같은지 확인합니다.
+# (여유 용량이 다 차서 배열을 옮기는 경우와, 이미 내준 텍스트가 이후 append/trim_head로 바뀌지 않는지도 봅니다)
+# 사용법: python verify_search_text.py
+
+rng = np.random.default_rng(7)
+
+
+def make_rows(start, count):
+    return pd.DataFrame(
+        {
+            "DeviceID": [f"DEV{i % 13}" for i in range(start, start + count)],
+            "AsciiData": [f"Carrier CNV{i:05d} moved" for i in range(start, start + count)],
+            "LevelID": rng.integers(0, 5, count),
+        }
+    )
+
+
+frame = make_rows(0, 3000)
+column = SearchTextColumn()
+column.get(frame)
+next_row = len(frame)
+for tick in range(400):
+    chunk = make_rows(next_row, int(rng.integers(1, 300)))
+    next_row += len(chunk)
+    earlier = column.get(frame)
+    earlier_values = earlier.tolist()
+
+    frame = pd.concat([frame, chunk], ignore_index=True)
+    column.append(chunk)
+    evicted = int(rng.integers(0, 300))
+    frame = frame.iloc[evicted:].reset_index(drop=True)
+    column.trim_head(evicted)
+
+    assert len(column) == len(frame), tick
+    assert column.get(frame).tolist() == build_search_text(frame).tolist(), tick
+    assert earlier.tolist() == earlier_values, tick
+    needle = f"cnv{next_row - 50:05d}"
+    assert np.array_equal(column.contains(frame, needle), build_search_text(frame).str.contains(needle, regex=False).to_numpy())
+
+print(f"{len(frame)} rows after 400 ticks")
+print("Verification Successful!")
@@ -0,0 +1,37 @@
+import os
+import sys
+
+from PySide6.QtWidgets import QApplication
+
+from app_controller import AppController
+from utils.query_language import QuerySyntaxError, parse_query
+from utils.time_index import to_epoch_ms
+
+# 시간 조건 값이 비어 있거나 해석할 수 없으면 필터가 조용히 풀리지 않고 QuerySyntaxError로 알리는지,
+# 숫자만 있는 값은 날짜로, "ms" 접미사나 NumericalTimeStamp 컬럼의 값은 epoch ms로 읽는지 확인합니다.
+# 사용법: QT_QPA_PLATFORM=offscreen python verify_time_values.py [로그 파일]
+
+LOG_FILE = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(os.path.abspath(__file__)), "realLog.csv")
+
+for text in ['before:""', "after:garbage", "time:..2024-01-01", "ts>=yesterday"]:
+    try:
+        parse_query(text)
+    except QuerySyntaxError as e:
+        print(f"{text:<22} rejected: {e}")
+    else:
+        raise AssertionError(f"{text} should be rejected")
+
+assert to_epoch_ms("20240101") == to_epoch_ms("2024-01-01")
+assert to_epoch_ms("1735689600000ms") == 1735689600000
+assert to_epoch_ms("1735689600000", digits_are_epoch=True) == 1735689600000
+
+app = QApplication.instance() or QApplication([])
+controller = AppController("file")
+controller.load_log_file(LOG_FILE)
+first = int(controller.time_index.timestamps[controller.time_index.positions()].min())
+total = len(controller.original_data)
+for text in [f"after:{first}ms", f"ts>{first}"]:
+    rows = len(controller._get_filter_positions(parse_query(text)))
+    print(f"{text:<22} {rows} of {total} rows")
+    assert 0 < rows < total, text
+print("Verification Successful!")
@@ -1,5 +1,7 @@
-import json
 import re
+import time
+
+import numpy as np
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -9,52 +11,419 @@ from PySide6.QtWidgets import (
     QMenu,
     QMessageBox,
     QInputDialog,
+    QApplication,
 )
-from PySide6.QtCore import Qt, Signal, QSortFilterProxyModel
+from PySide6.QtCore import Qt, Signal, QAbstractProxyModel, QModelIndex, QTimer
 from PySide6.QtGui import QAction
 from models.LogTableModel import LogTableModel
+from utils.detail_renderer import (
+    MAX_DETAIL_CHARS,
+    MAX_DETAIL_LINES,
+    DetailTextCache,
+    is_large_body,
+    render_detail,
+)
+from utils.detail_worker import DetailRenderWorker
+from utils.filter_worker import FilterWorker
+from utils.query_language import QuerySyntaxError, check_columns, compile_query, looks_like_query
+
+# 필터 입력이 멈춘 뒤 검색을 시작하기까지의 대기 시간(ms)
+FILTER_DEBOUNCE_MS = 150
+
 
+class CustomFilterProxyModel(QAbstractProxyModel):
+    """
+    전체 컬럼에서 검색하는 커스텀 프록시 모델.
 
-class CustomFilterProxyModel(QSortFilterProxyModel):
-    """전체 컬럼에서 검색하는 커스텀 프록시 모델"""
+    필터를 바꿀 때 소스 모델 전체를 한 번의 벡터 연산으로 평가해 통과한 소스 행 번호 배열(_source_rows)을 만들고,
+    mapToSource/mapFromSource는 이 배열(과 역배열)을 읽는 O(1) 연산입니다.
+    소스에 행이 append되면 새 행만 평가하고, 앞쪽 행이 제거되면 배열만 조정합니다.
+
+    정렬은 셀 문자열을 data()로 비교하지 않고, 소스 모델의 sort_order()가 네이티브 타입 키로 만든
+    행 순서 배열을 _source_rows에 적용합니다. (정렬 중에는 행 추가/제거 시 순서를 다시 계산합니다)
+    """
     def __init__(self):
         super().__init__()
         self.filter_text = ""
         self.case_sensitive = False
-    
+        # 텍스트 쿼리(예: cat:Com AND dev:J1FCNV*)로 필터링할 때의 컴파일된 계획
+        self.filter_plan = None
+        # 통과한 소스 행 번호 배열 (None이면 필터 없음: 모든 소스 행을 그대로 표시)
+        self._source_rows = None
+        self._proxy_rows = None  # 소스 행 -> 프록시 행 역배열 (mapFromSource용, 필요할 때 생성)
+        self._row_count = 0
+        self._pending_removal = None
+        self._connections = []
+        # 정렬 키 [(소스 컬럼 번호, 오름차순 여부), ...] (앞쪽이 우선, 비어 있으면 소스 순서)
+        self._sort_keys = []
+
+    # --- 소스 모델 연결 ---
+    def setSourceModel(self, source_model):
+        self.beginResetModel()
+        old_model = self.sourceModel()
+        if old_model is not None:
+            for signal, slot in self._connections:
+                signal.disconnect(slot)
+        self._connections = []
+        super().setSourceModel(source_model)
+        if source_model is not None:
+            self._connections = [
+                (source_model.modelAboutToBeReset, self.beginResetModel),
+                (source_model.modelReset, self._on_source_reset),
+                (source_model.rowsInserted, self._on_rows_inserted),
+                (source_model.rowsAboutToBeRemoved, self._on_rows_about_to_be_removed),
+                (source_model.rowsRemoved, self._on_rows_removed),
+                (source_model.layoutAboutToBeChanged, self.beginResetModel),
+                (source_model.layoutChanged, self._on_source_reset),
+                (source_model.dataChanged, self._on_data_changed),
+                (source_model.headerDataChanged, self.headerDataChanged),
+            ]
+            for signal, slot in self._connections:
+                signal.connect(slot)
+        self._refilter()
+        self.endResetModel()
+
+    def _source_row_count(self):
+        source_model = self.sourceModel()
+        return source_model.rowCount() if source_model is not None else 0
+
+    def _on_source_reset(self):
+        self._refilter()
+        self.endResetModel()
+
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        if self._source_rows is None:
+            self.dataChanged.emit(
+                self.index(top_left.row(), top_left.column()),
+                self.index(bottom_right.row(), bottom_right.column()),
+                roles,
+            )
+            return
+        # 값이 바뀌면 필터 통과 여부도 바뀔 수 있으므로 다시 평가합니다.
+        self.beginResetModel()
+        self._refilter()
+        self.endResetModel()
+
+    def _on_rows_inserted(self, parent, first, last):
+        if parent.isValid():
+            return
+        if self._sort_keys:
+            # 정렬 중에는 새 행이 어디에 들어갈지 알 수 없으므로 순서를 다시 계산합니다.
+            self.beginResetModel()
+            self._refilter()
+            self.endResetModel()
+            return
+        if self._source_rows is None:
+            self.beginInsertRows(QModelIndex(), first, last)
+            self._row_count += last - first + 1
+            self._proxy_rows = None
+            self.endInsertRows()
+            return
+        if last != self._source_row_count() - 1:
+            # 중간 삽입은 전체를 다시 평가합니다. (실시간 append는 항상 끝에 추가됩니다)
+            self.beginResetModel()
+            self._refilter()
+            self.endResetModel()
+            return
+        # append된 행만 평가합니다. (통과한 행이 없어도 소스 행 수는 따라갑니다)
+        self._row_count += last - first + 1
+        new_rows = first + np.flatnonzero(self._match_mask(first, last + 1))
+        if new_rows.size:
+            start = len(self._source_rows)
+            self.beginInsertRows(QModelIndex(), start, start + new_rows.size - 1)
+            self._source_rows = np.concatenate([self._source_rows, new_rows])
+            self._proxy_rows = None
+            self.endInsertRows()
+
+    def _on_rows_about_to_be_removed(self, parent, first, last):
+        if parent.isValid():
+            return
+        if self._sort_keys:
+            self._pending_removal = (first, last, None, None)
+            self.beginResetModel()
+            return
+        if self._source_rows is None:
+            lo, hi = first, last + 1
+        else:
+            lo = int(np.searchsorted(self._source_rows, first, side="left"))
+            hi = int(np.searchsorted(self._source_rows, last, side="right"))
+        self._pending_removal = (first, last, lo, hi)
+        if hi > lo:
+            self.beginRemoveRows(QModelIndex(), lo, hi - 1)
+
+    def _on_rows_removed(self, parent, first, last):
+        if parent.isValid() or self._pending_removal is None:
+            return
+        _, _, lo, hi = self._pending_removal
+        self._pending_removal = None
+        if lo is None:
+            self._refilter()
+            self.endResetModel()
+            return
+        removed = last - first + 1
+        self._row_count -= removed
+        if self._source_rows is not None:
+            rows = np.concatenate([self._source_rows[:lo], self._source_rows[hi:]])
+            rows[lo:] -= removed
+            self._source_rows = rows
+        self._proxy_rows = None
+        if hi > lo:
+            self.endRemoveRows()
+
+    # --- 필터 ---
     def set_filter_text(self, text, case_sensitive=False):
         """전체 컬럼에서 검색할 텍스트 설정"""
         self.filter_text = text
         self.case_sensitive = case_sensitive
+        self.filter_plan = None
         self.invalidateFilter()  # 필터 재적용
-    
-    def filterAcceptsRow(self, source_row, source_parent):
-        """각 행이 필터를 통과하는지 확인 - 모든 컬럼에서 검색"""
-        if not self.filter_text:
-            return True
-        
+
+    def set_filter_query(self, text, plan):
+        """컴파일된 텍스트 쿼리 계획으로 필터링합니다."""
+        self.filter_text = text
+        self.case_sensitive = False
+        self.filter_plan = plan
+        self.invalidateFilter()
+
+    def apply_filter_result(self, text, case_sensitive, plan, rows, token):
+        """
+        백그라운드에서 계산한 필터 결과(스냅샷 기준 소스 행 번호 배열)를 한 번에 적용합니다.
+        스냅샷 이후 원형 버퍼에서 밀려난 행은 번호를 보정하고, 그 뒤 append된 행만 여기서 평가합니다.
+        소스가 통째로 바뀌었으면 적용하지 않고 False를 반환합니다. (호출한 쪽에서 다시 검색)
+        """
+        source_model = self.sourceModel()
+        reset_version, evicted_total, row_count = token
+        if source_model is None or getattr(source_model, "reset_version", None) != reset_version:
+            return False
+        shift = source_model.evicted_total - evicted_total
+        rows = np.asarray(rows, dtype=np.int64)
+        rows = rows[rows >= shift] - shift
+
+        self.beginResetModel()
+        self.filter_text = text
+        self.case_sensitive = case_sensitive
+        self.filter_plan = plan
+        self._row_count = self._source_row_count()
+        self._proxy_rows = None
+        self._pending_removal = None
+        if not text:
+            rows = None
+        else:
+            tail_start = max(row_count - shift, 0)
+            if tail_start < self._row_count:
+                tail = tail_start + np.flatnonzero(self._match_mask(tail_start, self._row_count))
+                rows = np.concatenate([rows, tail])
+        self._source_rows = self._apply_sort(rows)
+        self.endResetModel()
+        return True
+
+    def setFilterFixedString(self, text):
+        """QSortFilterProxyModel 호환: 대소문자 무시 전체 컬럼 검색"""
+        self.set_filter_text(text, case_sensitive=False)
+
+    def invalidateFilter(self):
+        self.beginResetModel()
+        self._refilter()
+        self.endResetModel()
+
+    def _refilter(self):
+        self._row_count = self._source_row_count()
+        self._proxy_rows = None
+        self._pending_removal = None
+        if self.sourceModel() is None:
+            self._source_rows = None
+            return
+        rows = None
+        if self.filter_text:
+            rows = np.flatnonzero(self._match_mask(0, self._row_count))
+        self._source_rows = self._apply_sort(rows)
+
+    # --- 정렬 ---
+    def sort_keys(self):
+        return list(self._sort_keys)
+
+    def set_sort_keys(self, sort_keys):
+        """[(소스 컬럼 번호, 오름차순 여부), ...] (앞쪽이 우선)로 정렬합니다. 빈 목록이면 소스 순서로 되돌립니다."""
+        self.beginResetModel()
+        self._sort_keys = [(int(column), bool(ascending)) for column, ascending in sort_keys]
+        # 필터 결과는 그대로이므로 다시 검색하지 않고 통과한 행의 순서만 바꿉니다.
+        rows = None
+        if self.filter_text and self._source_rows is not None:
+            rows = np.sort(self._source_rows)
+        self._proxy_rows = None
+        self._source_rows = self._apply_sort(rows)
+        self.endResetModel()
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, max(self.columnCount() - 1, 0))
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """QAbstractItemModel 호환: 한 컬럼으로 정렬합니다. (column < 0이면 정렬 해제)"""
+        if column < 0:
+            self.set_sort_keys([])
+        else:
+            self.set_sort_keys([(column, order == Qt.SortOrder.AscendingOrder)])
+
+    def _apply_sort(self, rows):
+        """
+        필터를 통과한 소스 행 배열(rows, None이면 전체)을 현재 정렬 키의 순서로 바꿉니다.
+        전체 순서 배열에서 통과한 행만 골라내므로 정렬 결과는 필터와 관계없이 캐시됩니다.
+        """
+        # 소스의 컬럼 구성이 바뀌어 없어진 컬럼의 정렬 키는 버립니다.
+        column_count = self.columnCount()
+        self._sort_keys = [key for key in self._sort_keys if key[0] < column_count]
+        if not self._sort_keys:
+            return rows
+        order = self._sort_order()
+        if rows is None:
+            return order
+        accepted = np.zeros(self._source_row_count(), dtype=bool)
+        accepted[rows] = True
+        return order[accepted[order]]
+
+    def _sort_order(self):
+        source_model = self.sourceModel()
+        if hasattr(source_model, "sort_order"):
+            return np.asarray(source_model.sort_order(self._sort_keys), dtype=np.int64)
+
+        # 정렬 API가 없는 일반 모델: 표시 문자열을 모아 한 번에 정렬합니다.
+        lex_keys = []
+        for column, ascending in reversed(self._sort_keys):
+            values = np.array(
+                [
+                    str(source_model.data(source_model.index(row, column)) or "")
+                    for row in range(self._row_count)
+                ],
+                dtype=object,
+            )
+            _, codes = np.unique(values, return_inverse=True)
+            lex_keys.append(codes if ascending else -codes)
+        return np.lexsort(lex_keys)
+
+    def _match_mask(self, start, stop):
+        """소스 행 [start, stop)이 필터를 통과하는지를 한 번의 벡터 연산으로 평가합니다."""
         source_model = self.sourceModel()
+        if self.filter_plan is not None and hasattr(source_model, "evaluate_query"):
+            return np.asarray(
+                source_model.evaluate_query(self.filter_plan, start, stop), dtype=bool
+            )
+        if hasattr(source_model, "search_all_columns"):
+            return np.asarray(
+                source_model.search_all_columns(
+                    self.filter_text, self.case_sensitive, start, stop
+                ),
+                dtype=bool,
+            )
+
+        # 검색 API가 없는 일반 모델: 모든 컬럼을 순회하면서 검색 텍스트 찾기
+        needle = self.filter_text if self.case_sensitive else self.filter_text.lower()
+        mask = np.zeros(stop - start, dtype=bool)
         col_count = source_model.columnCount()
-        
-        # 모든 컬럼을 순회하면서 검색 텍스트 찾기
-        for col in range(col_count):
-            index = source_model.index(source_row, col)
-            data = source_model.data(index, Qt.ItemDataRole.DisplayRole)
-            
-            if data:
-                data_str = str(data)
-                if self.case_sensitive:
-                    if self.filter_text in data_str:
-                        return True
-                else:
-                    if self.filter_text.lower() in data_str.lower():
-                        return True
-        
-        return False
+        for offset, source_row in enumerate(range(start, stop)):
+            for col in range(col_count):
+                data = source_model.data(
+                    source_model.index(source_row, col), Qt.ItemDataRole.DisplayRole
+                )
+                if data:
+                    data_str = str(data) if self.case_sensitive else str(data).lower()
+                    if needle in data_str:
+                        mask[offset] = True
+                        break
+        return mask
+
+    def is_identity(self):
+        """필터도 정렬도 없어 소스 행을 그대로 보여 주는지 여부"""
+        return self._source_rows is None
+
+    def source_rows(self):
+        """표시 중인 행들의 소스 행 번호 배열 (프록시 행 순서)"""
+        if self._source_rows is None:
+            return np.arange(self._row_count, dtype=np.int64)
+        return self._source_rows
+
+    # --- QAbstractProxyModel 구현 ---
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        if self._source_rows is None:
+            return self._row_count
+        return len(self._source_rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        source_model = self.sourceModel()
+        if parent.isValid() or source_model is None:
+            return 0
+        return source_model.columnCount()
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < self.rowCount()) or not (
+            0 <= column < self.columnCount()
+        ):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def hasChildren(self, parent=QModelIndex()):
+        return not parent.isValid() and self.rowCount() > 0
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid() or self.sourceModel() is None:
+            return QModelIndex()
+        row = proxy_index.row()
+        if self._source_rows is not None:
+            if row >= len(self._source_rows):
+                return QModelIndex()
+            row = int(self._source_rows[row])
+        return self.sourceModel().index(row, proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        row = source_index.row()
+        if self._source_rows is not None:
+            if self._proxy_rows is None:
+                self._proxy_rows = np.full(self._source_row_count(), -1, dtype=np.int64)
+                self._proxy_rows[self._source_rows] = np.arange(len(self._source_rows))
+            if row >= len(self._proxy_rows) or self._proxy_rows[row] < 0:
+                return QModelIndex()
+            row = int(self._proxy_rows[row])
+        return self.index(row, source_index.column())
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        source_index = self.mapToSource(index)
+        if not source_index.isValid():
+            return None
+        return self.sourceModel().data(source_index, role)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        source_model = self.sourceModel()
+        if source_model is None:
+            return None
+        if orientation == Qt.Orientation.Vertical and self._source_rows is not None:
+            if not (0 <= section < len(self._source_rows)):
+                return None
+            section = int(self._source_rows[section])
+        value = source_model.headerData(section, orientation, role)
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+            and len(self._sort_keys) > 1
+        ):
+            # 여러 컬럼으로 정렬 중이면 우선순위를 헤더에 표시합니다. (예: "Category ▲1")
+            for priority, (column, ascending) in enumerate(self._sort_keys, start=1):
+                if column == section:
+                    return f"{value} {'▲' if ascending else '▼'}{priority}"
+        return value
 
 
 class BaseLogViewerWidget(QWidget):
     trace_requested = Signal(str, str)  # (trace_id, additional_filter)
+    # 추적 창 등에서 선택한 로그를 메인 뷰에서 보여 달라는 요청 (로그 행 고유 번호)
+    locate_requested = Signal(object)
+    # 렌더링한 상세 텍스트 캐시 (메인 뷰와 추적 창이 같은 본문 객체를 공유하므로 함께 사용)
+    _detail_cache = DetailTextCache()
+    # 필터 입력에 대한 검색이 끝났을 때 (검색어, 일치한 행 수, 걸린 시간(초))
+    filter_finished = Signal(str, int, float)
 
     def __init__(self, controller, model=None, parent=None):
         super().__init__(parent)
@@ -71,6 +440,21 @@ class BaseLogViewerWidget(QWidget):
         # 프록시 모델의 소스를 self.log_table_model로 설정합니다.
         self.proxy_model.setSourceModel(self.log_table_model)
 
+        # 필터 입력은 잠시 멈춘 뒤(debounce) 백그라운드에서 검색하고, 최신 요청의 결과만 적용합니다.
+        self._pending_filter = ""
+        self._filter_generation = 0
+        self._filter_worker = None
+        self._filter_request = None  # (generation, 검색어, 쿼리 계획, 스냅샷 토큰)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._start_filter)
+
+        # 상세 보기: 표시 중인 본문과 잘림 여부, 백그라운드 렌더링 요청 번호
+        self._detail_body = None
+        self._detail_truncated = False
+        self._detail_generation = 0
+
         self._init_ui()
 
     def _init_ui(self):
@@ -92,19 +476,123 @@ class BaseLogViewerWidget(QWidget):
 
         main_layout.addWidget(self.splitter)
 
+        # 헤더 클릭: 오름차순 -> 내림차순 -> 정렬 해제, Shift+클릭: 정렬 키 추가 (여러 컬럼 정렬)
+        header = self.tableView.horizontalHeader()
+        header.setSectionsClickable(True)
+        header.sectionClicked.connect(self._on_header_clicked)
+
         self.tableView.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.tableView.customContextMenuRequested.connect(self.show_table_context_menu)
         self.tableView.selectionModel().selectionChanged.connect(
             self.update_detail_view
         )
 
+    def _on_header_clicked(self, column):
+        keys = self.proxy_model.sort_keys()
+        existing = next((i for i, key in enumerate(keys) if key[0] == column), None)
+        if QApplication.keyboardModifiers() & Qt.KeyboardModifier.ShiftModifier:
+            if existing is None:
+                keys.append((column, True))
+            elif keys[existing][1]:
+                keys[existing] = (column, False)
+            else:
+                del keys[existing]
+        elif existing is not None and len(keys) == 1:
+            keys = [(column, False)] if keys[0][1] else []
+        else:
+            keys = [(column, True)]
+        self.sort_by(keys)
+
+    def sort_by(self, sort_keys):
+        """[(컬럼 번호, 오름차순 여부), ...] 순서로 로그 테이블을 정렬합니다. (빈 목록이면 정렬 해제)"""
+        self.proxy_model.set_sort_keys(sort_keys)
+        header = self.tableView.horizontalHeader()
+        keys = self.proxy_model.sort_keys()
+        header.setSortIndicatorShown(bool(keys))
+        if keys:
+            column, ascending = keys[0]
+            header.setSortIndicator(
+                column,
+                Qt.SortOrder.AscendingOrder if ascending else Qt.SortOrder.DescendingOrder,
+            )
+
     def set_filter_key_column(self, column_index):
         # 커스텀 프록시에서는 이 설정이 무시됩니다 (전체 컬럼 검색)
         pass
 
     def set_filter_fixed_string(self, pattern):
-        """전체 컬럼에서 대소문자 무시 검색"""
-        self.proxy_model.set_filter_text(pattern, case_sensitive=False)
+        """
+        전체 컬럼에서 대소문자 무시 검색. 입력이 텍스트 쿼리 문법(예: cat:Com AND dev:J1FCNV*)이면
+        컴파일된 쿼리로 필터링하고, 해석할 수 없으면 일반 검색어로 취급합니다.
+        입력이 잠시 멈추면 백그라운드에서 검색하며, 그 사이 들어온 이전 요청의 결과는 버립니다.
+        """
+        self._pending_filter = pattern
+        self._filter_generation += 1
+        if self._filter_worker is not None:
+            self._filter_worker.cancel()
+            self._filter_worker = None
+        self._filter_timer.start()
+
+    def _parse_filter(self, pattern):
+        """검색어가 텍스트 쿼리이면 컴파일된 계획을, 아니면 None을 반환합니다."""
+        columns = (
+            self.log_table_model.column_names()
+            if hasattr(self.log_table_model, "column_names")
+            else []
+        )
+        if hasattr(self.log_table_model, "evaluate_query") and looks_like_query(
+            pattern, columns
+        ):
+            try:
+                plan = compile_query(pattern)
+                if columns:
+                    # 없는 컬럼을 가리키면 (고급 필터와 같이) 쿼리로 보지 않고 일반 검색어로 찾습니다.
+                    check_columns(plan.tree, columns)
+                return plan
+            except QuerySyntaxError:
+                pass
+        return None
+
+    def _start_filter(self):
+        pattern = self._pending_filter
+        generation = self._filter_generation
+        plan = self._parse_filter(pattern)
+        model = self.proxy_model.sourceModel()
+
+        if not pattern or not hasattr(model, "make_match_job"):
+            # 검색어를 지우는 경우(또는 검색 API가 없는 모델)는 바로 적용합니다.
+            started = time.perf_counter()
+            if plan is not None:
+                self.proxy_model.set_filter_query(pattern, plan)
+            else:
+                self.proxy_model.set_filter_text(pattern, case_sensitive=False)
+            self.filter_finished.emit(
+                pattern, self.proxy_model.rowCount(), time.perf_counter() - started
+            )
+            return
+
+        job, token = model.make_match_job(pattern, False, plan)
+        self._filter_request = (generation, pattern, plan, token)
+        worker = FilterWorker(generation, job)
+        worker.result_ready.connect(self._on_filter_result)
+        worker.error.connect(self._on_filter_error)
+        self._filter_worker = worker
+        worker.start()
+
+    def _on_filter_result(self, generation, rows, elapsed):
+        if generation != self._filter_generation or self._filter_request is None:
+            return  # 더 최근 입력이 있었으므로 오래된 결과는 버립니다.
+        _, pattern, plan, token = self._filter_request
+        self._filter_worker = None
+        if not self.proxy_model.apply_filter_result(pattern, False, plan, rows, token):
+            # 검색하는 동안 데이터가 통째로 바뀌었으면 다시 검색합니다.
+            self._start_filter()
+            return
+        self.filter_finished.emit(pattern, self.proxy_model.rowCount(), elapsed)
+
+    def _on_filter_error(self, generation, message):
+        if generation == self._filter_generation:
+            print(f"Filter error: {message}")
 
     def show_table_context_menu(self, pos):
         # ... (이전과 동일)
@@ -118,6 +606,14 @@ class BaseLogViewerWidget(QWidget):
             show_detail_action.triggered.connect(self.show_detail_pane)
             menu.addAction(show_detail_action)
 
+            if self.log_table_model is not self.controller.source_model:
+                row_id = int(self.log_table_model.row_ids([source_index.row()])[0])
+                locate_action = QAction("메인 뷰에서 보기", self)
+                locate_action.triggered.connect(
+                    lambda: self.locate_requested.emit(row_id)
+                )
+                menu.addAction(locate_action)
+
             tracking_id = self.log_table_model.get_data_by_col_name(
                 source_index.row(), "TrackingID"
             )
@@ -158,6 +654,10 @@ class BaseLogViewerWidget(QWidget):
         if self.detail_view.isVisible():
             if menu.actions() and not menu.actions()[-1].isSeparator():
                 menu.addSeparator()
+            if self._detail_truncated:
+                full_detail_action = QAction("상세 로그 전체 보기", self)
+                full_detail_action.triggered.connect(self.show_full_detail)
+                menu.addAction(full_detail_action)
             hide_detail_action = QAction("원복", self)
             hide_detail_action.triggered.connect(self.hide_detail_pane)
             menu.addAction(hide_detail_action)
@@ -165,7 +665,6 @@ class BaseLogViewerWidget(QWidget):
         if menu.actions():
             menu.exec(self.tableView.viewport().mapToGlobal(pos))
 
-    # 💥💥💥 수정된 부분 💥💥💥
     def _display_log_detail(self, source_index):
         """선택된 로그의 상세 정보를 포맷에 맞게 detail_view에 표시합니다."""
         if not self.log_table_model:
@@ -180,49 +679,70 @@ class BaseLogViewerWidget(QWidget):
                 display_object = self.log_table_model.get_data_by_col_name(
                     source_index.row(), "AsciiData"
                 )
-
-            if display_object:
-                # JSON 객체일 경우
-                if isinstance(display_object, dict):
-                    formatted_text = json.dumps(
-                        display_object, indent=4, ensure_ascii=False
-                    )
-                    self.detail_view.setText(formatted_text)
-                # SECS/GEM 메시지 (리스트)일 경우
-                elif isinstance(display_object, list):
-                    # 재귀적으로 SECS 객체를 포맷팅하는 내부 함수
-                    def format_secs_obj(obj, indent=0):
-                        lines = []
-                        indent_str = "    " * indent
-                        for item in obj:
-                            # SimpleNamespace 객체인지 확인
-                            if hasattr(item, "type") and hasattr(item, "value"):
-                                if item.type == "L":
-                                    lines.append(f"{indent_str}<L [{len(item.value)}]>")
-                                    # 리스트 값에 대해 재귀 호출
-                                    lines.extend(
-                                        format_secs_obj(item.value, indent + 1)
-                                    )
-                                else:
-                                    lines.append(
-                                        f"{indent_str}<{item.type} '{item.value}'>"
-                                    )
-                        return lines
-
-                    formatted_text = "\n".join(format_secs_obj(display_object))
-                    self.detail_view.setText(formatted_text)
-                # 그 외 (일반 텍스트)
-                else:
-                    self.detail_view.setText(str(display_object))
-            else:
-                self.detail_view.setText("")  # 표시할 내용이 없으면 비움
+            self._render_detail(display_object if display_object else None)
 
         except Exception as e:
-            self.detail_view.setText(
+            self.detail_view.setPlainText(
                 f"상세 정보를 표시하는 중 오류가 발생했습니다:\n{e}"
             )
             print(f"Error displaying detail: {e}")
 
+    def _render_detail(self, body, full=False):
+        """
+        본문(JSON 객체, SECS 메시지 리스트, 일반 텍스트)을 상세 보기에 표시합니다.
+        렌더링 결과는 캐시하고, 긴 본문은 앞부분(MAX_DETAIL_LINES줄)만 표시하며,
+        항목이 아주 많은 본문은 백그라운드에서 포맷합니다.
+        """
+        self._detail_generation += 1
+        self._detail_body = body
+        self._detail_truncated = False
+        if body is None:
+            self.detail_view.clear()  # 표시할 내용이 없으면 비움
+            return
+        if isinstance(body, str) and len(body) <= MAX_DETAIL_CHARS:
+            self.detail_view.setPlainText(body)
+            return
+
+        cached = self._detail_cache.get(body, full)
+        if cached is not None:
+            self._show_detail_text(*cached)
+            return
+
+        max_lines = None if full else MAX_DETAIL_LINES
+        if isinstance(body, (dict, list)) and is_large_body(body):
+            self.detail_view.setPlainText("Formatting...")
+            worker = DetailRenderWorker(self._detail_generation, body, full, max_lines)
+            worker.result_ready.connect(self._on_detail_rendered)
+            worker.error.connect(self._on_detail_error)
+            worker.start()
+            return
+
+        text, truncated = render_detail(body, max_lines)
+        self._detail_cache.put(body, full, text, truncated)
+        self._show_detail_text(text, truncated)
+
+    def _show_detail_text(self, text, truncated):
+        self._detail_truncated = truncated
+        if truncated:
+            text += "\n\n... (우클릭 > '상세 로그 전체 보기'로 나머지를 볼 수 있습니다)"
+        self.detail_view.setPlainText(text)
+
+    def _on_detail_rendered(self, generation, body, full, text, truncated):
+        self._detail_cache.put(body, full, text, truncated)
+        if generation == self._detail_generation:
+            self._show_detail_text(text, truncated)
+
+    def _on_detail_error(self, generation, message):
+        if generation == self._detail_generation:
+            self.detail_view.setPlainText(
+                f"상세 정보를 표시하는 중 오류가 발생했습니다:\n{message}"
+            )
+
+    def show_full_detail(self):
+        """잘려서 표시된 본문을 끝까지 렌더링합니다."""
+        if self._detail_body is not None:
+            self._render_detail(self._detail_body, full=True)
+
     def show_detail_pane(self):
         # ... (이전과 동일)
         selected_indexes = self.tableView.selectedIndexes()